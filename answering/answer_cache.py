@@ -0,0 +1,159 @@
+"""
+SmartChunk-RAG — Answer Cache
+
+Two-tier cache in front of the evidence-mode LLM call:
+- Exact tier    → normalized query text (blake2b digest), plus a digest
+                  of the injected conversation context when there is one
+- Semantic tier → cosine similarity of normalized query embeddings
+                  (context-free queries only: two follow-ups can embed
+                  alike while depending on different earlier turns)
+
+Every hit is gated on evidence: the cached answer is served only when
+the chunk IDs it was grounded on overlap (Jaccard) with the chunks
+retrieved for the current query. Retrieval therefore still runs, but
+prompt building and LLM decoding are skipped on a hit.
+"""
+
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+class AnswerCache:
+
+    def __init__(
+        self,
+        max_size: int = 512,
+        similarity_threshold: float = 0.97,
+        min_evidence_overlap: float = 0.8
+    ):
+        self.max_size = max_size
+        self.similarity_threshold = similarity_threshold
+        self.min_evidence_overlap = min_evidence_overlap
+
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Stacked embeddings of cached entries, rebuilt lazily after writes.
+        self._matrix: Optional[np.ndarray] = None
+        self._matrix_keys: List[str] = []
+
+    # ============================================================
+    # PUBLIC API
+    # ============================================================
+
+    def lookup(
+        self,
+        query: str,
+        query_embedding: Optional[np.ndarray],
+        evidence_ids: Iterable[str],
+        context: Optional[str] = None
+    ) -> Optional[Dict]:
+
+        evidence = frozenset(evidence_ids)
+        if not evidence:
+            return None
+
+        key = self._key(query, context)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._evidence_matches(entry, evidence):
+                self._entries.move_to_end(key)
+                return copy.deepcopy(entry["response"])
+
+            if context is not None or query_embedding is None:
+                return None
+
+            matrix = self._get_matrix()
+            if matrix is None:
+                return None
+
+            scores = matrix @ np.asarray(query_embedding, dtype=np.float32).ravel()
+            best = int(scores.argmax())
+
+            if scores[best] < self.similarity_threshold:
+                return None
+
+            best_key = self._matrix_keys[best]
+            entry = self._entries[best_key]
+            if not self._evidence_matches(entry, evidence):
+                return None
+
+            self._entries.move_to_end(best_key)
+            return copy.deepcopy(entry["response"])
+
+    def store(
+        self,
+        query: str,
+        query_embedding: Optional[np.ndarray],
+        evidence_ids: Iterable[str],
+        response: Dict,
+        context: Optional[str] = None
+    ) -> None:
+
+        evidence = frozenset(evidence_ids)
+        if not evidence:
+            return
+
+        key = self._key(query, context)
+
+        # Context-bound entries are reachable through the exact tier only.
+        embedding = None
+        if context is None and query_embedding is not None:
+            embedding = np.asarray(query_embedding, dtype=np.float32).ravel()
+
+        with self._lock:
+            self._entries[key] = {
+                "embedding": embedding,
+                "evidence": evidence,
+                "response": copy.deepcopy(response),
+            }
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+            self._matrix = None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._matrix = None
+            self._matrix_keys = []
+
+    # ============================================================
+    # INTERNAL
+    # ============================================================
+
+    def _key(self, query: str, context: Optional[str] = None) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(" ".join(query.strip().lower().split()).encode("utf-8"))
+        if context is not None:
+            digest.update(b"\x00")
+            digest.update(context.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _get_matrix(self) -> Optional[np.ndarray]:
+        if self._matrix is None:
+            self._matrix_keys = [
+                k for k, entry in self._entries.items()
+                if entry["embedding"] is not None
+            ]
+            if not self._matrix_keys:
+                return None
+            self._matrix = np.stack(
+                [self._entries[k]["embedding"] for k in self._matrix_keys]
+            )
+        return self._matrix
+
+    def _evidence_matches(self, entry: Dict, evidence: frozenset) -> bool:
+        cached = entry["evidence"]
+        union = len(cached | evidence)
+        if not union:
+            return False
+        return len(cached & evidence) / union >= self.min_evidence_overlap
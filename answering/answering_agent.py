@@ -6,37 +6,66 @@ This agent:
 - Performs hybrid retrieval for medical/book queries
 - Supports companion mode for normal conversation
 - Builds grounded prompts
-- Calls LLM
+- Calls LLM (Ollama, or an OpenAI-compatible server such as vLLM)
+- Exposes answer_async() for asyncio callers and answer_stream() for token streaming
 - Formats response
 - Adds citations for evidence-mode answers
 """
 
+import asyncio
+import json
 import os
-import requests
-from typing import Dict, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional
 
 from retriever.orchestrator import RetrieverOrchestrator
 from answering.intent_router import IntentRouter
+from answering.answer_cache import AnswerCache
+from answering.retrieval_cache import RetrievalCache
 from answering.prompt_builder import PromptBuilder
 from answering.citation_manager import CitationManager
 from answering.response_formatter import ResponseFormatter
+from core.registry.corpus_epoch import get_corpus_epoch
+from core.utils.http_session import get_async_http_client, get_http_session
 from core.utils.logging_utils import get_component_logger
 
 
 logger = get_component_logger("AnsweringAgent", component="answering")
 
 OLLAMA_URL = os.getenv("OLLAMA_URL", "http://localhost:11434/api/generate")
+# "openai" targets an OpenAI-compatible /v1/completions endpoint, e.g.
+# `vllm serve <model> --enable-prefix-caching --block-size 16`, so the
+# stable rules + context prefix of evidence prompts hits the KV cache.
+LLM_BACKEND = os.getenv("LLM_BACKEND", "ollama").lower()
+OPENAI_COMPLETIONS_URL = os.getenv("LLM_OPENAI_URL", "http://localhost:8000/v1/completions")
 DEFAULT_MODEL = os.getenv("OLLAMA_MODEL", "mistral:7b-instruct")
 CHAT_MODEL = os.getenv("OLLAMA_CHAT_MODEL", DEFAULT_MODEL)
 KNOWLEDGE_MODEL = os.getenv("OLLAMA_KNOWLEDGE_MODEL", DEFAULT_MODEL)
 MEDICAL_RERANK_THRESHOLD = float(os.getenv("MEDICAL_RERANK_THRESHOLD", "0.18"))
 BOOK_RERANK_THRESHOLD = float(os.getenv("BOOK_RERANK_THRESHOLD", "0.05"))
+RETRIEVAL_WORKERS = int(os.getenv("ANSWER_RETRIEVAL_WORKERS", "4"))
+ANSWER_CACHE_SIZE = int(os.getenv("ANSWER_CACHE_SIZE", "512"))
+ANSWER_CACHE_SIMILARITY = float(os.getenv("ANSWER_CACHE_SIMILARITY", "0.97"))
+ANSWER_CACHE_MIN_EVIDENCE_OVERLAP = float(os.getenv("ANSWER_CACHE_MIN_EVIDENCE_OVERLAP", "0.8"))
+RETRIEVAL_CACHE_SIZE = int(os.getenv("RETRIEVAL_CACHE_SIZE", "256"))
+RETRIEVAL_CACHE_SIMILARITY = float(os.getenv("RETRIEVAL_CACHE_SIMILARITY", "0.985"))
+RETRIEVAL_CACHE_TTL_SECONDS = float(os.getenv("RETRIEVAL_CACHE_TTL_SECONDS", "600"))
+# Decode budget per intent; decode time is linear in generated tokens.
+NUM_PREDICT_BY_INTENT = {
+    "general": int(os.getenv("LLM_NUM_PREDICT_GENERAL", "150")),
+    "medical": int(os.getenv("LLM_NUM_PREDICT_MEDICAL", "500")),
+    "book": int(os.getenv("LLM_NUM_PREDICT_BOOK", "800")),
+}
+DEFAULT_NUM_PREDICT = 700
 
 _router_instance: Optional[IntentRouter] = None
 _retriever_instance: Optional[RetrieverOrchestrator] = None
 _prompt_builder_instance: Optional[PromptBuilder] = None
 _citation_manager_instance: Optional[CitationManager] = None
 _formatter_instance: Optional[ResponseFormatter] = None
+_answer_cache_instance: Optional[AnswerCache] = None
+_retrieval_cache_instance: Optional[RetrievalCache] = None
+_share_query_embedding: Optional[bool] = None
 
 
 def get_router():
@@ -53,6 +82,20 @@ def get_retriever():
     return _retriever_instance
 
 
+def query_embedding_shareable() -> bool:
+    """
+    Whether router query vectors can stand in for the retriever's own
+    encode (same model and normalization as the Chroma index).
+    """
+    global _share_query_embedding
+    if _share_query_embedding is None:
+        signature = get_router().embedding_signature
+        _share_query_embedding = get_retriever().accepts_query_embedding(signature)
+        if not _share_query_embedding:
+            logger.info("Router embedder %s differs from the index embedder; retriever re-encodes queries", signature)
+    return _share_query_embedding
+
+
 def get_prompt_builder():
     global _prompt_builder_instance
     if _prompt_builder_instance is None:
@@ -74,6 +117,28 @@ def get_formatter():
     return _formatter_instance
 
 
+def get_answer_cache():
+    global _answer_cache_instance
+    if _answer_cache_instance is None:
+        _answer_cache_instance = AnswerCache(
+            max_size=ANSWER_CACHE_SIZE,
+            similarity_threshold=ANSWER_CACHE_SIMILARITY,
+            min_evidence_overlap=ANSWER_CACHE_MIN_EVIDENCE_OVERLAP,
+        )
+    return _answer_cache_instance
+
+
+def get_retrieval_cache():
+    global _retrieval_cache_instance
+    if _retrieval_cache_instance is None:
+        _retrieval_cache_instance = RetrievalCache(
+            max_size=RETRIEVAL_CACHE_SIZE,
+            similarity_threshold=RETRIEVAL_CACHE_SIMILARITY,
+            ttl_seconds=RETRIEVAL_CACHE_TTL_SECONDS,
+        )
+    return _retrieval_cache_instance
+
+
 class AnsweringAgent:
 
     def __init__(self, model: str = DEFAULT_MODEL):
@@ -89,6 +154,12 @@ class AnsweringAgent:
         self.prompt_builder = None
         self.citation_manager = None
         self.formatter = None
+        self.answer_cache = get_answer_cache()
+        self.retrieval_cache = get_retrieval_cache()
+        self._pool = ThreadPoolExecutor(
+            max_workers=RETRIEVAL_WORKERS,
+            thread_name_prefix="answering"
+        )
 
         logger.info("Default model: %s", self.model)
         logger.info("Chat model: %s", self.chat_model)
@@ -100,149 +171,352 @@ class AnsweringAgent:
             return {"response": "", "citations": [], "follow_up": ""}
 
         try:
-            if self.router is None:
-                self.router = get_router()
-            if self.prompt_builder is None:
-                self.prompt_builder = get_prompt_builder()
-            if self.formatter is None:
-                self.formatter = get_formatter()
-
-            # Use clean user query for routing when memory/context has been injected.
-            intent_input = retrieval_query or query
-            intent = self.router.classify(intent_input)
-            logger.info("Intent detected: %s", intent)
-
-            # Companion mode: normal conversation without forced retrieval.
-            if intent == "general":
-                prompt = self.prompt_builder.build_companion(query=query)
-                llm_response = self._call_llm(
-                    prompt=prompt,
-                    model=self.chat_model,
-                    generation_mode="creative_chat",
-                )
-                formatted_response = self.formatter.format(llm_response, intent="general")
-
-                if not formatted_response:
-                    formatted_response = "I'm here with you. Tell me a bit more so I can help properly."
-
-                return {
-                    "response": formatted_response,
-                    "citations": [],
-                    "follow_up": ""
-                }
-
-            # Evidence mode for medical/book intents.
-            if self.retriever is None:
-                self.retriever = get_retriever()
-            if self.citation_manager is None:
-                self.citation_manager = get_citation_manager()
-
-            search_query = retrieval_query or query
-            results = self.retriever.retrieve(
-                query=search_query,
-                mode="hybrid",
-                top_k=8,
-                initial_k=25
-            )
+            plan = self._plan(query, retrieval_query)
+            if "result" in plan:
+                return plan["result"]
 
-            if not results:
-                return {
-                    "response": "dont have an answer",
-                    "citations": [],
-                    "follow_up": self._build_follow_up(query, intent)
-                }
-
-            max_rerank_score = max(float(r.get("rerank_score", 0.0) or 0.0) for r in results)
-            rerank_threshold = MEDICAL_RERANK_THRESHOLD if intent == "medical" else BOOK_RERANK_THRESHOLD
-            logger.info(
-                "Rerank gate check | intent=%s max_rerank_score=%.4f threshold=%.4f",
-                intent,
-                max_rerank_score,
-                rerank_threshold,
-            )
-            if max_rerank_score < rerank_threshold:
-                return {
-                    "response": "Dont have an answer",
-                    "citations": [],
-                    "follow_up": self._build_follow_up(query, intent)
-                }
-
-            context_chunks = results[:6]
-
-            prompt = self.prompt_builder.build(
-                query=query,
-                context_chunks=context_chunks,
-                intent=intent
-            )
-
-            llm_response = self._call_llm(prompt)
-            if not llm_response:
-                return {
-                    "response": "Dont have an answer",
-                    "citations": [],
-                    "follow_up": self._build_follow_up(query, intent)
-                }
-
-            formatted_response = self.formatter.format(llm_response, intent=intent)
-            if self._needs_follow_up(formatted_response):
-                return {
-                    "response": "Dont have an answer",
-                    "citations": [],
-                    "follow_up": self._build_follow_up(query, intent)
-                }
-
-            citations = self.citation_manager.build(context_chunks)
-            if not citations:
-                return {
-                    "response": "Dont have an answer",
-                    "citations": [],
-                    "follow_up": self._build_follow_up(query, intent)
-                }
+            llm_response = self._call_llm(**plan["llm"])
+            return self._finish(query, plan, llm_response)
 
+        except Exception:
+            logger.exception("Unhandled exception inside answer()")
             return {
-                "response": formatted_response,
-                "citations": citations,
-                "follow_up": ""
+                "response": "",
+                "citations": [],
+                "follow_up": self._build_follow_up(query, "general")
             }
 
+    async def answer_async(self, query: str, retrieval_query: Optional[str] = None) -> Dict:
+        """
+        Coroutine variant of answer() for async callers.
+
+        The blocking pipeline steps (embedding, retrieval, classification,
+        formatting) run in a worker thread and the LLM call goes through
+        the shared httpx.AsyncClient, so the event loop stays free.
+        """
+        if not query or not query.strip():
+            return {"response": "", "citations": [], "follow_up": ""}
+
+        try:
+            plan = await asyncio.to_thread(self._plan, query, retrieval_query)
+            if "result" in plan:
+                return plan["result"]
+
+            llm_response = await self._call_llm_async(**plan["llm"])
+            return await asyncio.to_thread(self._finish, query, plan, llm_response)
+
         except Exception:
-            logger.exception("Unhandled exception inside answer()")
+            logger.exception("Unhandled exception inside answer_async()")
             return {
                 "response": "",
                 "citations": [],
                 "follow_up": self._build_follow_up(query, "general")
             }
 
-    def _call_llm(self, prompt: str, model: Optional[str] = None, generation_mode: str = "grounded") -> str:
-        selected_model = model or self.knowledge_model or self.model
-        options = {
-            "temperature": 0.1,
-            "top_p": 0.2,
-            "top_k": 30,
-            "repeat_penalty": 1.1,
-            "seed": 42,
-            "num_predict": 700
+    def answer_stream(self, query: str, retrieval_query: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Streaming variant of answer().
+
+        Yields {"type": "token", "text": ...} events as the LLM decodes,
+        then one {"type": "final", "response", "citations", "follow_up"}
+        event carrying the formatted answer. Citations are built on the
+        pool while tokens are still being generated and announced early
+        in a {"type": "citations"} event once ready.
+        """
+        if not query or not query.strip():
+            yield {"type": "final", "response": "", "citations": [], "follow_up": ""}
+            return
+
+        try:
+            plan = self._plan(query, retrieval_query)
+            if "result" in plan:
+                yield {"type": "final", **plan["result"]}
+                return
+
+            # Citations depend only on the retrieved chunks.
+            citations_future = None
+            if "prepared" in plan:
+                citations_future = self._pool.submit(
+                    self.citation_manager.build,
+                    plan["prepared"]["context_chunks"]
+                )
+
+            # Sources go out as soon as they are built, ahead of the
+            # answer text; the final event remains authoritative.
+            citations_sent = citations_future is None
+            parts = []
+            for token in self._stream_llm(**plan["llm"]):
+                if not citations_sent and citations_future.done():
+                    citations_sent = True
+                    yield {"type": "citations", "citations": citations_future.result()}
+                parts.append(token)
+                yield {"type": "token", "text": token}
+
+            citations = citations_future.result() if citations_future is not None else None
+            yield {"type": "final", **self._finish(query, plan, "".join(parts).strip(), citations)}
+
+        except Exception:
+            logger.exception("Unhandled exception inside answer_stream()")
+            yield {
+                "type": "final",
+                "response": "",
+                "citations": [],
+                "follow_up": self._build_follow_up(query, "general")
+            }
+
+    # ============================================================
+    # PIPELINE (shared by answer / answer_async / answer_stream)
+    # ============================================================
+
+    def _plan(self, query: str, retrieval_query: Optional[str]) -> Dict:
+        """
+        Everything before the LLM call.
+
+        Returns {"result": ...} when no LLM call is needed (refusal or
+        answer-cache hit), otherwise {"intent", "llm": kwargs for the LLM
+        call, "prepared": evidence state (evidence mode only)}.
+        """
+        self._load_components()
+        search_query = retrieval_query or query
+
+        # Greetings and cached chit-chat resolve to companion mode on the
+        # clean query alone: no embedding and no retrieval.
+        intent = self.router.prefilter(search_query)
+        if intent == "general":
+            logger.info("Intent detected (prefilter): %s", intent)
+            return self._companion_plan(query)
+
+        # Retrieval does not depend on the intent label, so start it
+        # while the query is classified and discard it for companion mode.
+        search_embedding = self._embed_query(search_query)
+        cached_results = self.retrieval_cache.lookup(search_embedding)
+        if cached_results is not None:
+            logger.info("Retrieval cache hit")
+            results_future = Future()
+            results_future.set_result(cached_results)
+        else:
+            results_future = self._pool.submit(
+                self._retrieve,
+                search_query,
+                search_embedding
+            )
+
+        # Use clean user query for routing when memory/context has been injected.
+        if intent is None:
+            intent = self.router.classify(search_query, q_emb=search_embedding)
+        logger.info("Intent detected: %s", intent)
+
+        # Companion mode: normal conversation without forced retrieval.
+        if intent == "general":
+            return self._companion_plan(query)
+
+        # Evidence mode for medical/book intents.
+        results = results_future.result()
+
+        prepared = self._prepare_evidence(query, intent, results, search_query, search_embedding)
+        if "response" in prepared:
+            return {"result": prepared}
+
+        return {
+            "intent": intent,
+            "llm": {"prompt": prepared["prompt"], "intent": intent},
+            "prepared": prepared,
         }
 
-        if generation_mode == "creative_chat":
-            options = {
-                "temperature": 0.8,
-                "top_p": 0.9,
-                "top_k": 60,
-                "repeat_penalty": 1.05,
-                "num_predict": 700
+    def _companion_plan(self, query: str) -> Dict:
+        return {
+            "intent": "general",
+            "llm": {
+                "prompt": self.prompt_builder.build_companion(query=query),
+                "model": self.chat_model,
+                "generation_mode": "creative_chat",
+                "intent": "general",
+            },
+        }
+
+    def _finish(
+        self,
+        query: str,
+        plan: Dict,
+        llm_response: str,
+        citations: Optional[List[Dict]] = None
+    ) -> Dict:
+        if plan["intent"] == "general":
+            return self._companion_result(llm_response)
+
+        return self._evidence_result(
+            query,
+            plan["intent"],
+            llm_response,
+            plan["prepared"],
+            citations=citations
+        )
+
+    # ============================================================
+    # SHARED PIPELINE STEPS
+    # ============================================================
+
+    def _load_components(self) -> None:
+        if self.router is None:
+            self.router = get_router()
+        if self.prompt_builder is None:
+            self.prompt_builder = get_prompt_builder()
+        if self.formatter is None:
+            self.formatter = get_formatter()
+        if self.retriever is None:
+            self.retriever = get_retriever()
+        if self.citation_manager is None:
+            self.citation_manager = get_citation_manager()
+
+    def _retrieve(self, search_query: str, search_embedding) -> List[Dict]:
+        epoch = get_corpus_epoch()
+        results = self.retriever.retrieve(
+            query=search_query,
+            mode="hybrid",
+            top_k=8,
+            initial_k=25,
+            query_embedding=search_embedding if query_embedding_shareable() else None
+        )
+        self.retrieval_cache.store(search_embedding, results, epoch=epoch)
+        return results
+
+    def _companion_result(self, llm_response: str) -> Dict:
+        formatted_response = self.formatter.format(llm_response, intent="general")
+
+        if not formatted_response:
+            formatted_response = "I'm here with you. Tell me a bit more so I can help properly."
+
+        return {
+            "response": formatted_response,
+            "citations": [],
+            "follow_up": ""
+        }
+
+    def _prepare_evidence(
+        self,
+        query: str,
+        intent: str,
+        results: List[Dict],
+        search_query: str,
+        search_embedding
+    ) -> Dict:
+        """
+        Gate retrieval results and build the grounded prompt.
+
+        Returns a final response dict (refusal or cache hit) or a dict
+        holding the prompt and the state needed by _evidence_result().
+        """
+        if not results:
+            return {
+                "response": "dont have an answer",
+                "citations": [],
+                "follow_up": self._build_follow_up(query, intent)
+            }
+
+        max_rerank_score = max(float(r.get("rerank_score", 0.0) or 0.0) for r in results)
+        rerank_threshold = MEDICAL_RERANK_THRESHOLD if intent == "medical" else BOOK_RERANK_THRESHOLD
+        logger.info(
+            "Rerank gate check | intent=%s max_rerank_score=%.4f threshold=%.4f",
+            intent,
+            max_rerank_score,
+            rerank_threshold,
+        )
+        if max_rerank_score < rerank_threshold:
+            return {
+                "response": "Dont have an answer",
+                "citations": [],
+                "follow_up": self._build_follow_up(query, intent)
             }
 
-        payload = {
-            "model": selected_model,
+        context_chunks = results[:6]
+
+        # Serve a cached answer only if it was grounded on the same evidence.
+        # The cache is keyed on the clean user query; injected memory only
+        # takes part as an exact-match context, never through embeddings.
+        evidence_ids = [c.get("chunk_id") for c in context_chunks if c.get("chunk_id")]
+        cache_key = {
+            "query": search_query,
+            "query_embedding": search_embedding,
+            "context": query if query != search_query else None,
+        }
+        cached = self.answer_cache.lookup(evidence_ids=evidence_ids, **cache_key)
+        if cached is not None:
+            logger.info("Answer cache hit | intent=%s", intent)
+            return cached
+
+        prompt = self.prompt_builder.build(
+            query=query,
+            context_chunks=context_chunks,
+            intent=intent
+        )
+
+        return {
             "prompt": prompt,
-            "stream": False,
-            "options": options
+            "context_chunks": context_chunks,
+            "evidence_ids": evidence_ids,
+            "cache_key": cache_key,
+        }
+
+    def _evidence_result(
+        self,
+        query: str,
+        intent: str,
+        llm_response: str,
+        prepared: Dict,
+        citations: Optional[List[Dict]] = None
+    ) -> Dict:
+        if not llm_response:
+            return {
+                "response": "Dont have an answer",
+                "citations": [],
+                "follow_up": self._build_follow_up(query, intent)
+            }
+
+        formatted_response = self.formatter.format(llm_response, intent=intent)
+        if self._needs_follow_up(formatted_response):
+            return {
+                "response": "Dont have an answer",
+                "citations": [],
+                "follow_up": self._build_follow_up(query, intent)
+            }
+
+        if citations is None:
+            citations = self.citation_manager.build(prepared["context_chunks"])
+        if not citations:
+            return {
+                "response": "Dont have an answer",
+                "citations": [],
+                "follow_up": self._build_follow_up(query, intent)
+            }
+
+        result = {
+            "response": formatted_response,
+            "citations": citations,
+            "follow_up": ""
         }
+        self.answer_cache.store(
+            evidence_ids=prepared["evidence_ids"],
+            response=result,
+            **prepared["cache_key"]
+        )
+        return result
+
+    # ============================================================
+    # LLM CALLS
+    # ============================================================
+
+    def _call_llm(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        generation_mode: str = "grounded",
+        intent: Optional[str] = None
+    ) -> str:
+        selected_model, url, payload = self._build_llm_request(prompt, model, generation_mode, intent)
 
         try:
-            response = requests.post(
-                OLLAMA_URL,
+            response = get_http_session().post(
+                url,
                 json=payload,
                 timeout=120
             )
@@ -251,25 +525,161 @@ class AnsweringAgent:
                 logger.error("LLM error: %s body=%s", response.status_code, response.text[:500])
                 return ""
 
-            payload_json = response.json()
-            llm_response = (payload_json.get("response", "") or "").strip()
+            return self._parse_llm_response(response.json(), selected_model, generation_mode)
 
-            # Persist raw LLM output in answering.log for traceability/debugging.
-            logger.info(
-                "LLM_RESPONSE_START model=%s mode=%s chars=%d",
-                selected_model,
-                generation_mode,
-                len(llm_response),
-            )
-            logger.info("%s", llm_response if llm_response else "<empty>")
-            logger.info("LLM_RESPONSE_END")
+        except Exception:
+            logger.exception("LLM connection failure")
+            return ""
 
-            return llm_response
+    async def _call_llm_async(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        generation_mode: str = "grounded",
+        intent: Optional[str] = None
+    ) -> str:
+        selected_model, url, payload = self._build_llm_request(prompt, model, generation_mode, intent)
+
+        try:
+            response = await get_async_http_client().post(url, json=payload)
+
+            if response.status_code != 200:
+                logger.error("LLM error: %s body=%s", response.status_code, response.text[:500])
+                return ""
+
+            return self._parse_llm_response(response.json(), selected_model, generation_mode)
 
         except Exception:
             logger.exception("LLM connection failure")
             return ""
 
+    def _stream_llm(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        generation_mode: str = "grounded",
+        intent: Optional[str] = None
+    ) -> Iterator[str]:
+        selected_model, url, payload = self._build_llm_request(prompt, model, generation_mode, intent)
+        payload["stream"] = True
+        parts = []
+
+        try:
+            with get_http_session().post(url, json=payload, timeout=120, stream=True) as response:
+
+                if response.status_code != 200:
+                    logger.error("LLM error: %s body=%s", response.status_code, response.text[:500])
+                    return
+
+                # Ollama streams NDJSON; OpenAI-compatible servers stream SSE.
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    if line.startswith(b"data:"):
+                        line = line[5:].strip()
+                        if line == b"[DONE]":
+                            break
+
+                    chunk = json.loads(line)
+                    if LLM_BACKEND == "openai":
+                        choices = chunk.get("choices") or [{}]
+                        token = choices[0].get("text", "") or ""
+                    else:
+                        token = chunk.get("response", "") or ""
+
+                    if token:
+                        parts.append(token)
+                        yield token
+
+                    if chunk.get("done"):
+                        break
+
+        except Exception:
+            logger.exception("LLM connection failure")
+
+        finally:
+            self._log_llm_response("".join(parts).strip(), selected_model, generation_mode)
+
+    def _build_llm_request(
+        self,
+        prompt: str,
+        model: Optional[str],
+        generation_mode: str,
+        intent: Optional[str] = None
+    ):
+        selected_model = model or self.knowledge_model or self.model
+        num_predict = NUM_PREDICT_BY_INTENT.get(intent, DEFAULT_NUM_PREDICT)
+        options = {
+            "temperature": 0.1,
+            "top_p": 0.2,
+            "top_k": 30,
+            "repeat_penalty": 1.1,
+            "seed": 42,
+            "num_predict": num_predict
+        }
+
+        if generation_mode == "creative_chat":
+            options = {
+                "temperature": 0.8,
+                "top_p": 0.9,
+                "top_k": 60,
+                "repeat_penalty": 1.05,
+                "num_predict": num_predict
+            }
+
+        if LLM_BACKEND == "openai":
+            url = OPENAI_COMPLETIONS_URL
+            payload = {
+                "model": selected_model,
+                "prompt": prompt,
+                "stream": False,
+                "temperature": options["temperature"],
+                "top_p": options["top_p"],
+                "top_k": options["top_k"],
+                "repetition_penalty": options["repeat_penalty"],
+                "max_tokens": options["num_predict"],
+            }
+            if "seed" in options:
+                payload["seed"] = options["seed"]
+        else:
+            url = OLLAMA_URL
+            payload = {
+                "model": selected_model,
+                "prompt": prompt,
+                "stream": False,
+                "options": options
+            }
+
+        return selected_model, url, payload
+
+    def _parse_llm_response(self, payload_json: Dict, selected_model: str, generation_mode: str) -> str:
+        if LLM_BACKEND == "openai":
+            choices = payload_json.get("choices") or [{}]
+            llm_response = (choices[0].get("text", "") or "").strip()
+        else:
+            llm_response = (payload_json.get("response", "") or "").strip()
+
+        self._log_llm_response(llm_response, selected_model, generation_mode)
+        return llm_response
+
+    def _log_llm_response(self, llm_response: str, selected_model: str, generation_mode: str) -> None:
+        # Persist raw LLM output in answering.log for traceability/debugging.
+        logger.info(
+            "LLM_RESPONSE_START model=%s mode=%s chars=%d",
+            selected_model,
+            generation_mode,
+            len(llm_response),
+        )
+        logger.info("%s", llm_response if llm_response else "<empty>")
+        logger.info("LLM_RESPONSE_END")
+
+    def _embed_query(self, query: str):
+        try:
+            return self.router.encode_query(query)
+        except Exception:
+            logger.exception("Query embedding failed")
+            return None
+
     def _needs_follow_up(self, response_text: str) -> bool:
         if not response_text:
             return True
@@ -6,13 +6,29 @@ Features:
 - Supports vector + graph merged results
 - Limits to MAX_CITATIONS
 - Removes null fields
-- Maps doc_id → document_name
+- Maps doc_id → document_name (hash index built once, stat-invalidated,
+  rescans on unknown doc_ids rate-limited)
 - Windows-safe path handling
 """
 
 import os
 import hashlib
-import re
+import json
+import mmap
+import threading
+import time
+
+from core.utils.logging_utils import get_component_logger
+
+
+logger = get_component_logger("CitationManager", component="answering")
+
+# Field values treated as missing (retriever/Chroma metadata values are scalars)
+_NULLS = frozenset((None, "", "None"))
+
+# Unknown doc_ids rescan DATA_FOLDER at once when its mtime changed (PDF
+# added/removed), otherwise at most this often (PDF replaced in place)
+CITATION_INDEX_MIN_REFRESH_SECONDS = float(os.getenv("CITATION_INDEX_MIN_REFRESH_SECONDS", "60"))
 
 
 class CitationManager:
@@ -33,12 +49,38 @@ class CitationManager:
 
     MAX_CITATIONS = 15
 
+    # Citation fields read from the result itself vs. its metadata
+    _TOP_LEVEL_FIELDS = ("doc_id", "chunk_id", "source")
+    _METADATA_FIELDS = ("chapter", "subheading", "emotion", "page_label", "page_physical")
+
+    # doc_id lengths served straight from the prefix map
+    DOC_ID_PREFIX_LENGTHS = (8, 12, 16)
+
+    # Sidecar in DATA_FOLDER persisting {filename: (mtime_ns, size) + digest}
+    INDEX_FILENAME = ".citation_index.json"
+
+    # Deletes every hex digit: a hex string translates to ""
+    _HEX_DELETE_TABLE = str.maketrans("", "", "0123456789abcdefABCDEF")
+
+    def __init__(self):
+        self._index_lock = threading.Lock()
+        self._digest_by_path = {}       # path -> ((mtime_ns, size), sha256 hex)
+        self._filename_by_digest = {}
+        self._digest_by_prefix = {}
+        self._folder_mtime = None       # DATA_FOLDER st_mtime_ns at the last scan
+        self._refreshed_at = None       # monotonic time of the last scan
+        self._load_persisted_index()
+        self._refresh_index()
+
     # ============================================================
     # PUBLIC METHOD
     # ============================================================
 
     def build(self, retrieved_chunks):
 
+        if not retrieved_chunks:
+            return []
+
         citations = []
         seen_keys = set()
 
@@ -47,31 +89,22 @@ class CitationManager:
             if len(citations) >= self.MAX_CITATIONS:
                 break
 
-            metadata = r.get("metadata", {})
-
-            citation = {}
+            metadata = r.get("metadata") or {}
 
             # ----------------------------------------------------
-            # Collect fields from retriever result
+            # Collect non-empty fields from retriever result
             # ----------------------------------------------------
 
-            combined = {
-                "doc_id": r.get("doc_id"),
-                "chunk_id": r.get("chunk_id"),
-                "source": r.get("source"),
-                "chapter": metadata.get("chapter"),
-                "subheading": metadata.get("subheading"),
-                "emotion": metadata.get("emotion"),
-                "page_label": metadata.get("page_label"),
-                "page_physical": metadata.get("page_physical"),
-            }
+            citation = {}
 
-            # ----------------------------------------------------
-            # Remove null / empty fields
-            # ----------------------------------------------------
+            for key in self._TOP_LEVEL_FIELDS:
+                value = r.get(key)
+                if value not in _NULLS:
+                    citation[key] = value
 
-            for key, value in combined.items():
-                if key in self.ALLOWED_FIELDS and value not in [None, "", "None"]:
+            for key in self._METADATA_FIELDS:
+                value = metadata.get(key)
+                if value not in _NULLS:
                     citation[key] = value
 
             if not citation:
@@ -122,7 +155,7 @@ class CitationManager:
     # ============================================================
 
     def _is_hex(self, value: str) -> bool:
-        return bool(re.fullmatch(r"[0-9a-fA-F]+", value))
+        return bool(value) and not value.translate(self._HEX_DELETE_TABLE)
 
     # ============================================================
     # MAP HASH → PDF NAME
@@ -130,25 +163,148 @@ class CitationManager:
 
     def _map_docid_to_filename(self, doc_id: str):
 
-        if not os.path.exists(self.DATA_FOLDER):
+        # No corpus on this host: nothing to map, skip the rescan
+        if not self._digest_by_prefix and not os.path.isdir(self.DATA_FOLDER):
             return None
 
+        filename = self._lookup_filename(doc_id)
+
+        if filename is None and self._index_may_be_stale():
+            # Unknown doc_id → pick up PDFs added/changed since the last scan
+            self._refresh_index()
+            filename = self._lookup_filename(doc_id)
+
+        return filename
+
+    def _lookup_filename(self, doc_id: str):
+
+        doc_id = doc_id.lower()
+
+        if len(doc_id) in self.DOC_ID_PREFIX_LENGTHS:
+            return self._digest_by_prefix.get(doc_id)
+
+        for digest, filename in self._filename_by_digest.items():
+            if digest.startswith(doc_id):
+                return filename
+
+        return None
+
+    def _index_may_be_stale(self) -> bool:
+
         try:
-            for filename in os.listdir(self.DATA_FOLDER):
+            folder_mtime = os.stat(self.DATA_FOLDER).st_mtime_ns
+        except OSError:
+            return False
 
-                if not filename.lower().endswith(".pdf"):
-                    continue
+        if folder_mtime != self._folder_mtime:
+            return True
 
-                file_path = os.path.join(self.DATA_FOLDER, filename)
-                file_hash = self._compute_hash(file_path)
+        return (
+            self._refreshed_at is None
+            or time.monotonic() - self._refreshed_at >= CITATION_INDEX_MIN_REFRESH_SECONDS
+        )
 
-                if file_hash.startswith(doc_id):
-                    return filename
+    # ============================================================
+    # HASH INDEX (only rehash files whose mtime/size changed)
+    # ============================================================
+
+    def _refresh_index(self):
+
+        if not os.path.exists(self.DATA_FOLDER):
+            return
+
+        with self._index_lock:
+            self._refreshed_at = time.monotonic()
+            index = {}
+            rehashed = False
+
+            try:
+                for filename in os.listdir(self.DATA_FOLDER):
+
+                    if not filename.lower().endswith(".pdf"):
+                        continue
+
+                    file_path = os.path.join(self.DATA_FOLDER, filename)
+                    stat = os.stat(file_path)
+                    signature = (stat.st_mtime_ns, stat.st_size)
+
+                    cached = self._digest_by_path.get(file_path)
+                    if cached and cached[0] == signature:
+                        index[file_path] = cached
+                    else:
+                        index[file_path] = (signature, self._compute_hash(file_path))
+                        rehashed = True
+
+            except Exception as e:
+                logger.error("Citation index refresh failed: %s", e)
+                return
+
+            filename_by_digest = {}
+            digest_by_prefix = {}
+
+            for file_path, (_, digest) in index.items():
+                filename = os.path.basename(file_path)
+                filename_by_digest.setdefault(digest, filename)
+                for length in self.DOC_ID_PREFIX_LENGTHS:
+                    digest_by_prefix.setdefault(digest[:length], filename)
+
+            changed = rehashed or index.keys() != self._digest_by_path.keys()
+
+            self._digest_by_path = index
+            self._filename_by_digest = filename_by_digest
+            self._digest_by_prefix = digest_by_prefix
+
+            if changed:
+                self._persist_index()
+
+            # Taken after persisting: the sidecar write bumps the folder mtime
+            try:
+                self._folder_mtime = os.stat(self.DATA_FOLDER).st_mtime_ns
+            except OSError:
+                self._folder_mtime = None
+
+    # ============================================================
+    # INDEX PERSISTENCE (startup only stats PDFs, no rehash)
+    # ============================================================
+
+    def _index_path(self):
+        return os.path.join(self.DATA_FOLDER, self.INDEX_FILENAME)
+
+    def _load_persisted_index(self):
+
+        index_path = self._index_path()
+        if not os.path.exists(index_path):
+            return
+
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+
+            self._digest_by_path = {
+                os.path.join(self.DATA_FOLDER, filename): (tuple(entry["sig"]), entry["digest"])
+                for filename, entry in data.items()
+            }
 
         except Exception as e:
-            print("[CITATION MANAGER ERROR]", e)
+            logger.warning("Ignoring unreadable citation index %s: %s", index_path, e)
+            self._digest_by_path = {}
 
-        return None
+    def _persist_index(self):
+
+        index_path = self._index_path()
+        data = {
+            os.path.basename(file_path): {"sig": list(signature), "digest": digest}
+            for file_path, (signature, digest) in self._digest_by_path.items()
+        }
+
+        try:
+            tmp_path = index_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, index_path)
+
+        except Exception as e:
+            logger.warning("Could not persist citation index %s: %s", index_path, e)
 
     # ============================================================
     # HASH COMPUTATION
@@ -156,13 +312,15 @@ class CitationManager:
 
     def _compute_hash(self, file_path):
 
-        sha256 = hashlib.sha256()
-
         with open(file_path, "rb") as f:
-            while True:
-                chunk = f.read(8192)
-                if not chunk:
-                    break
-                sha256.update(chunk)
 
-        return sha256.hexdigest()
\ No newline at end of file
+            # Py3.11+: the read/update loop runs inside OpenSSL (SHA-NI when available)
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, "sha256").hexdigest()
+
+            if os.fstat(f.fileno()).st_size == 0:
+                return hashlib.sha256().hexdigest()
+
+            # Older interpreters: hand the mapped file to OpenSSL in one call
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.sha256(mm).hexdigest()
@@ -1,8 +1,17 @@
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+import time
 import requests
 import numpy as np
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
+from collections import OrderedDict
 from typing import Tuple, Dict, List, Optional
+from core.models.embedder import get_embedder, get_embedder_model_id
+from core.models.embedding_batcher import get_embedding_batcher
+from core.utils.http_session import get_async_http_client, get_http_session
 from core.utils.logging_utils import get_component_logger
 
 # ============================================================
@@ -11,25 +20,185 @@ from core.utils.logging_utils import get_component_logger
 
 logger = get_component_logger("IntentRouter", component="answering")
 
+INTENT_CACHE_SIZE = int(os.getenv("INTENT_CACHE_SIZE", "4096"))
+EMBEDDING_CACHE_SIZE = int(os.getenv("INTENT_EMBEDDING_CACHE_SIZE", "1024"))
+# Output of `python -m pipelines.build_intent_prototypes`; loaded with
+# mmap at startup so the router does not encode prototypes on boot.
+PROTOTYPE_CACHE_DIR = os.getenv("INTENT_PROTOTYPE_DIR", "models/intent_prototypes")
+PROTO_MATRIX_FILE = "proto_matrix.npy"
+PROTO_META_FILE = "proto_intents.json"
+
+INTENT_PROTOTYPES: Dict[str, List[str]] = {
+    "medical": [
+        "medical diagnosis",
+        "clinical treatment",
+        "disease symptoms",
+        "therapy and disorder"
+    ],
+    "book": [
+        "chapter explanation",
+        "from the textbook",
+        "section summary",
+        "explain from the book"
+    ],
+    "general": [
+        "casual conversation",
+        "general knowledge question",
+        "simple explanation",
+        "friendly chat",
+        "hello, how are you"
+    ]
+}
+
+# Keyword prefilter resolved before any embedding work. Greetings only
+# count when they are the whole message; book/medical only when exactly
+# one of the two matches, otherwise the cosine gate decides.
+_GREETING_PATTERN = re.compile(
+    r"^\W*(hi|hello|hey|thanks|thank you|how are you|good (morning|afternoon|evening)|bye)\W*$",
+    re.I
+)
+# Only unambiguous book references: bare "section"/"page"/"book" also
+# occur in clinical questions ("c-section", "book an appointment").
+_BOOK_PATTERN = re.compile(
+    r"\bchapters?\s+(?:\d+|[ivxlc]+)\b"
+    r"|(?<![-\w])(?<!caesarean )(?<!cesarean )sections?\s+\d+(?:\.\d+)*\b"
+    r"|\bpages?\s+\d+\b"
+    r"|\btextbooks?\b"
+    r"|\b(?:the|this|that|your)\s+book\b",
+    re.I
+)
+_MEDICAL_PATTERN = re.compile(
+    r"\b(symptoms?|diagnos\w*|therap\w*|disease|treatments?|syndrome|disorders?|dosage|\d+\s?mg)\b",
+    re.I
+)
+
+# int8 scores within this margin of each other (or of the threshold) are
+# re-scored in FP32 before routing.
+INT8_RESCORE_MARGIN = 0.05
+
+# Hard wall-clock cap (seconds) on one streamed LLM label call
+LLM_LABEL_TIMEOUT = float(os.getenv("INTENT_LLM_TIMEOUT", "10"))
+
+# Try optional dependencies for the prototype scan: SimSIMD's native
+# cosine kernels first, then a numba-JIT loop, then plain NumPy.
+try:
+    import simsimd  # type: ignore
+    _HAS_SIMSIMD = True
+except Exception:
+    _HAS_SIMSIMD = False
+
+try:
+    import numba  # type: ignore
+    _HAS_NUMBA = True
+except Exception:
+    _HAS_NUMBA = False
+
 
 # ============================================================
-# Lazy Singleton for Embedding Model (LOAD ONLY ONCE)
+# Prototype Scan Kernel
 # ============================================================
 
-_embedder_instance: Optional[SentenceTransformer] = None
+def _cos_argmax_numpy(proto_matrix: np.ndarray, query_embedding: np.ndarray) -> Tuple[int, float]:
+    similarities = proto_matrix @ query_embedding
+    best_index = int(similarities.argmax())
+    return best_index, float(similarities[best_index])
 
 
-def get_embedder() -> SentenceTransformer:
-    global _embedder_instance
-    if _embedder_instance is None:
-        try:
-            logger.info("Loading SentenceTransformer model (all-MiniLM-L6-v2)...")
-            _embedder_instance = SentenceTransformer("all-MiniLM-L6-v2")
-            logger.info("Embedding model loaded successfully.")
-        except Exception:
-            logger.exception("Failed to load SentenceTransformer model")
-            raise
-    return _embedder_instance
+def _cos_argmax_simsimd(proto_matrix: np.ndarray, query_embedding: np.ndarray) -> Tuple[int, float]:
+    distances = np.asarray(
+        simsimd.cdist(query_embedding[None, :], proto_matrix, metric="cosine")
+    ).ravel()
+    best_index = int(distances.argmin())
+    return best_index, 1.0 - float(distances[best_index])
+
+
+if _HAS_SIMSIMD:
+    _cos_argmax = _cos_argmax_simsimd
+
+elif _HAS_NUMBA:
+
+    @numba.njit(cache=True, fastmath=True, boundscheck=False)
+    def _cos_argmax_numba(proto_matrix, query_embedding):
+        best_index = 0
+        best_score = -np.inf
+        for i in range(proto_matrix.shape[0]):
+            acc = np.float32(0.0)
+            for j in range(proto_matrix.shape[1]):
+                acc += proto_matrix[i, j] * query_embedding[j]
+            if acc > best_score:
+                best_index = i
+                best_score = acc
+        return best_index, best_score
+
+    def _cos_argmax(proto_matrix: np.ndarray, query_embedding: np.ndarray) -> Tuple[int, float]:
+        best_index, best_score = _cos_argmax_numba(proto_matrix, query_embedding)
+        return int(best_index), float(best_score)
+
+else:
+    _cos_argmax = _cos_argmax_numpy
+
+
+# ============================================================
+# Prototype Embeddings (encode / persist / load)
+# ============================================================
+
+def prototype_fingerprint(prototypes: Dict[str, List[str]]) -> str:
+    payload = json.dumps(prototypes, sort_keys=True).encode("utf-8")
+    return hashlib.md5(payload, usedforsecurity=False).hexdigest()
+
+
+def encode_prototypes(embedder, prototypes: Dict[str, List[str]]) -> Tuple[np.ndarray, List[str]]:
+    """
+    Stack all prototypes into one normalized (N_proto, d) float32 matrix
+    so a query is scored against every intent with a single GEMV.
+    """
+    embeddings = [
+        embedder.encode(
+            texts,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        )
+        for texts in prototypes.values()
+    ]
+    matrix = np.ascontiguousarray(np.concatenate(embeddings, axis=0), dtype=np.float32)
+    intents = [intent for intent, texts in prototypes.items() for _ in texts]
+    return matrix, intents
+
+
+def save_prototype_cache(directory: str, matrix: np.ndarray, intents: List[str], fingerprint: str) -> None:
+    os.makedirs(directory, exist_ok=True)
+    np.save(os.path.join(directory, PROTO_MATRIX_FILE), matrix)
+    with open(os.path.join(directory, PROTO_META_FILE), "w", encoding="utf-8") as f:
+        json.dump({"md5": fingerprint, "intents": intents}, f, indent=2)
+
+
+def load_prototype_cache(directory: str, fingerprint: str) -> Optional[Tuple[np.ndarray, List[str]]]:
+    matrix_path = os.path.join(directory, PROTO_MATRIX_FILE)
+    meta_path = os.path.join(directory, PROTO_META_FILE)
+
+    if not (os.path.exists(matrix_path) and os.path.exists(meta_path)):
+        return None
+
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+
+        if meta.get("md5") != fingerprint:
+            logger.warning("Prototype cache in %s is stale — re-encoding prototypes", directory)
+            return None
+
+        # Plain ndarray view over the read-only mapping (numba rejects memmap)
+        matrix = np.asarray(np.load(matrix_path, mmap_mode="r"))
+        intents = list(meta["intents"])
+        if matrix.dtype != np.float32 or matrix.shape[0] != len(intents):
+            return None
+
+        return matrix, intents
+
+    except Exception:
+        logger.exception("Failed to load prototype cache from %s", directory)
+        return None
 
 
 class IntentRouter:
@@ -49,109 +218,481 @@ class IntentRouter:
         self.llm_model = llm_model
         self.similarity_threshold = similarity_threshold
 
-        try:
-            # Lazy loaded embedder (ONLY FIRST TIME GLOBALLY)
-            self.embedder = get_embedder()
-        except Exception:
-            logger.exception("IntentRouter initialization failed during embedder load")
-            raise
+        # Embedder is loaded on first use; with a prototype cache on disk
+        # the router starts without running the transformer.
+        self._embedder = None
 
         # Intent prototypes
         self.intent_prototypes: Dict[str, List[str]] = {
-            "medical": [
-                "medical diagnosis",
-                "clinical treatment",
-                "disease symptoms",
-                "therapy and disorder"
-            ],
-            "book": [
-                "chapter explanation",
-                "from the textbook",
-                "section summary",
-                "explain from the book"
-            ],
-            "general": [
-                "casual conversation",
-                "general knowledge question",
-                "simple explanation",
-                "friendly chat",
-                "hello, how are you"
-            ]
+            intent: list(texts) for intent, texts in INTENT_PROTOTYPES.items()
         }
 
-        try:
-            # Precompute normalized embeddings
-            self.prototype_embeddings = {
-                intent: self.embedder.encode(texts, normalize_embeddings=True)
-                for intent, texts in self.intent_prototypes.items()
-            }
-        except Exception:
-            logger.exception("Failed to compute prototype embeddings")
-            raise
+        cached = load_prototype_cache(
+            PROTOTYPE_CACHE_DIR,
+            prototype_fingerprint(self.intent_prototypes)
+        )
+        if cached is not None:
+            logger.info("Loaded prototype embeddings from %s", PROTOTYPE_CACHE_DIR)
+            self._proto_matrix, self._proto_intents = cached
+        else:
+            try:
+                self._proto_matrix, self._proto_intents = encode_prototypes(
+                    self.embedder,
+                    self.intent_prototypes
+                )
+            except Exception:
+                logger.exception("Failed to compute prototype embeddings")
+                raise
+
+        self.prototype_embeddings = {
+            intent: self._proto_matrix[
+                [i for i, row_intent in enumerate(self._proto_intents) if row_intent == intent]
+            ]
+            for intent in self.intent_prototypes
+        }
 
         self.valid_intents = list(self.intent_prototypes.keys())
 
+        # LRU of normalized query -> intent. Entries are tagged with the
+        # threshold they were decided under and dropped if it changes.
+        self._intent_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._intent_cache_threshold = self.similarity_threshold
+        self._intent_cache_lock = threading.Lock()
+
+        # LRU of normalized query -> read-only float32 embedding
+        self._embedding_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._embedding_cache_lock = threading.Lock()
+
+        # int8 copy for SimSIMD's integer cosine kernel (unit vectors * 127).
+        self._proto_i8 = (
+            np.round(self._proto_matrix * 127).astype(np.int8)
+            if _HAS_SIMSIMD else None
+        )
+
+        # Compile (or load the cached) numba kernel now, not on the first query.
+        _cos_argmax(self._proto_matrix, self._proto_matrix[0])
+
         logger.info("IntentRouter initialized successfully.")
 
+    @property
+    def embedder(self):
+        if self._embedder is None:
+            try:
+                # Lazy loaded embedder (ONLY FIRST TIME GLOBALLY)
+                self._embedder = get_embedder()
+            except Exception:
+                logger.exception("IntentRouter embedder load failed")
+                raise
+        return self._embedder
+
+    @property
+    def embedding_signature(self):
+        """
+        (model, normalized) of encode_query() vectors, comparable with
+        VectorEmbedder.signature.
+        """
+        return (get_embedder_model_id(), True)
+
     # ============================================================
     # PUBLIC CLASSIFY METHOD
     # ============================================================
 
-    def classify(self, query: str) -> str:
+    def classify(self, query: str, q_emb: Optional[np.ndarray] = None) -> str:
         if not query or not query.strip():
             logger.warning("Empty query received. Defaulting to general.")
             return "general"
 
         try:
-            # Step 1: Fast Embedding Similarity
-            intent, confidence = self._classify_cosine(query)
-            logger.debug(f"Cosine classification: {intent} (Score: {confidence:.2f})")
-
-            # Step 2: High Confidence Threshold Check
-            if confidence >= self.similarity_threshold:
+            cache_key, intent = self._classify_fast(query, q_emb)
+            if intent is not None:
                 return intent
 
-            # Step 3: LLM Fallback
-            logger.info(f"Low confidence ({confidence:.2f}). Falling back to LLM.")
-            return self._classify_llm(query)
+            # Step 3: LLM Fallback (failures are not cached)
+            intent = self._classify_llm_label(query)
+            return self._finish_llm_fallback(cache_key, intent)
 
         except Exception:
             logger.exception("Unhandled exception during classify(). Defaulting to general.")
             return "general"
 
+    def prefilter(self, query: str) -> Optional[str]:
+        """
+        Keyword / intent-cache answer without embedding, or None when the
+        cosine gate (and possibly the LLM) has to decide.
+        """
+        if not query or not query.strip():
+            return "general"
+
+        try:
+            return self._classify_prefilter(" ".join(query.strip().lower().split()))
+        except Exception:
+            logger.exception("Unhandled exception during prefilter().")
+            return None
+
+    async def classify_async(self, query: str, q_emb: Optional[np.ndarray] = None) -> str:
+        """
+        classify() for coroutine callers: the cosine gate runs inline and
+        the LLM fallback is awaited over the shared httpx.AsyncClient.
+        """
+        if not query or not query.strip():
+            logger.warning("Empty query received. Defaulting to general.")
+            return "general"
+
+        try:
+            cache_key, intent = self._classify_fast(query, q_emb)
+            if intent is not None:
+                return intent
+
+            intent = await self._classify_llm_label_async(query)
+            return self._finish_llm_fallback(cache_key, intent)
+
+        except Exception:
+            logger.exception("Unhandled exception during classify_async(). Defaulting to general.")
+            return "general"
+
+    def _classify_fast(self, query: str, q_emb: Optional[np.ndarray]) -> Tuple[str, Optional[str]]:
+        """
+        Cache lookup + cosine gate. Returns (cache_key, intent), where
+        intent is None when the LLM fallback is needed.
+        """
+        cache_key = " ".join(query.strip().lower().split())
+
+        intent = self._classify_prefilter(cache_key)
+        if intent is not None:
+            return cache_key, intent
+
+        # Step 1: Fast Embedding Similarity
+        intent, confidence = self._classify_cosine(query, q_emb)
+        logger.debug(f"Cosine classification: {intent} (Score: {confidence:.2f})")
+
+        # Step 2: High Confidence Threshold Check
+        if confidence >= self.similarity_threshold:
+            self._put_cached_intent(cache_key, intent)
+            return cache_key, intent
+
+        logger.info(f"Low confidence ({confidence:.2f}). Falling back to LLM.")
+        return cache_key, None
+
+    def _classify_prefilter(self, cache_key: str) -> Optional[str]:
+
+        # Step 0: Keyword prefilter (no embedding, no LLM)
+        intent = self._classify_keywords(cache_key)
+        if intent is not None:
+            logger.debug(f"Keyword classification: {intent}")
+            return intent
+
+        return self._get_cached_intent(cache_key)
+
+    def _classify_keywords(self, text: str) -> Optional[str]:
+        if _GREETING_PATTERN.match(text):
+            return "general"
+
+        is_book = _BOOK_PATTERN.search(text) is not None
+        is_medical = _MEDICAL_PATTERN.search(text) is not None
+        if is_book != is_medical:
+            return "book" if is_book else "medical"
+
+        return None
+
+    def _finish_llm_fallback(self, cache_key: str, intent: Optional[str]) -> str:
+        if intent is None:
+            return "general"
+
+        self._put_cached_intent(cache_key, intent)
+        return intent
+
     # ============================================================
-    # COSINE SIMILARITY CLASSIFICATION
+    # BATCH CLASSIFY
     # ============================================================
 
-    def _classify_cosine(self, query: str) -> Tuple[str, float]:
+    def classify_many(self, queries: List[str], batch_size: int = 32) -> List[str]:
+        """
+        Classify a list of queries with one batched encode and one GEMM.
+
+        Queries are encoded sorted by length so each batch pads to a
+        similar size; low-confidence rows share one concurrent round of
+        LLM fallback calls. Results are returned in input order.
+        """
+        intents: List[str] = ["general"] * len(queries)
+        keys: List[str] = [""] * len(queries)
+        pending: List[int] = []
+
+        for i, query in enumerate(queries):
+            if not query or not query.strip():
+                continue
+            keys[i] = " ".join(query.strip().lower().split())
+            intent = self._classify_prefilter(keys[i])
+            if intent is not None:
+                intents[i] = intent
+            else:
+                pending.append(i)
+
+        if not pending:
+            return intents
+
         try:
-            query_embedding = self.embedder.encode(
-                [query],
-                normalize_embeddings=True
+            pending.sort(key=lambda i: len(queries[i]))
+            embeddings = np.asarray(
+                self.embedder.encode(
+                    [queries[i] for i in pending],
+                    batch_size=batch_size,
+                    normalize_embeddings=True,
+                    convert_to_numpy=True,
+                    show_progress_bar=False
+                ),
+                dtype=np.float32
             )
 
-            best_intent = "general"
-            best_score = 0.0
+            similarities = embeddings @ self._proto_matrix.T
+            best_rows = similarities.argmax(axis=1)
+            best_scores = similarities[np.arange(len(pending)), best_rows]
+
+        except Exception:
+            logger.exception("Batched cosine classification failed. Defaulting to general.")
+            return intents
+
+        low_confidence: List[int] = []
+        for i, row, score in zip(pending, best_rows, best_scores):
+            if score >= self.similarity_threshold:
+                intents[i] = self._proto_intents[int(row)]
+                self._put_cached_intent(keys[i], intents[i])
+            else:
+                low_confidence.append(i)
+
+        if low_confidence:
+            logger.info("Batch LLM fallback for %d/%d queries", len(low_confidence), len(queries))
+            labels = self._classify_llm_many([queries[i] for i in low_confidence])
+            for i, label in zip(low_confidence, labels):
+                intents[i] = self._finish_llm_fallback(keys[i], label)
+
+        return intents
+
+    def _classify_llm_many(self, queries: List[str], max_concurrency: int = 8) -> List[Optional[str]]:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # Already inside an event loop: cannot nest asyncio.run()
+            return [self._classify_llm_label(query) for query in queries]
+
+        async def _gather():
+            semaphore = asyncio.Semaphore(max_concurrency)
 
-            for intent, proto_embeds in self.prototype_embeddings.items():
-                similarities = cosine_similarity(query_embedding, proto_embeds)
-                max_similarity = similarities.max()
+            async def _one(query: str) -> Optional[str]:
+                async with semaphore:
+                    return await self._classify_llm_label_async(query)
 
-                if max_similarity > best_score:
-                    best_score = max_similarity
-                    best_intent = intent
+            return await asyncio.gather(*(_one(query) for query in queries))
 
-            return best_intent, float(best_score)
+        return list(asyncio.run(_gather()))
+
+    # ============================================================
+    # QUERY EMBEDDING (memoized)
+    # ============================================================
+
+    def encode_query(self, query: str) -> np.ndarray:
+        """
+        Normalized float32 embedding of `query`, memoized on the
+        whitespace-collapsed lowercase text (MiniLM's tokenizer is
+        uncased). The returned array is shared and read-only.
+        """
+        key = " ".join(query.strip().lower().split())
+
+        with self._embedding_cache_lock:
+            cached = self._embedding_cache.get(key)
+            if cached is not None:
+                self._embedding_cache.move_to_end(key)
+                return cached
+
+        # Concurrent requests share one encode() call via the micro-batcher
+        batcher = get_embedding_batcher()
+        if batcher is not None:
+            embedding = batcher.encode_one(query)
+        else:
+            embedding = np.asarray(
+                self.embedder.encode(
+                    [query],
+                    normalize_embeddings=True,
+                    convert_to_numpy=True,
+                    show_progress_bar=False
+                )[0],
+                dtype=np.float32
+            )
+        embedding.flags.writeable = False
+
+        with self._embedding_cache_lock:
+            self._embedding_cache[key] = embedding
+            self._embedding_cache.move_to_end(key)
+            while len(self._embedding_cache) > EMBEDDING_CACHE_SIZE:
+                self._embedding_cache.popitem(last=False)
+
+        return embedding
+
+    def clear_cache(self) -> None:
+        with self._intent_cache_lock:
+            self._intent_cache.clear()
+        with self._embedding_cache_lock:
+            self._embedding_cache.clear()
+
+    # ============================================================
+    # INTENT CACHE
+    # ============================================================
+
+    def _get_cached_intent(self, key: str) -> Optional[str]:
+        with self._intent_cache_lock:
+            if self._intent_cache_threshold != self.similarity_threshold:
+                self._intent_cache.clear()
+                self._intent_cache_threshold = self.similarity_threshold
+                return None
+
+            intent = self._intent_cache.get(key)
+            if intent is not None:
+                self._intent_cache.move_to_end(key)
+            return intent
+
+    def _put_cached_intent(self, key: str, intent: str) -> None:
+        with self._intent_cache_lock:
+            self._intent_cache[key] = intent
+            self._intent_cache.move_to_end(key)
+            while len(self._intent_cache) > INTENT_CACHE_SIZE:
+                self._intent_cache.popitem(last=False)
+
+    # ============================================================
+    # COSINE SIMILARITY CLASSIFICATION
+    # ============================================================
+
+    def _classify_cosine(self, query: str, q_emb: Optional[np.ndarray] = None) -> Tuple[str, float]:
+        try:
+            # Reuse the caller's normalized embedding when provided.
+            if q_emb is None:
+                q_emb = self.encode_query(query)
+            query_embedding = np.asarray(q_emb, dtype=np.float32).ravel()
+
+            # Both sides are L2-normalized, so the dot product is the cosine.
+            if self._proto_i8 is not None:
+                best_index, best_score = self._cos_argmax_int8(query_embedding)
+            else:
+                best_index, best_score = _cos_argmax(
+                    self._proto_matrix,
+                    np.ascontiguousarray(query_embedding)
+                )
+
+            if best_score <= 0.0:
+                return "general", 0.0
+
+            return self._proto_intents[best_index], best_score
 
         except Exception:
             logger.exception("Cosine similarity classification failed")
             return "general", 0.0
 
+    def _cos_argmax_int8(self, query_embedding: np.ndarray) -> Tuple[int, float]:
+        q_i8 = np.round(query_embedding * 127).astype(np.int8)
+        similarities = 1.0 - np.asarray(
+            simsimd.cdist(q_i8[None, :], self._proto_i8, metric="cosine")
+        ).ravel()
+
+        second, first = np.argsort(similarities)[-2:]
+        best_index, best_score = int(first), float(similarities[first])
+
+        close_call = (
+            best_score - float(similarities[second]) < INT8_RESCORE_MARGIN
+            or abs(best_score - self.similarity_threshold) < INT8_RESCORE_MARGIN
+        )
+        if close_call:
+            candidates = (int(first), int(second))
+            exact = self._proto_matrix[list(candidates)] @ query_embedding
+            pick = int(exact.argmax())
+            best_index, best_score = candidates[pick], float(exact[pick])
+
+        return best_index, best_score
+
     # ============================================================
     # LLM FALLBACK CLASSIFICATION
     # ============================================================
 
     def _classify_llm(self, query: str) -> str:
+        return self._classify_llm_label(query) or "general"
+
+    def _classify_llm_label(self, query: str) -> Optional[str]:
+        """
+        Returns the LLM's label, or None when the call failed.
+        """
+        try:
+            deadline = time.monotonic() + LLM_LABEL_TIMEOUT
+            buffer = ""
+
+            # Stream and stop at the first recognized label instead of
+            # waiting for all num_predict tokens.
+            with get_http_session().post(
+                self.ollama_url,
+                json=self._llm_payload(query, stream=True),
+                timeout=LLM_LABEL_TIMEOUT,
+                stream=True
+            ) as response:
+
+                response.raise_for_status()
+
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+
+                    chunk = json.loads(line)
+                    buffer += chunk.get("response", "")
+
+                    intent = self._match_label(buffer)
+                    if intent is not None:
+                        return intent
+
+                    if chunk.get("done") or time.monotonic() > deadline:
+                        break
+
+            return self._parse_llm_label({"response": buffer})
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"LLM fallback failed: {e}. Defaulting to general.")
+            return None
+
+        except Exception:
+            logger.exception("Unexpected error during LLM fallback")
+            return None
+
+    async def _classify_llm_label_async(self, query: str) -> Optional[str]:
+        try:
+            deadline = time.monotonic() + LLM_LABEL_TIMEOUT
+            buffer = ""
+
+            async with get_async_http_client().stream(
+                "POST",
+                self.ollama_url,
+                json=self._llm_payload(query, stream=True),
+                timeout=LLM_LABEL_TIMEOUT
+            ) as response:
+
+                response.raise_for_status()
+
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+
+                    chunk = json.loads(line)
+                    buffer += chunk.get("response", "")
+
+                    intent = self._match_label(buffer)
+                    if intent is not None:
+                        return intent
+
+                    if chunk.get("done") or time.monotonic() > deadline:
+                        break
+
+            return self._parse_llm_label({"response": buffer})
+
+        except Exception as e:
+            logger.error(f"LLM fallback failed: {e}. Defaulting to general.")
+            return None
+
+    def _llm_payload(self, query: str, stream: bool = False) -> Dict:
 
         prompt = f"""
 You are a strict query routing system. 
@@ -165,36 +706,33 @@ Respond with ONLY the exact label word. No explanations. No punctuation.
 Query: "{query}"
 Label:"""
 
-        try:
-            response = requests.post(
-                self.ollama_url,
-                json={
-                    "model": self.llm_model,
-                    "prompt": prompt.strip(),
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.0,
-                        "num_predict": 5
-                    }
-                },
-                timeout=10
-            )
+        return {
+            "model": self.llm_model,
+            "prompt": prompt.strip(),
+            "stream": stream,
+            "options": {
+                "temperature": 0.0,
+                "num_predict": 5
+            }
+        }
+
+    def _match_label(self, text: str) -> Optional[str]:
 
-            response.raise_for_status()
+        text = text.lower()
 
-            result_text = response.json().get("response", "").strip().lower()
+        for intent in self.valid_intents:
+            if intent in text:
+                return intent
 
-            for intent in self.valid_intents:
-                if intent in result_text:
-                    return intent
+        return None
 
-            logger.warning(f"LLM returned unrecognized intent: '{result_text}'. Defaulting to general.")
-            return "general"
+    def _parse_llm_label(self, payload_json: Dict) -> str:
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"LLM fallback failed: {e}. Defaulting to general.")
-            return "general"
+        result_text = payload_json.get("response", "").strip().lower()
 
-        except Exception:
-            logger.exception("Unexpected error during LLM fallback")
-            return "general"
+        intent = self._match_label(result_text)
+        if intent is not None:
+            return intent
+
+        logger.warning(f"LLM returned unrecognized intent: '{result_text}'. Defaulting to general.")
+        return "general"
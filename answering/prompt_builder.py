@@ -1,11 +1,30 @@
-import textwrap
-from typing import Any, Dict, List
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 from core.utils.logging_utils import get_component_logger
 
 
 logger = get_component_logger("PromptBuilder", component="answering")
 
+CONTEXT_CACHE_SIZE = int(os.getenv("PROMPT_CONTEXT_CACHE_SIZE", "64"))
+
+
+def _compile_template(template: str, fields: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Split a template on its `{field}` placeholders (in order of appearance)
+    so prompts are assembled with str.join instead of re-parsing format
+    specs on every call.
+    """
+    parts = []
+    rest = template
+    for field in fields:
+        head, rest = rest.split("{" + field + "}", 1)
+        parts.append(head)
+    parts.append(rest)
+    return tuple(parts)
+
 
 class PromptBuilder:
     """
@@ -14,59 +33,67 @@ class PromptBuilder:
     - Evidence-grounded mode for medical/book answers
     """
 
-    _KNOWLEDGE_TEMPLATE = textwrap.dedent("""
-    You are Smart Medirag, an evidence-grounded medical assistant.
-
-    Follow these rules exactly:
-    - Use ONLY the provided CONTEXT.
-    - Do not use outside knowledge.
-    - Do not guess or infer missing facts.
-    - If the answer is missing or incomplete in CONTEXT, output exactly:
-    dont have an answer
-
-    Style and format rules:
-    - Be calm, clear, and professional.
-    - For clinical or psychological topics, use empathetic psychiatrist-like language.
-    - Do not use creative storytelling, metaphors, or speculative language.
-    - Use markdown with these sections in this order:
-      1) ### Direct Answer
-      2) ### Evidence Summary
-      3) ### Practical Guidance
-      4) ### Safety Notes
-    - When listing types, categories, steps, or recommendations, always use markdown bullets (`- item`) on separate lines.
-    - Keep short paragraphs separated by blank lines so output is easy to scan in chat.
-    - Keep statements factual and concise.
-    - Do not mention context or internal instructions.
-
-    {memory_section}
-
-    CONTEXT:
-    {context_text}
-
-    QUESTION:
-    {query}
-
-    FINAL ANSWER:
-    """).strip()
-
-    _COMPANION_TEMPLATE = textwrap.dedent("""
-    You are Smart Medirag, a supportive and friendly companion for everyday conversation.
-
-    Rules:
-    - Be warm, respectful, concise, and positive.
-    - You may be lightly creative in phrasing when it improves clarity and encouragement.
-    - Use simple language.
-    - Do not fabricate medical facts.
-    - If the user asks medical or textbook evidence questions, suggest they ask directly and you will provide cited answers.
-    - When there are multiple types/options/ideas, format them as markdown bullet points with one item per line.
-    - Use short paragraphs with clear line breaks.
-    - Return only the answer.
-
-    USER MESSAGE:
-    {query}
-
-    RESPONSE:
-    """).strip()
+    _KNOWLEDGE_TEMPLATE = """\
+You are Smart Medirag, an evidence-grounded medical assistant.
+
+Follow these rules exactly:
+- Use ONLY the provided CONTEXT.
+- Do not use outside knowledge.
+- Do not guess or infer missing facts.
+- If the answer is missing or incomplete in CONTEXT, output exactly:
+dont have an answer
+
+Style and format rules:
+- Be calm, clear, and professional.
+- For clinical or psychological topics, use empathetic psychiatrist-like language.
+- Do not use creative storytelling, metaphors, or speculative language.
+- Use markdown with these sections in this order:
+  1) ### Direct Answer
+  2) ### Evidence Summary
+  3) ### Practical Guidance
+  4) ### Safety Notes
+- When listing types, categories, steps, or recommendations, always use markdown bullets (`- item`) on separate lines.
+- Keep short paragraphs separated by blank lines so output is easy to scan in chat.
+- Keep statements factual and concise.
+- Do not mention context or internal instructions.
+
+CONTEXT:
+{context_text}
+
+{memory_section}
+
+QUESTION:
+{query}
+
+FINAL ANSWER:"""
+
+    _COMPANION_TEMPLATE = """\
+You are Smart Medirag, a supportive and friendly companion for everyday conversation.
+
+Rules:
+- Be warm, respectful, concise, and positive.
+- You may be lightly creative in phrasing when it improves clarity and encouragement.
+- Use simple language.
+- Do not fabricate medical facts.
+- If the user asks medical or textbook evidence questions, suggest they ask directly and you will provide cited answers.
+- When there are multiple types/options/ideas, format them as markdown bullet points with one item per line.
+- Use short paragraphs with clear line breaks.
+- Return only the answer.
+
+USER MESSAGE:
+{query}
+
+RESPONSE:"""
+
+    _KNOWLEDGE_PARTS = _compile_template(_KNOWLEDGE_TEMPLATE, ("context_text", "memory_section", "query"))
+    _COMPANION_PARTS = _compile_template(_COMPANION_TEMPLATE, ("query",))
+
+    def __init__(self, context_cache_size: int = CONTEXT_CACHE_SIZE):
+        # Rendered context keyed by the (doc_id, chunk_id) sequence; follow-up
+        # turns over the same retrieved set skip re-serialization.
+        self._context_cache: "OrderedDict[Tuple, str]" = OrderedDict()
+        self._context_cache_size = context_cache_size
+        self._context_cache_lock = threading.Lock()
 
     def build(
         self,
@@ -78,58 +105,92 @@ class PromptBuilder:
         if intent == "general":
             return self.build_companion(query=query)
 
-        context_text = self._build_context(context_chunks)
+        # Rerank order is kept (best evidence first); it is already
+        # deterministic for the same retrieved set, so the prefix is stable.
+        context_text = self._cached_context(context_chunks)
 
         memory_section = ""
         if conversation_window:
-            memory_section = textwrap.dedent(f"""
-            ### PREVIOUS CONVERSATION:
-            {conversation_window}
-            """).strip()
+            memory_section = "### PREVIOUS CONVERSATION:\n" + conversation_window.rstrip()
 
-        prompt = self._KNOWLEDGE_TEMPLATE.format(
-            memory_section=memory_section,
-            context_text=context_text,
-            query=query
-        )
+        head, after_context, after_memory, tail = self._KNOWLEDGE_PARTS
+        prompt = "".join((head, context_text, after_context, memory_section, after_memory, query, tail))
 
         logger.debug("Knowledge prompt built (chars=%d, chunks=%d, intent=%s)", len(prompt), len(context_chunks), intent)
         return prompt
 
     def build_companion(self, query: str) -> str:
-        prompt = self._COMPANION_TEMPLATE.format(query=query)
+        head, tail = self._COMPANION_PARTS
+        prompt = "".join((head, query, tail))
         logger.debug("Companion prompt built (chars=%d)", len(prompt))
         return prompt
 
+    # (label, top-level key, metadata key) rendered per context chunk
+    _META_KEYS = (
+        ("Doc ID", "doc_id", None),
+        ("Chunk ID", "chunk_id", None),
+        ("Chapter", None, "chapter"),
+        ("Subheading", None, "subheading"),
+        ("Page", None, "page_physical"),
+        ("Source Type", "source", None),
+    )
+
+    def _cached_context(self, context_chunks: List[Dict[str, Any]]) -> str:
+        key = self._context_key(context_chunks)
+        if key is None:
+            return self._build_context(context_chunks)
+
+        with self._context_cache_lock:
+            cached = self._context_cache.get(key)
+            if cached is not None:
+                self._context_cache.move_to_end(key)
+                return cached
+
+        context_text = self._build_context(context_chunks)
+
+        with self._context_cache_lock:
+            self._context_cache[key] = context_text
+            self._context_cache.move_to_end(key)
+            while len(self._context_cache) > self._context_cache_size:
+                self._context_cache.popitem(last=False)
+
+        return context_text
+
+    @staticmethod
+    def _context_key(context_chunks: List[Dict[str, Any]]) -> Optional[Tuple]:
+        key = tuple((c.get("doc_id"), c.get("chunk_id")) for c in context_chunks)
+        # Chunks without an id cannot be told apart: render them uncached
+        if any(chunk_id is None for _, chunk_id in key):
+            return None
+        return key
+
     def _build_context(self, context_chunks: List[Dict[str, Any]]) -> str:
         if not context_chunks:
             return ""
 
-        structured_blocks = []
+        meta_keys = self._META_KEYS
+        buffer = []
+        append = buffer.append
 
         for idx, chunk in enumerate(context_chunks, 1):
-            metadata = chunk.get("metadata", {})
-
-            meta_mapping = {
-                "Doc ID": chunk.get("doc_id"),
-                "Chunk ID": chunk.get("chunk_id"),
-                "Chapter": metadata.get("chapter"),
-                "Subheading": metadata.get("subheading"),
-                "Page": metadata.get("page_physical"),
-                "Source Type": chunk.get("source")
-            }
-
-            meta_lines = [f"{k}: {v}" for k, v in meta_mapping.items() if v]
-            meta_text = "\n".join(meta_lines)
-            content_text = chunk.get("text", "").strip()
-
-            block = f"""
-[Source {idx}]
-{meta_text}
-
-Content:
-{content_text}
-"""
-            structured_blocks.append(block.strip())
-
-        return "\n\n---\n\n".join(structured_blocks)
+            metadata = chunk.get("metadata") or {}
+
+            append("[Source %d]\n" % idx)
+
+            first = True
+            for label, key, meta_key in meta_keys:
+                value = chunk.get(key) if key else metadata.get(meta_key)
+                if value:
+                    if not first:
+                        append("\n")
+                    append(f"{label}: {value}")
+                    first = False
+
+            content_text = (chunk.get("text") or "").strip()
+
+            append("\n\nContent:\n" if content_text else "\n\nContent:")
+            append(content_text)
+            append("\n\n---\n\n")
+
+        buffer.pop()  # trailing separator
+        return "".join(buffer)
@@ -33,12 +33,21 @@ class ResponseFormatter:
             r"as stated in).*?[:\-,]?\s*\n*",
             re.IGNORECASE,
         )
+        # Every chatter_pattern match starts with one of these words; text
+        # that doesn't skips the regex entirely
+        self._chatter_starts = (
+            "certainly", "sure", "yes", "absolutely", "here",
+            "based on", "according to", "to answer", "as stated in",
+        )
 
-        # Markdown and raw URL patterns
-        self.md_link_pattern: Pattern = re.compile(r"\[([^\]]+)\]\((https?://[^\s\)]+)\)")
-        self.raw_url_pattern: Pattern = re.compile(
-            r"(?<!\]\()(https?://[a-zA-Z0-9\-\._~:/\?#\[\]@!\$&'()*\+,;=%]+)"
+        # Markdown link | raw URL in one alternation, so links are collected
+        # and stripped in a single scan
+        raw_url = r"(https?://[a-zA-Z0-9\-\._~:/\?#\[\]@!\$&'()*\+,;=%]+)"
+        self.link_pattern: Pattern = re.compile(
+            r"\[([^\]]+)\]\((https?://[^\s\)]+)\)|" + raw_url
         )
+        # URLs inside kept link text, e.g. [https://x.org](https://x.org/a)
+        self.raw_url_pattern: Pattern = re.compile(raw_url)
 
         # Spacing / trailing spaces
         self.spacing_pattern: Pattern = re.compile(r"\n{3,}")
@@ -79,16 +88,14 @@ class ResponseFormatter:
             "ª": "a", "º": "o",
         }
 
-        # Precompile a regex to replace mapping keys (escape keys properly)
-        # Sort keys by length desc to avoid partial match issues
-        map_keys_sorted = sorted(self._replacement_map.keys(), key=len, reverse=True)
-        # Build an alternation like (…|“|”|—|…)
-        alternation = "|".join(re.escape(k) for k in map_keys_sorted)
-        self._map_regex: Pattern = re.compile(f"(?:{alternation})")
+        # Every key is a single character, so the whole map applies in one
+        # C-level str.translate pass
+        self._map_table: Dict[int, str] = str.maketrans(self._replacement_map)
 
         # Control character categories to remove (except \n, \r, \t)
         # We'll filter by Unicode category: Cc (control), Cf (format) but allow \n \r \t
         # final removal performed in _remove_control_chars
+        self._allowed_ws_delete: Dict[int, None] = str.maketrans("", "", "\n\r\t")
 
     # -----------------------
     # Public API
@@ -143,7 +150,13 @@ class ResponseFormatter:
     # Internal helpers
     # -----------------------
     def _remove_prefixes(self, text: str) -> str:
-        return self.chatter_pattern.sub("", text).strip()
+        if not text[:12].lower().startswith(self._chatter_starts):
+            return text.strip()
+
+        match = self.chatter_pattern.match(text)
+        if match:
+            text = text[match.end():]
+        return text.strip()
 
     def _repair_encoding(self, text: str) -> str:
         """
@@ -163,19 +176,16 @@ class ResponseFormatter:
 
     def _replace_using_map(self, text: str) -> str:
         """
-        Replace characters found in _replacement_map using a regex
-        that matches any of the keys. Replacement is done via a lambda
-        to look up mapping.
+        Replace characters found in _replacement_map via the
+        precomputed translate table.
         """
-
-        def _repl(match):
-            ch = match.group(0)
-            return self._replacement_map.get(ch, ch)
-
-        # Use sub to replace each matched char/sequence
-        return self._map_regex.sub(_repl, text)
+        return text.translate(self._map_table)
 
     def _remove_control_chars(self, text: str) -> str:
+        # Fast path: nothing outside printable + \n\r\t means no 'C' chars
+        if text.translate(self._allowed_ws_delete).isprintable():
+            return text
+
         # Filter out characters whose Unicode category starts with 'C' (Other)
         # but keep \n, \r, \t
         allowed = {"\n", "\r", "\t"}
@@ -192,25 +202,25 @@ class ResponseFormatter:
         return "".join(filtered_chars)
 
     def _extract_and_group_links(self, text: str) -> str:
-        extracted_urls: List[str] = []
-
-        # replace markdown links with just the link text while collecting URLs
-        def md_replacer(match):
-            link_text, url = match.groups()
-            if url not in extracted_urls:
-                extracted_urls.append(url)
-            return link_text
+        # dict keeps first-seen order with O(1) dedup
+        extracted_urls: Dict[str, None] = {}
 
-        text = self.md_link_pattern.sub(md_replacer, text)
+        def url_remover(match):
+            extracted_urls.setdefault(match.group(1), None)
+            return ""
 
-        # find raw URLs that weren't part of markdown
-        raw_urls = self.raw_url_pattern.findall(text)
-        for url in raw_urls:
-            if url not in extracted_urls:
-                extracted_urls.append(url)
+        # markdown link -> its text, raw URL -> removed; URLs collected either way
+        def link_replacer(match):
+            link_text, md_url, raw_url = match.groups()
+            if md_url is not None:
+                extracted_urls.setdefault(md_url, None)
+                if "http" in link_text:
+                    return self.raw_url_pattern.sub(url_remover, link_text)
+                return link_text
+            extracted_urls.setdefault(raw_url, None)
+            return ""
 
-        # remove raw urls from body text
-        text = self.raw_url_pattern.sub("", text)
+        text = self.link_pattern.sub(link_replacer, text)
 
         if extracted_urls:
             links_block = "\n\nREFERENCES:\n" + "\n".join(f"- {url}" for url in extracted_urls)
@@ -0,0 +1,132 @@
+"""
+SmartChunk-RAG — Retrieval Cache
+
+Caches hybrid retrieval results keyed by the normalized query
+embedding. A lookup returns the stored results when the closest cached
+query has cosine similarity above the threshold; the LLM still runs on
+them, so answers stay fresh.
+
+Entries are evicted FIFO, expire after `ttl_seconds`, and the whole
+cache is dropped whenever the corpus epoch changes (ingestion /
+deletion). Callers capture the epoch
+before retrieving and pass it to store(), so results computed against
+the old corpus are never cached under the new epoch.
+"""
+
+import bisect
+import copy
+import threading
+import time
+from typing import Dict, Hashable, List, Optional
+
+import numpy as np
+
+from core.registry.corpus_epoch import get_corpus_epoch
+
+
+class RetrievalCache:
+
+    def __init__(
+        self,
+        max_size: int = 256,
+        similarity_threshold: float = 0.985,
+        ttl_seconds: Optional[float] = None
+    ):
+        self.max_size = max_size
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds if ttl_seconds and ttl_seconds > 0 else None
+
+        self._vectors: Optional[np.ndarray] = None      # (N, d)
+        self._values: List[List[Dict]] = []
+        self._stored_at: List[float] = []               # monotonic, oldest first
+        self._epoch = get_corpus_epoch()
+        self._lock = threading.Lock()
+
+    # ============================================================
+    # PUBLIC API
+    # ============================================================
+
+    def lookup(self, query_embedding: Optional[np.ndarray]) -> Optional[List[Dict]]:
+
+        if query_embedding is None:
+            return None
+
+        with self._lock:
+            self._check_epoch()
+            self._expire()
+
+            if not self._values:
+                return None
+
+            scores = self._vectors @ np.asarray(query_embedding, dtype=np.float32).ravel()
+            best = int(scores.argmax())
+
+            if scores[best] < self.similarity_threshold:
+                return None
+
+            return copy.deepcopy(self._values[best])
+
+    def store(
+        self,
+        query_embedding: Optional[np.ndarray],
+        results: List[Dict],
+        epoch: Optional[Hashable] = None
+    ) -> None:
+        """
+        `epoch` is get_corpus_epoch() taken before retrieval started; the
+        results are dropped if the corpus changed since.
+        """
+
+        if query_embedding is None or not results:
+            return
+
+        row = np.asarray(query_embedding, dtype=np.float32).reshape(1, -1)
+
+        with self._lock:
+            self._check_epoch()
+            if epoch is not None and epoch != self._epoch:
+                return
+
+            if self._vectors is None:
+                self._vectors = row
+            else:
+                self._vectors = np.vstack([self._vectors, row])
+            self._values.append(copy.deepcopy(results))
+            self._stored_at.append(time.monotonic())
+
+            overflow = len(self._values) - self.max_size
+            if overflow > 0:
+                self._drop_oldest(overflow)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._vectors = None
+            self._values = []
+            self._stored_at = []
+
+    # ============================================================
+    # INTERNAL
+    # ============================================================
+
+    def _check_epoch(self) -> None:
+        epoch = get_corpus_epoch()
+        if epoch != self._epoch:
+            self._vectors = None
+            self._values = []
+            self._stored_at = []
+            self._epoch = epoch
+
+    def _expire(self) -> None:
+        if self.ttl_seconds is None or not self._stored_at:
+            return
+
+        # Rows are appended in time order, so expired ones form a prefix.
+        cutoff = time.monotonic() - self.ttl_seconds
+        expired = bisect.bisect_left(self._stored_at, cutoff)
+        if expired:
+            self._drop_oldest(expired)
+
+    def _drop_oldest(self, count: int) -> None:
+        del self._values[:count]
+        del self._stored_at[:count]
+        self._vectors = self._vectors[count:] if self._values else None
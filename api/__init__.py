@@ -9,16 +9,33 @@ Usage:
     app = create_app()
 """
 
-from flask import Flask, jsonify
-from flask_cors import CORS
+from flask import Flask, Response, jsonify, request
 import logging
 import os
 import atexit
+import json
+import zlib
 
+# Try optional dependency for gzip/br response compression.
+try:
+    from flask_compress import Compress  # type: ignore
+    _HAS_COMPRESS = True
+except Exception:
+    _HAS_COMPRESS = False
+
+from api.json_provider import install_json_provider
 from database.app_store import init_db, upsert_admin_user
+from core.utils.http_session import get_http_session
 from core.utils.logging_utils import shutdown_logging
 
 
+# Static "/" ping body, serialized once
+_ROOT_BODY = json.dumps({"service": "SmartChunk-RAG API", "status": "running"}, separators=(",", ":")) + "\n"
+
+# Cap on a gzip-encoded request body after decompression (bytes)
+MAX_DECOMPRESSED_BODY = int(os.getenv("API_MAX_DECOMPRESSED_BODY", str(10 * 1024 * 1024)))
+
+
 # ============================================================
 # CREATE FLASK APP
 # ============================================================
@@ -27,6 +44,11 @@ def create_app():
 
     app = Flask(__name__)
 
+    # --------------------------------------------------------
+    # Native JSON (orjson) for jsonify / request.get_json
+    # --------------------------------------------------------
+    install_json_provider(app)
+
     # --------------------------------------------------------
     # Register Shutdown Handler for Graceful Logging Cleanup
     # --------------------------------------------------------
@@ -37,19 +59,37 @@ def create_app():
     # --------------------------------------------------------
     cors_origins_raw = os.getenv("CORS_ORIGINS", "*")
     cors_origins = (
-        [origin.strip() for origin in cors_origins_raw.split(",") if origin.strip()]
+        frozenset(origin.strip() for origin in cors_origins_raw.split(",") if origin.strip())
         if cors_origins_raw != "*"
-        else "*"
+        else None
     )
-    CORS(app, resources={r"/*": {"origins": cors_origins}})
+    _install_cors(app, cors_origins)
 
     # --------------------------------------------------------
-    # Basic Logging Configuration
+    # Basic Logging Configuration (first app only)
     # --------------------------------------------------------
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(message)s"
-    )
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format="%(asctime)s [%(levelname)s] %(message)s"
+        )
+
+    # --------------------------------------------------------
+    # Compression: gzip JSON responses, accept gzip request bodies
+    # --------------------------------------------------------
+    if _HAS_COMPRESS:
+        app.config.setdefault("COMPRESS_MIMETYPES", ["application/json"])
+        app.config.setdefault("COMPRESS_MIN_SIZE", 512)
+        # Leave NDJSON token streams unbuffered
+        app.config.setdefault("COMPRESS_STREAMS", False)
+        Compress(app)
+
+    _install_request_decompression(app)
+
+    # --------------------------------------------------------
+    # Shared HTTP Pool (keep-alive) for route handlers
+    # --------------------------------------------------------
+    app.extensions["http"] = get_http_session()
 
     # --------------------------------------------------------
     # Initialize DB
@@ -82,14 +122,69 @@ def create_app():
     # --------------------------------------------------------
     @app.route("/", methods=["GET"])
     def root():
-        return jsonify({
-            "service": "SmartChunk-RAG API",
-            "status": "running"
-        })
+        return Response(_ROOT_BODY, mimetype="application/json")
 
     return app
 
 
+_CORS_ALLOW_METHODS = "DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+
+
+def _install_cors(app, allowed_origins) -> None:
+    """
+    Minimal CORS for every route: echo the request Origin when it is
+    allowed (allowed_origins=None allows any), answer preflights with the
+    requested headers. Same headers Flask-CORS emitted with its defaults.
+    """
+
+    @app.after_request
+    def _add_cors_headers(response):
+        origin = request.headers.get("Origin")
+        if not origin:
+            return response
+
+        response.vary.add("Origin")
+
+        if allowed_origins is not None and origin not in allowed_origins:
+            return response
+
+        headers = response.headers
+        headers["Access-Control-Allow-Origin"] = origin
+
+        if request.method == "OPTIONS" and "Access-Control-Request-Method" in request.headers:
+            headers["Access-Control-Allow-Methods"] = _CORS_ALLOW_METHODS
+            requested_headers = request.headers.get("Access-Control-Request-Headers")
+            if requested_headers:
+                headers["Access-Control-Allow-Headers"] = requested_headers
+
+        return response
+
+
+def _install_request_decompression(app) -> None:
+    """
+    Decode `Content-Encoding: gzip` request bodies before handlers run,
+    so request.get_json() sees plain JSON.
+    """
+
+    @app.before_request
+    def _decompress_gzip_body():
+        if request.headers.get("Content-Encoding", "").lower() != "gzip":
+            return None
+
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        try:
+            body = decompressor.decompress(request.get_data(cache=False), MAX_DECOMPRESSED_BODY + 1)
+        except zlib.error:
+            return jsonify({"error": "invalid gzip body"}), 400
+
+        if len(body) > MAX_DECOMPRESSED_BODY or decompressor.unconsumed_tail:
+            return jsonify({"error": "request body too large"}), 413
+
+        # Werkzeug serves get_data()/get_json() from this cache
+        request._cached_data = body
+        return None
+
+
 def _bootstrap_admin_user() -> None:
     username = (os.getenv("ADMIN_NAME") or "").strip()
     email = (os.getenv("ADMIN_EMAIL") or "").strip().lower()
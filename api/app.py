@@ -4,12 +4,35 @@ SmartChunk-RAG — Flask API Entry Point
 Run:
     python -m api.app
 
+    With API_DEBUG=false this serves through gunicorn (gthread workers,
+    API_WORKERS x API_THREADS); Flask's threaded dev server is used only
+    for debug runs or where gunicorn is unavailable (Windows).
+
 Production:
-    gunicorn api.app:app
+    gunicorn -k gthread -w 2 --threads 8 api.app:app
+
+    Threaded workers share one copy of the embedding, reranker and LLM
+    connection pool per process; add workers only for CPU headroom.
+
+    API_WORKER_CLASS=gevent swaps threads for greenlets so one worker
+    can hold API_WORKER_CONNECTIONS requests waiting on the LLM. Model
+    inference still runs on the worker's single hub, so keep gthread
+    when embedding/reranking dominates.
 """
 
 import os
-from api import create_app
+
+WORKER_CLASS = os.getenv("API_WORKER_CLASS", "gthread")
+
+# gevent must patch sockets/threads before requests, neo4j, etc. import
+if WORKER_CLASS == "gevent":
+    try:
+        from gevent import monkey
+        monkey.patch_all()
+    except ImportError:
+        WORKER_CLASS = "gthread"
+
+from api import create_app  # noqa: E402
 
 
 # ============================================================
@@ -26,6 +49,43 @@ app = create_app()
 HOST = os.getenv("API_HOST", "0.0.0.0")
 PORT = int(os.getenv("API_PORT", 5000))
 DEBUG = os.getenv("API_DEBUG", "true").lower() == "true"
+WORKERS = int(os.getenv("API_WORKERS", 2))
+THREADS = int(os.getenv("API_THREADS", 8))
+WORKER_CONNECTIONS = int(os.getenv("API_WORKER_CONNECTIONS", 1000))
+
+
+# ============================================================
+# Production Server (gunicorn, optional)
+# ============================================================
+
+def _run_gunicorn() -> bool:
+    """
+    Serve the already-created app with gunicorn. Returns False when
+    gunicorn is not installed so the caller can fall back to Flask.
+    """
+
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        return False
+
+    class _StandaloneApplication(BaseApplication):
+
+        def load_config(self):
+            self.cfg.set("bind", f"{HOST}:{PORT}")
+            self.cfg.set("worker_class", WORKER_CLASS)
+            self.cfg.set("workers", WORKERS)
+            if WORKER_CLASS == "gevent":
+                self.cfg.set("worker_connections", WORKER_CONNECTIONS)
+            else:
+                self.cfg.set("threads", THREADS)
+            self.cfg.set("timeout", 180)
+
+        def load(self):
+            return app
+
+    _StandaloneApplication().run()
+    return True
 
 
 # ============================================================
@@ -43,6 +103,10 @@ if __name__ == "__main__":
     print("Access : http://localhost:5000")
     print("=" * 80 + "\n")
 
+    if not DEBUG and _run_gunicorn():
+        raise SystemExit(0)
+
+    # Development server only
     app.run(
         host=HOST,
         port=PORT,
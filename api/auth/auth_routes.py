@@ -11,25 +11,39 @@ Endpoints:
 - POST /auth/reset-password
 """
 
+import json
 import os
-import re
 import time
-from flask import g, jsonify, request
+from flask import Response, g, jsonify, request
 
 from api.auth import auth_blueprint
 from api.auth.middleware import require_auth
 from api.auth.jwt_handler import create_access_token, create_refresh_token, verify_token
 from api.auth.password_reset_service import create_reset_otp, invalidate_reset_otp, verify_reset_otp
 from api.auth.password_utils import hash_password, verify_password
-from database.app_store import create_user, get_user_by_email, get_user_by_identity, update_user_password
+from api.auth.user_cache import get_cached_user_by_email, invalidate_user
+from database.app_store import create_user, get_user_by_identity, update_user_password
 
 
-EMAIL_REGEX = re.compile(r"^[^\s@]+@[^\s@]+\.[^\s@]+$")
 DEV_SHOW_OTP = os.getenv("DEV_SHOW_OTP", "true").lower() == "true"
 
+# Static body for stateless logout, serialized once
+_LOGOUT_BODY = json.dumps({"status": "ok"}, separators=(",", ":")) + "\n"
+
 
 def _is_valid_email(value: str) -> bool:
-    return bool(value and EMAIL_REGEX.match(value))
+    """
+    Equivalent to ^[^\\s@]+@[^\\s@]+\\.[^\\s@]+$ using str methods: one '@'
+    with a non-empty local part, a '.' inside the domain, no whitespace.
+    """
+    if not value:
+        return False
+
+    at = value.find("@")
+    if at <= 0 or value.find("@", at + 1) != -1:
+        return False
+
+    return "." in value[at + 2:-1] and value.split() == [value]
 
 
 def _resolve_username(data: dict) -> str:
@@ -39,7 +53,7 @@ def _resolve_username(data: dict) -> str:
 @auth_blueprint.route("/register", methods=["POST"])
 def register():
     start_time = time.time()
-    data = request.get_json() or {}
+    data = request.get_json(silent=True) or {}
 
     username = _resolve_username(data)
     email = (data.get("email") or "").strip().lower()
@@ -80,13 +94,14 @@ def register():
 @auth_blueprint.route("/login", methods=["POST"])
 def login():
     start_time = time.time()
-    data = request.get_json() or {}
+    data = request.get_json(silent=True) or {}
 
     identity = (data.get("email") or data.get("username") or "").strip()
     password = data.get("password", "")
     if not identity or not password:
         return jsonify({"error": "email/username and password are required"}), 400
 
+    # Uncached: the password hash and role must reflect other workers' writes
     user = get_user_by_identity(identity)
     if not user or not verify_password(password, user["password_hash"]):
         return jsonify({"error": "Invalid credentials"}), 401
@@ -112,7 +127,7 @@ def login():
 
 @auth_blueprint.route("/refresh", methods=["POST"])
 def refresh():
-    data = request.get_json() or {}
+    data = request.get_json(silent=True) or {}
     refresh_token = (data.get("refresh_token") or "").strip()
     if not refresh_token:
         return jsonify({"error": "refresh_token is required"}), 400
@@ -132,7 +147,7 @@ def refresh():
 
 @auth_blueprint.route("/logout", methods=["POST"])
 def logout():
-    return jsonify({"status": "ok"}), 200
+    return Response(_LOGOUT_BODY, status=200, mimetype="application/json")
 
 
 @auth_blueprint.route("/me", methods=["GET"])
@@ -152,12 +167,12 @@ def me():
 @auth_blueprint.route("/forgot-password", methods=["POST"])
 @auth_blueprint.route("/forgot-password/request-otp", methods=["POST"])
 def forgot_password():
-    data = request.get_json() or {}
+    data = request.get_json(silent=True) or {}
     email = (data.get("email") or "").strip().lower()
     if not _is_valid_email(email):
         return jsonify({"error": "valid email is required"}), 400
 
-    user = get_user_by_email(email)
+    user = get_cached_user_by_email(email)
     if not user:
         return jsonify(
             {
@@ -185,7 +200,7 @@ def forgot_password():
 
 @auth_blueprint.route("/verify-otp", methods=["POST"])
 def verify_otp():
-    data = request.get_json() or {}
+    data = request.get_json(silent=True) or {}
     email = (data.get("email") or "").strip().lower()
     otp = (data.get("otp") or "").strip()
 
@@ -194,7 +209,7 @@ def verify_otp():
     if not otp:
         return jsonify({"error": "otp is required"}), 400
 
-    user = get_user_by_email(email)
+    user = get_cached_user_by_email(email)
     if not user:
         return jsonify({"error": "OTP expired or not found"}), 400
 
@@ -208,7 +223,7 @@ def verify_otp():
 @auth_blueprint.route("/reset-password", methods=["POST"])
 @auth_blueprint.route("/forgot-password/reset", methods=["POST"])
 def reset_password():
-    data = request.get_json() or {}
+    data = request.get_json(silent=True) or {}
     email = (data.get("email") or "").strip().lower()
     otp = (data.get("otp") or "").strip()
     new_password = data.get("new_password", "")
@@ -220,7 +235,7 @@ def reset_password():
     if not new_password or len(new_password) < 6:
         return jsonify({"error": "new_password must be at least 6 characters"}), 400
 
-    user = get_user_by_email(email)
+    user = get_cached_user_by_email(email)
     if not user:
         return jsonify({"error": "User not found"}), 404
 
@@ -229,6 +244,7 @@ def reset_password():
         return jsonify({"error": result}), 400
 
     updated = update_user_password(user_id=user["id"], password_hash=hash_password(new_password))
+    invalidate_user(user["id"])
     if not updated:
         return jsonify({"error": "User not found"}), 404
 
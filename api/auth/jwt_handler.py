@@ -11,9 +11,10 @@ Uses:
 - HS256 symmetric signing
 """
 
+import json
 import os
+import time
 import jwt
-from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
 
@@ -36,6 +37,11 @@ JWT_REFRESH_EXPIRATION_DAYS = int(os.getenv("JWT_REFRESH_EXPIRATION_DAYS", 7))
 if not JWT_SECRET:
     raise RuntimeError("JWT_SECRET must be set in environment variables.")
 
+# One preconfigured JWS codec + key bytes, reused for every encode/decode;
+# claims are serialized and checked here instead of by the PyJWT layer.
+_JWS = jwt.PyJWS(algorithms=[JWT_ALGORITHM])
+_KEY = JWT_SECRET.encode("utf-8")
+
 
 # ============================================================
 # CUSTOM EXCEPTIONS
@@ -56,9 +62,9 @@ class InvalidTokenError(Exception):
 # ============================================================
 
 def _encode_token(payload: dict) -> str:
-    token = jwt.encode(
-        payload,
-        JWT_SECRET,
+    token = _JWS.encode(
+        json.dumps(payload, separators=(",", ":")).encode("utf-8"),
+        _KEY,
         algorithm=JWT_ALGORITHM
     )
 
@@ -73,8 +79,8 @@ def create_access_token(user_id: str, username: str, role: str) -> str:
     Generate signed JWT access token.
     """
 
-    now = datetime.utcnow()
-    expiration = now + timedelta(minutes=JWT_EXPIRATION_MINUTES)
+    now = int(time.time())
+    expiration = now + JWT_EXPIRATION_MINUTES * 60
 
     payload = {
         "user_id": user_id,
@@ -88,8 +94,8 @@ def create_access_token(user_id: str, username: str, role: str) -> str:
 
 
 def create_refresh_token(user_id: str, username: str, role: str) -> str:
-    now = datetime.utcnow()
-    expiration = now + timedelta(days=JWT_REFRESH_EXPIRATION_DAYS)
+    now = int(time.time())
+    expiration = now + JWT_REFRESH_EXPIRATION_DAYS * 86400
     payload = {
         "user_id": user_id,
         "username": username,
@@ -113,11 +119,22 @@ def verify_token(token: str, expected_type: str | None = None) -> dict:
     """
 
     try:
-        payload = jwt.decode(
+        payload = json.loads(_JWS.decode(
             token,
-            JWT_SECRET,
+            _KEY,
             algorithms=[JWT_ALGORITHM]
-        )
+        ))
+
+        if not isinstance(payload, dict):
+            raise InvalidTokenError("Invalid token.")
+
+        expiration = payload.get("exp")
+
+        if not isinstance(expiration, (int, float)):
+            raise InvalidTokenError("Invalid token.")
+
+        if expiration <= time.time():
+            raise TokenExpiredError("Token has expired.")
 
         if expected_type and payload.get("token_type") != expected_type:
             raise InvalidTokenError("Invalid token type.")
@@ -127,5 +144,5 @@ def verify_token(token: str, expected_type: str | None = None) -> dict:
     except jwt.ExpiredSignatureError:
         raise TokenExpiredError("Token has expired.")
 
-    except jwt.InvalidTokenError:
+    except (jwt.InvalidTokenError, ValueError):
         raise InvalidTokenError("Invalid token.")
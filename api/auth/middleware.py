@@ -18,6 +18,7 @@ from api.auth.jwt_handler import (
 )
 
 from api.auth.role_permissions import has_permission
+from api.auth.verification_cache import cache_payload, get_cached_payload
 
 
 # ============================================================
@@ -55,7 +56,11 @@ def _authenticate_request():
         return None, ("Authorization token required", 401)
 
     try:
-        payload = verify_token(token, expected_type="access")
+        payload = get_cached_payload(token, "access")
+
+        if payload is None:
+            payload = verify_token(token, expected_type="access")
+            cache_payload(token, "access", payload)
 
         g.user = {
             "user_id": payload.get("user_id"),
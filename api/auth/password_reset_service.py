@@ -3,15 +3,20 @@ Password reset OTP service (no SMTP).
 
 Flow:
 - Generate OTP
-- Hash OTP and store in DB with expiration
+- HMAC the OTP (server-side pepper) and store in DB with expiration
 - Validate OTP for reset
 """
 
+import hashlib
+import hmac
 import os
 import secrets
+import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
-from api.auth.password_utils import hash_password, verify_password
+from api.auth.password_utils import verify_password
+from core.utils.logging_utils import get_component_logger
 from database.app_store import (
     create_otp_token,
     get_latest_active_otp_token,
@@ -23,6 +28,30 @@ from database.app_store import (
 OTP_TTL_MINUTES = int(os.getenv("PASSWORD_RESET_OTP_TTL_MINUTES", "5"))
 OTP_RATE_LIMIT_PER_HOUR = int(os.getenv("PASSWORD_RESET_OTP_RATE_LIMIT_PER_HOUR", "3"))
 
+logger = get_component_logger("api.password_reset", component="ingestion")
+
+
+def _load_otp_pepper() -> bytes:
+    """
+    HMAC key for OTP hashes. OTP_PEPPER is required; deployments that
+    predate it get a key derived from JWT_SECRET under its own label, so
+    the JWT signing key itself is never reused for OTPs.
+    """
+    pepper = os.getenv("OTP_PEPPER")
+    if pepper:
+        return pepper.encode("utf-8")
+
+    jwt_secret = os.getenv("JWT_SECRET")
+    if not jwt_secret:
+        raise RuntimeError("OTP_PEPPER must be set in environment variables.")
+
+    logger.warning("OTP_PEPPER is not set; deriving the OTP key from JWT_SECRET. Set OTP_PEPPER.")
+    return hmac.new(jwt_secret.encode("utf-8"), b"otp-pepper", hashlib.sha256).digest()
+
+
+# OTPs are random and short-lived, so a keyed SHA-256 replaces bcrypt here
+OTP_PEPPER = _load_otp_pepper()
+
 
 def _now_utc() -> datetime:
     return datetime.now(timezone.utc)
@@ -32,9 +61,27 @@ def _build_otp() -> str:
     return f"{secrets.randbelow(900000) + 100000}"
 
 
-def _is_expired(expires_at_iso: str) -> bool:
-    expires_at = datetime.fromisoformat(expires_at_iso)
-    return expires_at <= _now_utc()
+@lru_cache(maxsize=1024)
+def _iso_to_epoch(expires_at_iso: str) -> float:
+    return datetime.fromisoformat(expires_at_iso).timestamp()
+
+
+def _is_expired(expires_at) -> bool:
+    # Epoch numbers compare directly; ISO strings are parsed once per token
+    if isinstance(expires_at, (int, float)):
+        return expires_at <= time.time()
+    return _iso_to_epoch(expires_at) <= time.time()
+
+
+def _hash_otp(otp: str) -> str:
+    return hmac.new(OTP_PEPPER, otp.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def _otp_matches(otp: str, otp_hash: str) -> bool:
+    # Tokens issued before the HMAC switch are bcrypt hashes
+    if otp_hash.startswith("$2"):
+        return verify_password(otp, otp_hash)
+    return hmac.compare_digest(_hash_otp(otp), otp_hash)
 
 
 def create_reset_otp(user_id: str) -> tuple[str, str]:
@@ -45,7 +92,7 @@ def create_reset_otp(user_id: str) -> tuple[str, str]:
 
     otp = _build_otp()
     expires_at = (_now_utc() + timedelta(minutes=OTP_TTL_MINUTES)).isoformat()
-    otp_hash = hash_password(otp)
+    otp_hash = _hash_otp(otp)
 
     create_otp_token(
         user_id=user_id,
@@ -64,7 +111,7 @@ def verify_reset_otp(user_id: str, otp: str) -> tuple[bool, str]:
     if _is_expired(token["expires_at"]):
         return False, "OTP expired"
 
-    if not verify_password(otp, token["otp_hash"]):
+    if not _otp_matches(otp, token["otp_hash"]):
         return False, "Invalid OTP"
 
     return True, token["id"]
@@ -5,11 +5,32 @@ Responsibilities:
 - Hash passwords securely
 - Verify passwords safely
 - Use bcrypt (recommended for production)
+- Cap concurrent bcrypt computations (BCRYPT_MAX_CONCURRENCY)
 """
 
+import os
+import threading
+
 import bcrypt
 
 
+# ============================================================
+# BCRYPT CONCURRENCY CAP
+# ============================================================
+
+# bcrypt releases the GIL while hashing, so calls already run in parallel
+# on the request threads; nothing is offloaded. The semaphore only caps
+# how many run at once, so a burst of logins cannot take every core away
+# from other requests.
+BCRYPT_MAX_CONCURRENCY = int(os.getenv("BCRYPT_MAX_CONCURRENCY", str(os.cpu_count() or 4)))
+
+# Cost factor for new hashes (existing hashes carry their own); each -1
+# halves hashing time. 12 is bcrypt's default.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+_bcrypt_slots = threading.BoundedSemaphore(max(1, BCRYPT_MAX_CONCURRENCY))
+
+
 # ============================================================
 # HASH PASSWORD
 # ============================================================
@@ -24,10 +45,11 @@ def hash_password(password: str) -> str:
         raise ValueError("Password cannot be empty")
 
     # Generate salt automatically
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
 
     # Hash password
-    hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
+    with _bcrypt_slots:
+        hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
 
     return hashed.decode("utf-8")
 
@@ -45,9 +67,10 @@ def verify_password(password: str, password_hash: str) -> bool:
         return False
 
     try:
-        return bcrypt.checkpw(
-            password.encode("utf-8"),
-            password_hash.encode("utf-8")
-        )
+        with _bcrypt_slots:
+            return bcrypt.checkpw(
+                password.encode("utf-8"),
+                password_hash.encode("utf-8")
+            )
     except Exception:
         return False
\ No newline at end of file
@@ -45,15 +45,16 @@ ROLE_PERMISSIONS = {
 # PERMISSION CHECK HELPER
 # ============================================================
 
+# Roles satisfying each required role, precomputed from ROLE_HIERARCHY
+_ALLOWED_ROLES = {
+    required: frozenset(role for role, level in ROLE_HIERARCHY.items() if level >= required_level)
+    for required, required_level in ROLE_HIERARCHY.items()
+}
+
+
 def has_permission(user_role: str, required_role: str) -> bool:
     """
     Check if user's role satisfies required role.
     """
 
-    if user_role not in ROLE_HIERARCHY:
-        return False
-
-    if required_role not in ROLE_HIERARCHY:
-        return False
-
-    return ROLE_HIERARCHY[user_role] >= ROLE_HIERARCHY[required_role]
\ No newline at end of file
+    return user_role in _ALLOWED_ROLES.get(required_role, ())
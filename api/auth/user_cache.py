@@ -0,0 +1,91 @@
+"""
+SmartChunk-RAG — Auth User Lookup Cache
+
+Short-TTL LRU in front of the email -> user lookups made by the OTP
+request/verify and password reset routes, so retries by the same user
+skip the DB round trip.
+
+Only identity fields (id, username, email) are kept: password hashes and
+roles are always read fresh, since invalidate_user() only reaches the
+local worker. Login therefore queries the store directly.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+from database.app_store import get_user_by_email
+
+
+# ============================================================
+# CONFIGURATION
+# ============================================================
+
+USER_CACHE_TTL = float(os.getenv("USER_CACHE_TTL", "30"))
+USER_CACHE_MAX = int(os.getenv("USER_CACHE_MAX", "5000"))
+
+# Non-credential fields safe to serve stale for USER_CACHE_TTL
+_CACHED_FIELDS = ("id", "username", "email")
+
+
+_cache: "OrderedDict[Tuple[str, str], Tuple[float, dict]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _identity_fields(user: Optional[dict]) -> Optional[dict]:
+    if not user:
+        return None
+    return {field: user.get(field) for field in _CACHED_FIELDS}
+
+
+def _cached_lookup(kind: str, value: str, loader: Callable[[str], Optional[dict]]) -> Optional[dict]:
+
+    if USER_CACHE_TTL <= 0:
+        return _identity_fields(loader(value))
+
+    key = (kind, value)
+    now = time.time()
+
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is not None:
+            expires_at, user = entry
+            if expires_at > now:
+                _cache.move_to_end(key)
+                return user
+            del _cache[key]
+
+    user = _identity_fields(loader(value))
+
+    if user:
+        with _cache_lock:
+            _cache[key] = (now + USER_CACHE_TTL, user)
+            _cache.move_to_end(key)
+            while len(_cache) > USER_CACHE_MAX:
+                _cache.popitem(last=False)
+
+    return user
+
+
+# ============================================================
+# PUBLIC API
+# ============================================================
+
+def get_cached_user_by_email(email: str) -> Optional[dict]:
+    """
+    {id, username, email} for `email`, or None; never credentials/role.
+    """
+    return _cached_lookup("email", email, get_user_by_email)
+
+
+def invalidate_user(user_id: str) -> None:
+    """
+    Drop every cached row for a user (call after updating it).
+    """
+
+    with _cache_lock:
+        stale = [key for key, (_, user) in _cache.items() if user.get("id") == user_id]
+        for key in stale:
+            del _cache[key]
@@ -0,0 +1,90 @@
+"""
+SmartChunk-RAG — JWT Verification Cache
+
+Short-TTL LRU of verified token payloads so a client reusing the same
+access token skips JWT decoding on every request.
+
+Keys are (sha256(token), expected_type); raw bearer tokens are never kept
+in memory. Entries expire after JWT_CACHE_TTL seconds or at the token's
+own `exp`, whichever comes first.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+
+# ============================================================
+# CONFIGURATION
+# ============================================================
+
+JWT_CACHE_TTL = float(os.getenv("JWT_CACHE_TTL", "5"))
+JWT_CACHE_MAX = int(os.getenv("JWT_CACHE_MAX", "10000"))
+
+
+_cache: "OrderedDict[Tuple[bytes, Optional[str]], Tuple[float, dict]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _key(token: str, expected_type: Optional[str]) -> Tuple[bytes, Optional[str]]:
+    return hashlib.sha256(token.encode("utf-8")).digest(), expected_type
+
+
+# ============================================================
+# PUBLIC API
+# ============================================================
+
+def get_cached_payload(token: str, expected_type: Optional[str]) -> Optional[dict]:
+    """
+    Return the cached payload for a previously verified token, or None.
+    """
+
+    if JWT_CACHE_TTL <= 0:
+        return None
+
+    key = _key(token, expected_type)
+    now = time.time()
+
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is None:
+            return None
+
+        expires_at, payload = entry
+        if expires_at <= now:
+            del _cache[key]
+            return None
+
+        _cache.move_to_end(key)
+        return payload
+
+
+def cache_payload(token: str, expected_type: Optional[str], payload: dict) -> None:
+    """
+    Remember a successfully verified payload.
+    """
+
+    if JWT_CACHE_TTL <= 0:
+        return
+
+    expires_at = time.time() + JWT_CACHE_TTL
+
+    token_exp = payload.get("exp")
+    if isinstance(token_exp, (int, float)):
+        expires_at = min(expires_at, float(token_exp))
+
+    key = _key(token, expected_type)
+
+    with _cache_lock:
+        _cache[key] = (expires_at, payload)
+        _cache.move_to_end(key)
+        while len(_cache) > JWT_CACHE_MAX:
+            _cache.popitem(last=False)
+
+
+def clear_verification_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
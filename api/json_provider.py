@@ -0,0 +1,64 @@
+"""
+SmartChunk-RAG — orjson-backed Flask JSON Provider
+
+Routes `jsonify`, `request.get_json()` and `app.json` through orjson when
+it is installed; falls back to Flask's stdlib provider otherwise, or
+whenever a call passes formatting options orjson does not support
+(e.g. debug-mode pretty printing).
+
+Output matches the default provider: keys sorted, datetimes rendered by
+Flask's own default() (HTTP date), numpy scalars/arrays serialized.
+"""
+
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+# Try optional dependency for native JSON encode/decode.
+try:
+    import orjson  # type: ignore
+    _HAS_ORJSON = True
+except Exception:
+    _HAS_ORJSON = False
+
+
+class OrjsonProvider(DefaultJSONProvider):
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+
+        # response() passes compact separators, or indent=2 in debug mode;
+        # anything else goes to the stdlib encoder untouched
+        extra = kwargs.keys() - {"separators", "indent"}
+        if (
+            extra
+            or kwargs.get("separators", (",", ":")) != (",", ":")
+            or kwargs.get("indent", 2) != 2
+        ):
+            return super().dumps(obj, **kwargs)
+
+        if "indent" in kwargs:
+            option |= orjson.OPT_INDENT_2
+
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+
+        return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+
+def install_json_provider(app) -> None:
+    """
+    Switch the app to OrjsonProvider when orjson is available.
+    """
+
+    if _HAS_ORJSON:
+        app.json = OrjsonProvider(app)
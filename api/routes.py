@@ -7,23 +7,27 @@ Includes:
 - admin APIs (RBAC)
 """
 
+import json
 import os
+import threading
 import time
 import uuid
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Optional
 
-from flask import g, jsonify, request
+from flask import Response, g, jsonify, request, stream_with_context
 from werkzeug.utils import secure_filename
 
-from answering.answering_agent import AnsweringAgent
+from answering.answering_agent import AnsweringAgent, get_retriever
+from api.semantic_cache import cached_retrieve
 from api.auth.middleware import require_auth, require_role
 from memory.memory_wrapper import MemoryWrappedAnsweringAgent
-from retriever.orchestrator import RetrieverOrchestrator
+from pipelines.full_ingestion_pipeline import FullIngestionPipeline
 from core.registry.document_registry import DocumentRegistry
-from core.vector.store import ChromaStore
-from core.graph.store import GraphStore
+from core.registry.corpus_epoch import bump_corpus_epoch
+from core.vector.store import get_chroma_store
+from core.graph.store import get_graph_store
 from core.utils.logging_utils import get_component_logger
 
 from database.app_store import (
@@ -44,42 +48,102 @@ ADMIN_UPLOAD_DIR = PROJECT_ROOT / "data" / "uploads"
 ALLOWED_UPLOAD_EXTENSIONS = {".pdf"}
 logger = get_component_logger("api.routes", component="ingestion")
 
+# abspath -> ((mtime_ns, size), doc_id) for PDFs ingested by this process
+_ingested_files: dict = {}
+_ingested_lock = threading.Lock()
+
+
+# (output key, citation key) per nested block; None values are omitted
+_CITATION_DOCUMENT_FIELDS = (("doc_id", "doc_id"), ("name", "document_name"))
+_CITATION_LOCATION_FIELDS = (
+    ("page_label", "page_label"),
+    ("page_physical", "page_physical"),
+    ("chapter", "chapter"),
+    ("subheading", "subheading"),
+)
+_CITATION_IDS = tuple(f"CIT-{index:03d}" for index in range(1, 33))
+
+
+def _citation_id(index: int) -> str:
+    return _CITATION_IDS[index - 1] if index <= len(_CITATION_IDS) else f"CIT-{index:03d}"
+
 
 def _structured_citations(citations: list[dict]) -> list[dict]:
+    if not citations:
+        return []
+
     structured = []
-    for index, c in enumerate(citations or [], start=1):
-        structured.append(
-            {
-                "id": f"CIT-{index:03d}",
-                "document": {
-                    "doc_id": c.get("doc_id"),
-                    "name": c.get("document_name"),
-                },
-                "location": {
-                    "page_label": c.get("page_label"),
-                    "page_physical": c.get("page_physical"),
-                    "chapter": c.get("chapter"),
-                    "subheading": c.get("subheading"),
-                },
-                "chunk_id": c.get("chunk_id"),
-                "source": c.get("source"),
-                "raw": c,
-            }
-        )
+    for index, c in enumerate(citations, start=1):
+        entry = {
+            "id": _citation_id(index),
+            "document": {
+                key: value
+                for key, source_key in _CITATION_DOCUMENT_FIELDS
+                if (value := c.get(source_key)) is not None
+            },
+            "location": {
+                key: value
+                for key, source_key in _CITATION_LOCATION_FIELDS
+                if (value := c.get(source_key)) is not None
+            },
+        }
+        chunk_id = c.get("chunk_id")
+        if chunk_id is not None:
+            entry["chunk_id"] = chunk_id
+        source = c.get("source")
+        if source is not None:
+            entry["source"] = source
+        entry["raw"] = c
+        structured.append(entry)
     return structured
 
 
+# Static liveness body, serialized once (fresh Response per request, since
+# after_request hooks mutate headers)
+_HEALTH_BODY = json.dumps({"service": "SmartChunk-RAG API", "status": "ok"}, separators=(",", ":")) + "\n"
+
+
+def _conditional_json(payload: dict):
+    """
+    jsonify() with an ETag over the body; a matching If-None-Match gets
+    an empty 304 instead of the payload.
+    """
+    response = jsonify(payload)
+    response.add_etag()
+    # Per-user data: browsers may keep it but must revalidate every time
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response.make_conditional(request)
+
+
 def _run_ingestion(pdf_path: str) -> dict:
     start_time = time.time()
 
-    from pipelines.full_ingestion_pipeline import FullIngestionPipeline
+    # Same file, unchanged on disk and still registered: nothing to redo
+    stat = os.stat(pdf_path)
+    fingerprint = (stat.st_mtime_ns, stat.st_size)
+    cache_key = os.path.abspath(pdf_path)
+    with _ingested_lock:
+        cached = _ingested_files.get(cache_key)
+
+    if cached and cached[0] == fingerprint and DocumentRegistry().fetch_by_doc_id(cached[1]):
+        return {
+            "pdf_path": pdf_path,
+            "document_id": cached[1],
+            "ingestion_time_seconds": round(time.time() - start_time, 4),
+            "already_ingested": True,
+        }
 
     pipeline = FullIngestionPipeline(pdf_path)
     pipeline.run()
 
+    document_id = getattr(getattr(pipeline, "vector_orch", None), "document_id", None)
+    if document_id:
+        with _ingested_lock:
+            _ingested_files[cache_key] = (fingerprint, document_id)
+
     return {
         "pdf_path": pdf_path,
-        "document_id": getattr(getattr(pipeline, "vector_orch", None), "document_id", None),
+        "document_id": document_id,
         "ingestion_time_seconds": round(time.time() - start_time, 4),
     }
 
@@ -99,7 +163,7 @@ def _compute_admin_statistics() -> dict:
 
     vector_chunks_count = 0
     try:
-        vector_store = ChromaStore()
+        vector_store = get_chroma_store()
         if vector_store.collection is not None:
             vector_chunks_count = int(vector_store.collection.count())
     except Exception:
@@ -114,20 +178,22 @@ def _compute_admin_statistics() -> dict:
 
 
 def _delete_indexed_document(doc_id: str, source_path: Optional[str]) -> dict:
+    with _ingested_lock:
+        for path in [p for p, (_, d) in _ingested_files.items() if d == doc_id]:
+            del _ingested_files[path]
+
     vector_deleted = False
     graph_deleted = False
     source_deleted = False
 
-    vector_store = ChromaStore()
+    vector_store = get_chroma_store()
     vector_store.delete_document(doc_id)
     vector_deleted = True
 
-    graph_store = GraphStore()
-    try:
-        graph_store.delete_document(doc_id)
-        graph_deleted = True
-    finally:
-        graph_store.close()
+    get_graph_store().delete_document(doc_id)
+    graph_deleted = True
+
+    bump_corpus_epoch()
 
     if source_path:
         source_file = Path(source_path)
@@ -149,12 +215,12 @@ def register_routes(app):
 
     @app.route("/health", methods=["GET"])
     def health():
-        return jsonify({"status": "ok", "service": "SmartChunk-RAG API"})
+        return Response(_HEALTH_BODY, mimetype="application/json")
 
     @app.route("/ingest", methods=["POST"])
     @require_role("admin")
     def ingest():
-        data = request.get_json()
+        data = request.get_json(silent=True) or {}
 
         if not data:
             return jsonify({"error": "JSON body required"}), 400
@@ -325,7 +391,7 @@ def register_routes(app):
     def admin_bulk_delete_documents():
         admin_user = (getattr(g, "user", None) or {})
         admin_id = admin_user.get("user_id")
-        data = request.get_json() or {}
+        data = request.get_json(silent=True) or {}
         doc_ids_raw = data.get("doc_ids")
 
         if not isinstance(doc_ids_raw, list) or len(doc_ids_raw) == 0:
@@ -414,7 +480,7 @@ def register_routes(app):
     @require_role("admin")
     def admin_retrieve_chunks():
         start_time = time.time()
-        data = request.get_json() or {}
+        data = request.get_json(silent=True) or {}
 
         query = (data.get("query") or "").strip()
         mode = (data.get("mode") or "hybrid").strip().lower()
@@ -447,7 +513,7 @@ def register_routes(app):
             return jsonify({"error": "filters must be an object"}), 400
 
         try:
-            retriever = RetrieverOrchestrator()
+            retriever = get_retriever()
             results = retriever.retrieve(
                 query=query,
                 mode=mode,
@@ -517,7 +583,7 @@ def register_routes(app):
     @app.route("/retrieve", methods=["POST"])
     def retrieve():
         start_time = time.time()
-        data = request.get_json()
+        data = request.get_json(silent=True) or {}
 
         if not data:
             return jsonify({"error": "JSON body required"}), 400
@@ -529,8 +595,7 @@ def register_routes(app):
             return jsonify({"error": "query required"}), 400
 
         try:
-            retriever = RetrieverOrchestrator()
-            results = retriever.retrieve(query=query, mode=mode, top_k=top_k)
+            results = cached_retrieve(query=query, mode=mode, top_k=top_k)
             total_time = round(time.time() - start_time, 4)
             return jsonify(
                 {
@@ -544,9 +609,35 @@ def register_routes(app):
         except Exception as exc:
             return jsonify({"error": str(exc)}), 500
 
+    def _resolve_chat_thread(query: str, requested_thread_id: str):
+        """
+        Returns (thread_id, None) or (None, error response).
+        """
+        user_id = g.user["user_id"]
+        user_role = g.user["role"]
+
+        if requested_thread_id:
+            if user_role != "admin" and not thread_belongs_to_user(requested_thread_id, user_id):
+                return None, (jsonify({"error": "thread access denied"}), 403)
+            try:
+                return create_thread(user_id=user_id, thread_id=requested_thread_id, title=query), None
+            except ValueError:
+                return None, (jsonify({"error": "thread access denied"}), 403)
+
+        return create_thread(user_id=user_id, title=query), None
+
+    def _save_chat_turn(thread_id: str, query: str, assistant_response: str, citations: list):
+        save_message(thread_id=thread_id, role="user", content=query)
+        save_message(
+            thread_id=thread_id,
+            role="assistant",
+            content=assistant_response,
+            citations=citations,
+        )
+
     def _handle_chat_ask():
         start_time = time.time()
-        data = request.get_json() or {}
+        data = request.get_json(silent=True) or {}
 
         query = (data.get("query") or "").strip()
         requested_thread_id = (data.get("thread_id") or "").strip()
@@ -554,17 +645,10 @@ def register_routes(app):
             return jsonify({"error": "query required"}), 400
 
         user_id = g.user["user_id"]
-        user_role = g.user["role"]
 
-        if requested_thread_id:
-            if user_role != "admin" and not thread_belongs_to_user(requested_thread_id, user_id):
-                return jsonify({"error": "thread access denied"}), 403
-            try:
-                thread_id = create_thread(user_id=user_id, thread_id=requested_thread_id, title=query)
-            except ValueError:
-                return jsonify({"error": "thread access denied"}), 403
-        else:
-            thread_id = create_thread(user_id=user_id, title=query)
+        thread_id, error = _resolve_chat_thread(query, requested_thread_id)
+        if error:
+            return error
 
         try:
             result = agent.answer(user_id=user_id, query=query, thread_id=thread_id)
@@ -574,13 +658,7 @@ def register_routes(app):
         assistant_response = result.get("response", "") or ""
         citations = _structured_citations(result.get("citations", []) or [])
 
-        save_message(thread_id=thread_id, role="user", content=query)
-        save_message(
-            thread_id=thread_id,
-            role="assistant",
-            content=assistant_response,
-            citations=citations,
-        )
+        _save_chat_turn(thread_id, query, assistant_response, citations)
 
         total_time = round(time.time() - start_time, 4)
         return jsonify(
@@ -598,16 +676,94 @@ def register_routes(app):
     def chat_ask():
         return _handle_chat_ask()
 
+    def _ndjson_line(payload: dict) -> str:
+        # app.json is orjson-backed when available (api/json_provider.py)
+        return app.json.dumps(payload) + "\n"
+
+    def _handle_chat_ask_stream():
+        start_time = time.time()
+        data = request.get_json(silent=True) or {}
+
+        query = (data.get("query") or "").strip()
+        requested_thread_id = (data.get("thread_id") or "").strip()
+        if not query:
+            return jsonify({"error": "query required"}), 400
+
+        user_id = g.user["user_id"]
+
+        thread_id, error = _resolve_chat_thread(query, requested_thread_id)
+        if error:
+            return error
+
+        def generate():
+            for event in agent.answer_stream(user_id=user_id, query=query, thread_id=thread_id):
+
+                event_type = event.get("type")
+
+                if event_type == "citations":
+                    yield _ndjson_line(
+                        {
+                            "type": "citations",
+                            "citations": _structured_citations(event.get("citations", []) or []),
+                        }
+                    )
+                    continue
+
+                if event_type != "final":
+                    yield _ndjson_line(event)
+                    continue
+
+                assistant_response = event.get("response", "") or ""
+                citations = _structured_citations(event.get("citations", []) or [])
+
+                _save_chat_turn(thread_id, query, assistant_response, citations)
+
+                yield _ndjson_line(
+                    {
+                        "type": "final",
+                        "query": query,
+                        "thread_id": thread_id,
+                        "latency_seconds": round(time.time() - start_time, 4),
+                        "response": assistant_response,
+                        "citations": citations,
+                    }
+                )
+
+        return Response(
+            stream_with_context(generate()),
+            mimetype="application/x-ndjson",
+            headers={"X-Accel-Buffering": "no", "Cache-Control": "no-cache"},
+        )
+
+    def _wants_stream() -> bool:
+        if request.args.get("stream") in ("1", "true"):
+            return True
+        return request.accept_mimetypes.best == "application/x-ndjson"
+
+    @app.route("/chat/ask/stream", methods=["POST"])
+    @require_auth
+    def chat_ask_stream():
+        """
+        NDJSON stream: an early {"type": "citations"} line once sources are
+        ready, {"type": "token", "text"} lines while the LLM decodes, then
+        one {"type": "final", ...} line shaped like /chat/ask.
+        """
+        return _handle_chat_ask_stream()
+
     # Backward-compatible endpoint.
     @app.route("/answer", methods=["POST"])
     @require_auth
     def answer():
+        # Streams like /chat/ask/stream when asked via ?stream=1 or
+        # Accept: application/x-ndjson; plain JSON otherwise.
+        if _wants_stream():
+            return _handle_chat_ask_stream()
         return _handle_chat_ask()
 
     @app.route("/chat/threads", methods=["GET"])
     @require_auth
     def chat_threads():
-        return jsonify({"threads": get_user_threads(g.user["user_id"])})
+        return _conditional_json({"threads": get_user_threads(g.user["user_id"])})
 
     @app.route("/chat/threads/<thread_id>", methods=["DELETE"])
     @require_auth
@@ -631,7 +787,7 @@ def register_routes(app):
         user_id = g.user["user_id"]
         if g.user["role"] != "admin" and not thread_belongs_to_user(thread_id, user_id):
             return jsonify({"error": "thread access denied"}), 403
-        return jsonify({"thread_id": thread_id, "messages": get_thread_messages(thread_id)})
+        return _conditional_json({"thread_id": thread_id, "messages": get_thread_messages(thread_id)})
 
     @app.route("/admin/users", methods=["GET"])
     @require_role("admin")
@@ -0,0 +1,96 @@
+"""
+SmartChunk-RAG — Semantic Cache for /retrieve
+
+Near-duplicate queries (cosine >= threshold on the normalized query
+embedding) are served from memory instead of re-running vector, graph
+and rerank. One RetrievalCache per request shape (mode, top_k, ...), so
+results are never shared across different parameters.
+
+/chat/ask and /answer are already covered by the AnsweringAgent's
+retrieval and answer caches.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional
+
+from answering.answering_agent import get_retriever, get_router, query_embedding_shareable
+from answering.retrieval_cache import RetrievalCache
+from core.registry.corpus_epoch import get_corpus_epoch
+from core.utils.logging_utils import get_component_logger
+
+
+logger = get_component_logger("SemanticCache", component="retrieval")
+
+RETRIEVE_CACHE_SIZE = int(os.getenv("RETRIEVE_CACHE_SIZE", "2048"))
+RETRIEVE_CACHE_SIMILARITY = float(os.getenv("RETRIEVE_CACHE_SIMILARITY", "0.985"))
+# Entry lifetime; 0 disables expiry (corpus-epoch invalidation still applies)
+RETRIEVE_CACHE_TTL_SECONDS = float(os.getenv("RETRIEVE_CACHE_TTL_SECONDS", "600"))
+
+# Distinct (mode, top_k, initial_k, filters) shapes kept at once
+MAX_NAMESPACES = 32
+
+
+_caches: "OrderedDict[Hashable, RetrievalCache]" = OrderedDict()
+_caches_lock = threading.Lock()
+
+
+def _get_cache(namespace: Hashable) -> RetrievalCache:
+    with _caches_lock:
+        cache = _caches.get(namespace)
+        if cache is None:
+            cache = RetrievalCache(
+                max_size=RETRIEVE_CACHE_SIZE,
+                similarity_threshold=RETRIEVE_CACHE_SIMILARITY,
+                ttl_seconds=RETRIEVE_CACHE_TTL_SECONDS
+            )
+            _caches[namespace] = cache
+            while len(_caches) > MAX_NAMESPACES:
+                _caches.popitem(last=False)
+        _caches.move_to_end(namespace)
+        return cache
+
+
+# ============================================================
+# PUBLIC API
+# ============================================================
+
+def cached_retrieve(
+    query: str,
+    mode: str = "hybrid",
+    top_k: int = 8,
+    initial_k: int = 15,
+    filters: Optional[Dict] = None
+) -> List[Dict]:
+    """
+    RetrieverOrchestrator.retrieve() behind a per-shape semantic cache.
+    """
+
+    namespace = (mode, top_k, initial_k, json.dumps(filters, sort_keys=True, default=str) if filters else None)
+    cache = _get_cache(namespace)
+
+    try:
+        query_embedding = get_router().encode_query(query)
+    except Exception:
+        logger.exception("Query embedding failed — retrieving uncached")
+        query_embedding = None
+
+    results = cache.lookup(query_embedding)
+    if results is not None:
+        logger.info("Semantic retrieve cache hit (mode=%s top_k=%s)", mode, top_k)
+        return results
+
+    epoch = get_corpus_epoch()
+    results = get_retriever().retrieve(
+        query=query,
+        mode=mode,
+        top_k=top_k,
+        initial_k=initial_k,
+        filters=filters,
+        query_embedding=query_embedding if query_embedding_shareable() else None,
+    )
+
+    cache.store(query_embedding, results, epoch=epoch)
+    return results
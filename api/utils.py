@@ -14,14 +14,40 @@ Utility helpers for:
 import re
 import os
 import json
-import hashlib
+from functools import lru_cache
 from typing import List, Dict
 
+from core.utils.file_hash import sha256_file
+
+# Try optional dependency for native JSON serialization.
+try:
+    import orjson  # type: ignore
+    _HAS_ORJSON = True
+except Exception:
+    _HAS_ORJSON = False
+
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_FAKE_CITATION_RE = re.compile(r'\[\d+\]')
+_HEX16_RE = re.compile(r'[0-9a-fA-F]{16}')
+
 
 # ============================================================
 # UNICODE CLEANER
 # ============================================================
 
+# Normalize quotes and dashes (single-character maps → one translate pass)
+_UNICODE_TABLE = str.maketrans({
+    "–": "-",
+    "—": "-",
+    "“": '"',
+    "”": '"',
+    "‘": "'",
+    "’": "'",
+    "\u00a0": " "
+})
+
+
 def clean_unicode(text: str) -> str:
     """
     Normalize Unicode and remove problematic characters.
@@ -30,21 +56,7 @@ def clean_unicode(text: str) -> str:
     if not text:
         return ""
 
-    # Normalize quotes and dashes
-    replacements = {
-        "–": "-",
-        "—": "-",
-        "“": '"',
-        "”": '"',
-        "‘": "'",
-        "’": "'",
-        "\u00a0": " "
-    }
-
-    for k, v in replacements.items():
-        text = text.replace(k, v)
-
-    return text.strip()
+    return text.translate(_UNICODE_TABLE).strip()
 
 
 # ============================================================
@@ -59,7 +71,7 @@ def normalize_whitespace(text: str) -> str:
     if not text:
         return ""
 
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     return text.strip()
 
 
@@ -82,6 +94,7 @@ def text_preview(text: str, limit: int = 500) -> str:
 # DOC ID VALIDATION
 # ============================================================
 
+@lru_cache(maxsize=8192)
 def is_hex_doc_id(doc_id: str) -> bool:
     """
     Check if doc_id is a 16-character hexadecimal string.
@@ -90,7 +103,7 @@ def is_hex_doc_id(doc_id: str) -> bool:
     if not doc_id:
         return False
 
-    return bool(re.fullmatch(r'[0-9a-fA-F]{16}', doc_id))
+    return bool(_HEX16_RE.fullmatch(doc_id))
 
 
 # ============================================================
@@ -105,10 +118,7 @@ def generate_doc_id_from_path(path: str) -> str:
     if not os.path.exists(path):
         return None
 
-    with open(path, "rb") as f:
-        file_hash = hashlib.sha256(f.read()).hexdigest()
-
-    return file_hash[:16]
+    return sha256_file(path)[:16]
 
 
 # ============================================================
@@ -123,21 +133,16 @@ def deduplicate_citations(citations: List[Dict]) -> List[Dict]:
     if not citations:
         return []
 
-    seen = set()
-    unique = []
+    # First citation per key wins; dicts keep insertion order
+    unique = {}
 
     for c in citations:
-        key = (
-            c.get("doc_id"),
-            c.get("chunk_id"),
-            c.get("page_physical")
+        unique.setdefault(
+            (c.get("doc_id"), c.get("chunk_id"), c.get("page_physical")),
+            c
         )
 
-        if key not in seen:
-            seen.add(key)
-            unique.append(c)
-
-    return unique
+    return list(unique.values())
 
 
 # ============================================================
@@ -152,7 +157,7 @@ def strip_fake_citations(text: str) -> str:
     if not text:
         return ""
 
-    return re.sub(r'\[\d+\]', '', text)
+    return _FAKE_CITATION_RE.sub('', text)
 
 
 # ============================================================
@@ -174,27 +179,40 @@ def format_as_bullets(items: List[str]) -> str:
 # SAFE JSON SERIALIZER
 # ============================================================
 
-def safe_json(data: Dict) -> str:
+def safe_json(data: Dict, pretty: bool = False) -> str:
     """
-    Ensure safe JSON serialization.
+    Ensure safe JSON serialization (UTF-8, compact unless pretty=True).
     """
 
-    return json.dumps(
-        data,
-        ensure_ascii=False,
-        indent=4
-    )
+    if _HAS_ORJSON:
+        return orjson.dumps(
+            data,
+            option=(orjson.OPT_INDENT_2 if pretty else 0) | orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+
+    if pretty:
+        return json.dumps(data, ensure_ascii=False, indent=2)
+
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
 
 
 # ============================================================
 # REMOVE EMPTY FIELDS
 # ============================================================
 
-def remove_none_fields(data: Dict) -> Dict:
+def remove_none_fields(data: Dict, inplace: bool = False) -> Dict:
     """
     Remove keys with None values.
+
+    inplace=True mutates and returns `data` (for dicts the caller owns),
+    avoiding a copy per response.
     """
 
+    if inplace:
+        for k in [k for k, v in data.items() if v is None]:
+            del data[k]
+        return data
+
     return {
         k: v for k, v in data.items()
         if v is not None
@@ -210,11 +228,4 @@ def has_valid_context(results: List[Dict]) -> bool:
     Check if retrieved results contain usable text.
     """
 
-    if not results:
-        return False
-
-    for r in results:
-        if r.get("text"):
-            return True
-
-    return False
\ No newline at end of file
+    return bool(results) and any(r.get("text") for r in results)
\ No newline at end of file
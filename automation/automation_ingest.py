@@ -1,17 +1,25 @@
 import os
-import subprocess
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from openpyxl import Workbook
 
+# Run pipelines in-process: the embedding model, Chroma client and Neo4j
+# driver are loaded once and shared by every PDF.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pipelines.full_ingestion_pipeline import FullIngestionPipeline  # noqa: E402
+
 # ------------------------------------------------------------------
 # CONFIGURATION
 # ------------------------------------------------------------------
 
 PROJECT_ROOT = Path(r"C:\Users\Harish\Downloads\Smart Medirag")
 DATA_FOLDER = PROJECT_ROOT / "data"
-VENV_PYTHON = PROJECT_ROOT / ".venv" / "Scripts" / "python.exe"
-MODULE_NAME = "pipelines.full_ingestion_pipeline"
+
+# Concurrent PDFs (PDF parsing, Ollama emotion calls and DB writes overlap)
+INGEST_WORKERS = int(os.getenv("INGEST_WORKERS", "4"))
 
 OUTPUT_EXCEL = PROJECT_ROOT / "ingestion_report.xlsx"
 
@@ -25,20 +33,12 @@ def run_pipeline(pdf_path: Path):
     print("=" * 90)
 
     try:
-        subprocess.run(
-            [
-                str(VENV_PYTHON),
-                "-m",
-                MODULE_NAME,
-                str(pdf_path)
-            ],
-            check=True
-        )
-        print("✅ Success\n")
+        FullIngestionPipeline(str(pdf_path)).run()
+        print(f"✅ Success: {pdf_path.name}\n")
         return 1  # Success
 
-    except subprocess.CalledProcessError:
-        print("❌ Failed\n")
+    except Exception as exc:
+        print(f"❌ Failed: {pdf_path.name} ({exc})\n")
         return 0  # Failure
 
 
@@ -49,10 +49,6 @@ def run_pipeline(pdf_path: Path):
 def main():
     print("\n🚀 INGESTION AUTOMATION STARTED\n")
 
-    if not VENV_PYTHON.exists():
-        print("❌ .venv Python not found!")
-        return
-
     pdf_files = list(DATA_FOLDER.glob("*.pdf"))
 
     if not pdf_files:
@@ -67,10 +63,17 @@ def main():
     # Header
     ws.append(["PDF Name", "Status (1=Success, 0=Fail)"])
 
-    for pdf in pdf_files:
-        status = run_pipeline(pdf)
+    start_time = time.time()
+    workers = max(1, min(INGEST_WORKERS, len(pdf_files)))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        statuses = list(pool.map(run_pipeline, pdf_files))
+
+    for pdf, status in zip(pdf_files, statuses):
         ws.append([pdf.name, status])
 
+    print(f"⏱ {len(pdf_files)} PDFs in {round(time.time() - start_time, 2)}s ({workers} workers)")
+
     wb.save(OUTPUT_EXCEL)
 
     print("=" * 90)
@@ -11,9 +11,15 @@ Usage:
     from config.system_loader import get_database_config
 """
 
+import copy
 import os
+from functools import lru_cache
+
 import yaml
 
+# libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # -------------------------------------------------
 # Base Config Path
 # -------------------------------------------------
@@ -21,14 +27,20 @@ import yaml
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
-def _load_yaml(filename: str):
+@lru_cache(maxsize=None)
+def _parse_yaml(filename: str):
     path = os.path.join(BASE_DIR, filename)
 
     if not os.path.exists(path):
         raise FileNotFoundError(f"Config file not found: {path}")
 
     with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+def _load_yaml(filename: str):
+    # Parsed once per process; callers get their own copy to mutate
+    return copy.deepcopy(_parse_yaml(filename))
 
 
 # -------------------------------------------------
@@ -14,8 +14,21 @@ This file DOES NOT depend on vector DB or Neo4j.
 
 import sys
 import json
+from operator import itemgetter
 from pprint import pprint
-from typing import List, Dict
+from typing import Dict, Iterable, Iterator, List, Optional
+
+# Try optional dependency for native JSON serialization.
+try:
+    import orjson  # type: ignore
+    _HAS_ORJSON = True
+except Exception:
+    _HAS_ORJSON = False
+
+from core.utils.logging_utils import get_component_logger
+
+
+logger = get_component_logger("TextAccumulator", component="ingestion")
 
 # ---------------- CONFIG ----------------
 MAX_CHUNK_SIZE = 1500
@@ -30,11 +43,12 @@ class TextAccumulator:
     # =====================================================
 
     def __init__(self):
-        print("[TEXT ACCUMULATOR] Initialized")
+        logger.debug("TextAccumulator initialized")
 
         self.current_heading = None
         self.current_subheading = None
-        self.buffer = ""
+        self.buffer = []
+        self._buffer_len = 0
         self.start_page = None
         self.chunks = []
 
@@ -42,30 +56,60 @@ class TextAccumulator:
     # PIPELINE ENTRY (Used by ChunkOrchestrator)
     # =====================================================
 
-    def run(self, styled_blocks: List[Dict]) -> List[Dict]:
+    def run(self, styled_blocks: Iterable[Dict]) -> List[Dict]:
 
-        print("\n" + "=" * 70)
-        print("TEXT ACCUMULATION STARTED")
-        print("=" * 70)
+        logger.info("Text accumulation started")
 
-        # Reset state (important for reuse)
-        self.current_heading = None
-        self.current_subheading = None
-        self.buffer = ""
-        self.start_page = None
-        self.chunks = []
+        self._reset()
 
         for unit in styled_blocks:
             self.add_unit(unit)
 
         result = self.finalize()
 
-        print("=" * 70)
-        print("TEXT ACCUMULATION COMPLETED")
-        print("=" * 70 + "\n")
+        logger.info("Text accumulation completed (%d chunks)", len(result))
 
         return result
 
+    def run_iter(self, styled_blocks: Iterable[Dict]) -> Iterator[Dict]:
+        """
+        Streaming run(): yields each overlapped chunk as soon as its
+        successor exists, holding at most the buffer plus two chunks.
+
+        Chunks come out in document order; run() additionally sorts by
+        page, which is the same order when units arrive page by page
+        (as StyleDetector produces them).
+        """
+
+        logger.info("Text accumulation started (streaming)")
+
+        self._reset()
+
+        prev_text = None
+        emitted = 0
+
+        for unit in styled_blocks:
+            self.add_unit(unit)
+
+            while len(self.chunks) >= 2:
+                chunk = self.chunks.pop(0)
+                text = chunk["text"]
+                yield self._emit_with_overlap(prev_text, chunk, self.chunks[0]["text"])
+                prev_text = text
+                emitted += 1
+
+        self.flush()
+
+        while self.chunks:
+            chunk = self.chunks.pop(0)
+            text = chunk["text"]
+            next_text = self.chunks[0]["text"] if self.chunks else None
+            yield self._emit_with_overlap(prev_text, chunk, next_text)
+            prev_text = text
+            emitted += 1
+
+        logger.info("Text accumulation completed (%d chunks)", emitted)
+
     # =====================================================
     # STEP 1: Add text unit
     # =====================================================
@@ -86,7 +130,8 @@ class TextAccumulator:
             self.current_heading = text
             self.current_subheading = None
             self.start_page = page
-            self.buffer = text + "\n"
+            self.buffer = [text, "\n"]
+            self._buffer_len = len(text) + 1
 
         # New subheading resets body accumulation
         elif unit_type == "subheading":
@@ -94,7 +139,9 @@ class TextAccumulator:
             self.flush()
             self.current_subheading = text
             self.start_page = page
-            self.buffer = self._compose_prefix() + text + "\n"
+            prefix = self._compose_prefix()
+            self.buffer = [prefix, text, "\n"]
+            self._buffer_len = len(prefix) + len(text) + 1
 
         # Body text accumulates
         else:
@@ -102,10 +149,12 @@ class TextAccumulator:
             if self.start_page is None:
                 self.start_page = page
 
-            self.buffer += text + "\n"
+            self.buffer.append(text)
+            self.buffer.append("\n")
+            self._buffer_len += len(text) + 1
 
-        # Check size
-        if len(self.buffer) >= MAX_CHUNK_SIZE:
+        # Check size (tracked length; the buffer is only joined on flush)
+        if self._buffer_len >= MAX_CHUNK_SIZE:
             self.flush()
 
     # =====================================================
@@ -114,47 +163,54 @@ class TextAccumulator:
 
     def flush(self):
 
-        if not self.buffer.strip():
+        joined = "".join(self.buffer).strip()
+
+        self.buffer = []
+        self._buffer_len = 0
+
+        if not joined:
             return
 
         chunk = {
             "chapter": self.current_heading,
             "subheading": self.current_subheading,
-            "page_physical": self.start_page,
+            # 0 for unpaged text: stores expect an int, sort needs no fallback
+            "page_physical": self.start_page if self.start_page is not None else 0,
             "page_label": None,  # Can be injected later if offset applied
-            "text": self.buffer.strip()
+            "text": joined
         }
 
         self.chunks.append(chunk)
 
-        self.buffer = ""
-
     # =====================================================
     # STEP 3: Apply overlap
     # =====================================================
 
     def apply_overlap(self):
 
-        overlapped = []
+        # Bind original texts once; chunks are owned, so rewrite in place
+        texts = [chunk["text"] for chunk in self.chunks]
+        last = len(texts) - 1
 
         for i, chunk in enumerate(self.chunks):
+            self._emit_with_overlap(
+                texts[i - 1] if i > 0 else None,
+                chunk,
+                texts[i + 1] if i < last else None
+            )
 
-            text = chunk["text"]
-
-            if i > 0:
-                prev = self.chunks[i - 1]["text"]
-                text = prev[-PRE_OVERLAP:] + "\n" + text
-
-            if i < len(self.chunks) - 1:
-                nxt = self.chunks[i + 1]["text"]
-                text = text + "\n" + nxt[:POST_OVERLAP]
+    @staticmethod
+    def _emit_with_overlap(prev_text: Optional[str], chunk: Dict, next_text: Optional[str]) -> Dict:
 
-            new_chunk = dict(chunk)
-            new_chunk["text"] = text
+        parts = []
+        if prev_text is not None:
+            parts += (prev_text[-PRE_OVERLAP:], "\n")
+        parts.append(chunk["text"])
+        if next_text is not None:
+            parts += ("\n", next_text[:POST_OVERLAP])
 
-            overlapped.append(new_chunk)
-
-        self.chunks = overlapped
+        chunk["text"] = "".join(parts)
+        return chunk
 
     # =====================================================
     # STEP 4: Finalize
@@ -165,7 +221,7 @@ class TextAccumulator:
         self.flush()
 
         # Sort by physical page
-        self.chunks.sort(key=lambda x: x["page_physical"] or 0)
+        self.chunks.sort(key=itemgetter("page_physical"))
 
         self.apply_overlap()
 
@@ -175,6 +231,16 @@ class TextAccumulator:
     # INTERNAL
     # =====================================================
 
+    def _reset(self):
+
+        # Reset state (important for reuse)
+        self.current_heading = None
+        self.current_subheading = None
+        self.buffer = []
+        self._buffer_len = 0
+        self.start_page = None
+        self.chunks = []
+
     def _compose_prefix(self):
 
         prefix = ""
@@ -189,6 +255,20 @@ class TextAccumulator:
 # STANDALONE RUNNER
 # ============================================================
 
+def _write_json(path: str, data) -> None:
+    """
+    Pretty-print `data` to `path` as UTF-8 (orjson when installed).
+    """
+
+    if _HAS_ORJSON:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
 def main():
 
     if len(sys.argv) < 2:
@@ -203,7 +283,8 @@ def main():
     print("=" * 100)
 
     try:
-        units = json.load(open(input_file, "r", encoding="utf-8"))
+        with open(input_file, "r", encoding="utf-8") as f:
+            units = json.load(f)
     except Exception as e:
         print(f"[ERROR] Failed to load input JSON: {e}")
         sys.exit(1)
@@ -213,11 +294,7 @@ def main():
 
     pprint(chunks, width=130)
 
-    json.dump(
-        chunks,
-        open("chunks_accumulated.json", "w", encoding="utf-8"),
-        indent=2
-    )
+    _write_json("chunks_accumulated.json", chunks)
 
     print("\n[OUTPUT] Saved to chunks_accumulated.json")
     print("=" * 100)
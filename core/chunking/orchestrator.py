@@ -8,6 +8,7 @@ Connects:
 - Validation
 """
 
+import os
 import uuid
 from core.chunking.style_detector import StyleDetector
 from core.chunking.accumulator import TextAccumulator
@@ -16,6 +17,20 @@ from core.chunking.validator import PipelineValidator
 from config.system_loader import get_system_config
 
 
+# uuid4 ids drawn per os.urandom call
+CHUNK_ID_BLOCK = 256
+
+
+def _chunk_ids(block: int = CHUNK_ID_BLOCK):
+    """
+    Endless RFC 4122 uuid4 strings, one urandom syscall per `block` ids.
+    """
+    while True:
+        rnd = os.urandom(16 * block)
+        for i in range(0, len(rnd), 16):
+            yield str(uuid.UUID(bytes=rnd[i:i + 16], version=4))
+
+
 class ChunkOrchestrator:
 
     def __init__(self, pdf_path, toc_data=None):
@@ -54,31 +69,34 @@ class ChunkOrchestrator:
         # STEP 2 — Accumulate hierarchical chunks
         # -----------------------------------------
 
-        chunks = self.accumulator.run(styled_blocks)
-
-        print(f"[CHUNK ORCH] Accumulated chunks: {len(chunks)}")
+        # Steps 2-4 are pipelined: each chunk is overlapped and validated
+        # as soon as its successor exists, so no intermediate lists.
+        chunks = self.accumulator.run_iter(styled_blocks)
 
         # -----------------------------------------
         # STEP 3 — Apply overlap
         # -----------------------------------------
 
         if self.config["overlap"]["enabled"]:
-            chunks = self.overlapper.apply(chunks)
-
-        print(f"[CHUNK ORCH] After overlap: {len(chunks)}")
+            chunks = self.overlapper.apply_iter(chunks)
 
         # -----------------------------------------
         # STEP 4 — Validate chunks
         # -----------------------------------------
 
         valid_chunks = []
+        total_chunks = 0
+        chunk_ids = _chunk_ids()
 
         for chunk in chunks:
 
+            total_chunks += 1
+
             if self.validator.is_valid(chunk):
-                chunk["chunk_id"] = str(uuid.uuid4())
+                chunk["chunk_id"] = next(chunk_ids)
                 valid_chunks.append(chunk)
 
+        print(f"[CHUNK ORCH] Accumulated chunks: {total_chunks}")
         print(f"[CHUNK ORCH] Valid chunks: {len(valid_chunks)}")
 
         print("=" * 70)
@@ -4,7 +4,7 @@ Overlapper Module (Standalone)
 Purpose:
 - Apply pre-overlap and post-overlap to text chunks
 - Preserve chunk metadata
-- Verbose printing for debugging & verification
+- Standalone runnable for verification
 
 Expected input:
 A JSON file containing a list of chunks like:
@@ -24,7 +24,19 @@ This file CAN be run independently.
 import sys
 import json
 from pprint import pprint
-from typing import List, Dict
+from typing import Dict, Iterable, Iterator, List, Optional
+
+# Try optional dependency for native JSON serialization.
+try:
+    import orjson  # type: ignore
+    _HAS_ORJSON = True
+except Exception:
+    _HAS_ORJSON = False
+
+from core.utils.logging_utils import get_component_logger
+
+
+logger = get_component_logger("ChunkOverlapper", component="ingestion")
 
 # ---------------- CONFIG ----------------
 PRE_OVERLAP = 300
@@ -34,84 +46,69 @@ POST_OVERLAP = 300
 class ChunkOverlapper:
 
     def __init__(self):
-        print("[OVERLAP] Initialized")
+        logger.debug("ChunkOverlapper initialized")
 
     def apply(self, chunks: list) -> list:
 
         if not chunks:
             return []
 
-        overlapped = []
-
-        for i, chunk in enumerate(chunks):
-
-            new_chunk = chunk.copy()
-
-            # Pre overlap
-            if i > 0:
-                prev_text = chunks[i - 1]["text"]
-                new_chunk["text"] = prev_text[-300:] + " " + new_chunk["text"]
+        overlapped = list(self.apply_iter(chunks))
 
-            # Post overlap
-            if i < len(chunks) - 1:
-                next_text = chunks[i + 1]["text"]
-                new_chunk["text"] += " " + next_text[:300]
-
-            overlapped.append(new_chunk)
+        logger.info("Overlap applied to %d chunks", len(overlapped))
 
         return overlapped
 
-    # -------------------------------------------------
-    # STEP 1: Apply overlap
-    # -------------------------------------------------
-    def apply_overlap(self):
-        print("\n[STEP 1] Applying pre and post overlap...")
-        print(f"[CONFIG] PRE_OVERLAP  = {PRE_OVERLAP}")
-        print(f"[CONFIG] POST_OVERLAP = {POST_OVERLAP}")
+    def apply_iter(self, chunks: Iterable[Dict]) -> Iterator[Dict]:
+        """
+        Streaming apply(): one-chunk lookahead, inputs are not modified.
+        """
 
-        for idx, chunk in enumerate(self.chunks):
-            print("\n" + "-" * 80)
-            print(f"[PROCESSING CHUNK] Index: {idx}")
+        prev_text = None
+        current = None
 
-            base_text = chunk.get("text", "")
-            new_text = base_text
+        for nxt in chunks:
+            if current is not None:
+                yield self._overlapped(prev_text, current, nxt["text"])
+                prev_text = current["text"]
+            current = nxt
 
-            print(f"[ORIGINAL SIZE] {len(base_text)} characters")
+        if current is not None:
+            yield self._overlapped(prev_text, current, None)
 
-            # -------- PRE-OVERLAP --------
-            if idx > 0:
-                prev_text = self.chunks[idx - 1].get("text", "")
-                pre = prev_text[-PRE_OVERLAP:]
-                new_text = pre + "\n" + new_text
-                print(f"[PRE-OVERLAP] Added {len(pre)} characters")
+    @staticmethod
+    def _overlapped(prev_text: Optional[str], chunk: Dict, next_text: Optional[str]) -> Dict:
 
-            # -------- POST-OVERLAP --------
-            if idx < len(self.chunks) - 1:
-                next_text = self.chunks[idx + 1].get("text", "")
-                post = next_text[:POST_OVERLAP]
-                new_text = new_text + "\n" + post
-                print(f"[POST-OVERLAP] Added {len(post)} characters")
+        # One join per chunk: [pre-overlap " "] body [" " post-overlap]
+        parts = []
+        if prev_text is not None:
+            parts += (prev_text[-PRE_OVERLAP:], " ")
+        parts.append(chunk["text"])
+        if next_text is not None:
+            parts += (" ", next_text[:POST_OVERLAP])
 
-            print(f"[FINAL SIZE] {len(new_text)} characters")
+        new_chunk = chunk.copy()
+        new_chunk["text"] = "".join(parts)
+        return new_chunk
 
-            overlapped_chunk = dict(chunk)
-            overlapped_chunk["text"] = new_text
-            overlapped_chunk["overlap"] = {
-                "pre": PRE_OVERLAP if idx > 0 else 0,
-                "post": POST_OVERLAP if idx < len(self.chunks) - 1 else 0
-            }
 
-            self.overlapped_chunks.append(overlapped_chunk)
+# ============================================================
+# STANDALONE RUNNER
+# ============================================================
+def _write_json(path: str, data) -> None:
+    """
+    Pretty-print `data` to `path` as UTF-8 (orjson when installed).
+    """
 
-        print("\n[STEP 2] Overlap application completed")
-        print(f"[INFO] Total chunks processed: {len(self.overlapped_chunks)}")
+    if _HAS_ORJSON:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
 
-        return self.overlapped_chunks
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
 
 
-# ============================================================
-# STANDALONE RUNNER
-# ============================================================
 def main():
     if len(sys.argv) < 2:
         print("Usage:")
@@ -136,15 +133,14 @@ def main():
 
     print(f"[INFO] Chunks loaded: {len(chunks)}")
 
-    overlapper = ChunkOverlapper(chunks)
-    overlapped_chunks = overlapper.apply_overlap()
+    overlapper = ChunkOverlapper()
+    overlapped_chunks = overlapper.apply(chunks)
 
     print("\n[FINAL OVERLAPPED CHUNKS]")
     pprint(overlapped_chunks, width=130)
 
     output_file = "chunks_overlapped.json"
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(overlapped_chunks, f, indent=2)
+    _write_json(output_file, overlapped_chunks)
 
     print("\n[OUTPUT]")
     print(f"Overlapped chunks saved to: {output_file}")
@@ -10,7 +10,7 @@ Usage:
     from core.graph import GraphOrchestrator
 """
 
-from .store import GraphStore
+from .store import GraphStore, get_graph_store
 from .validator import GraphValidator
 from .orchestrator import GraphOrchestrator
 from .schema import (
@@ -26,6 +26,7 @@ from .schema import (
 
 __all__ = [
     "GraphStore",
+    "get_graph_store",
     "GraphValidator",
     "GraphOrchestrator",
     "DOCUMENT",
@@ -5,7 +5,7 @@ Smart Medirag — Optimized Graph Orchestrator
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from core.graph.store import GraphStore
+from core.graph.store import get_graph_store
 from core.graph.validator import GraphValidator
 from core.graph.emotion_extractor import EmotionExtractor
 from core.utils.logging_utils import get_component_logger
@@ -35,7 +35,7 @@ class GraphOrchestrator:
             self.max_workers = max_workers
             self.batch_size = batch_size
 
-            self.store = GraphStore()
+            self.store = get_graph_store()
             self.validator = GraphValidator(self.store)
             self.emotion_extractor = EmotionExtractor()
 
@@ -194,7 +194,5 @@ class GraphOrchestrator:
     # =====================================================
 
     def close(self):
-        try:
-            self.store.close()
-        except Exception:
-            logger.exception("Failed closing GraphStore connection")
+        # The shared GraphStore driver stays open for the process lifetime
+        logger.debug("GraphOrchestrator released shared GraphStore")
@@ -14,8 +14,12 @@ Features:
 Author: Smart Medirag System
 """
 
+import atexit
+import threading
+
 from neo4j import GraphDatabase
 from config.system_loader import get_database_config
+from core.utils.logging_utils import get_component_logger
 from core.graph.schema import (
     CREATE_CONSTRAINTS,
     CREATE_INDEXES,
@@ -39,6 +43,13 @@ from core.graph.schema import (
 )
 
 
+# =====================================================
+# LOGGER SETUP
+# =====================================================
+
+logger = get_component_logger("GraphStore", component="retrieval")
+
+
 class GraphStore:
 
     # =====================================================
@@ -55,7 +66,7 @@ class GraphStore:
         self.password = conn["password"]
         self.database = conn["database"]
 
-        print("\n[GRAPH STORE] Connecting to Neo4j...")
+        logger.info("Connecting to Neo4j...")
 
         self.driver = GraphDatabase.driver(
             self.uri,
@@ -66,7 +77,7 @@ class GraphStore:
         self._create_constraints()
         self._create_indexes()
 
-        print("[GRAPH STORE] Connected successfully\n")
+        logger.info("Connected successfully")
 
     # =====================================================
     # CREATE CONSTRAINTS
@@ -74,13 +85,13 @@ class GraphStore:
 
     def _create_constraints(self):
 
-        print("[GRAPH STORE] Creating constraints (if not exists)...")
+        logger.info("Creating constraints (if not exists)...")
 
         with self.driver.session(database=self.database) as session:
             for query in CREATE_CONSTRAINTS:
                 session.run(query)
 
-        print("[GRAPH STORE] Constraints verified\n")
+        logger.info("Constraints verified")
 
     # =====================================================
     # CREATE INDEXES
@@ -88,13 +99,13 @@ class GraphStore:
 
     def _create_indexes(self):
 
-        print("[GRAPH STORE] Creating indexes (if not exists)...")
+        logger.info("Creating indexes (if not exists)...")
 
         with self.driver.session(database=self.database) as session:
             for query in CREATE_INDEXES:
                 session.run(query)
 
-        print("[GRAPH STORE] Indexes verified\n")
+        logger.info("Indexes verified")
 
     # =====================================================
     # BATCH INGESTION (FULLY CORRECTED)
@@ -147,7 +158,7 @@ class GraphStore:
                 })
 
         except Exception as e:
-            print("[GRAPH STORE] Batch ingestion failed:", e)
+            logger.error("Batch ingestion failed: %s", e)
             raise
 
     # =====================================================
@@ -172,7 +183,7 @@ class GraphStore:
                 session.run(query, {"links": links})
 
         except Exception as e:
-            print("[GRAPH STORE] Batch link failed:", e)
+            logger.error("Batch link failed: %s", e)
             raise
 
     # =====================================================
@@ -209,7 +220,7 @@ class GraphStore:
                 return [record.data() for record in result]
 
         except Exception as e:
-            print("[GRAPH STORE] Query failed:", e)
+            logger.error("Query failed: %s", e)
             return []
 
     # =====================================================
@@ -279,4 +290,25 @@ class GraphStore:
 
     def close(self):
         self.driver.close()
-        print("[GRAPH STORE] Connection closed")
+        logger.info("Connection closed")
+
+
+# =====================================================
+# SHARED INSTANCE (one driver + schema check per process)
+# =====================================================
+
+_graph_store_instance = None
+_graph_store_lock = threading.Lock()
+
+
+def get_graph_store() -> GraphStore:
+    """
+    Process-wide GraphStore; closed at interpreter exit, not by callers.
+    """
+    global _graph_store_instance
+    if _graph_store_instance is None:
+        with _graph_store_lock:
+            if _graph_store_instance is None:
+                _graph_store_instance = GraphStore()
+                atexit.register(_graph_store_instance.close)
+    return _graph_store_instance
@@ -0,0 +1,23 @@
+"""
+SmartChunk-RAG — Shared Model Loaders
+
+Provides:
+- OnnxSentenceEmbedder     → int8 ONNX Runtime drop-in for SentenceTransformer.encode
+- get_sentence_transformer → process-wide SentenceTransformer per (model, device)
+- get_embedder             → query embedder for the answering layer
+- get_embedder_model_id    → which model get_embedder() loaded (FP32 name or onnx:<dir>)
+- get_embedding_batcher    → coalesces concurrent single-query encodes
+"""
+
+from .onnx_embedder import OnnxSentenceEmbedder
+from .embedder import get_embedder, get_embedder_model_id, get_sentence_transformer
+from .embedding_batcher import EmbeddingBatcher, get_embedding_batcher
+
+__all__ = [
+    "EmbeddingBatcher",
+    "OnnxSentenceEmbedder",
+    "get_embedder",
+    "get_embedder_model_id",
+    "get_embedding_batcher",
+    "get_sentence_transformer",
+]
@@ -0,0 +1,118 @@
+"""
+SmartChunk-RAG — Shared Sentence Embedder
+
+One SentenceTransformer per (model, device) per process, shared by the
+intent router and the vector embedder instead of each loading its own
+copy of all-MiniLM-L6-v2.
+
+Usage:
+    from core.models.embedder import get_embedder, get_sentence_transformer
+
+    router_embedder = get_embedder()                      # ONNX int8 if configured
+    model = get_sentence_transformer("all-MiniLM-L6-v2")  # FP32 SentenceTransformer
+"""
+
+import os
+import threading
+from typing import Dict, Tuple
+
+import torch
+from sentence_transformers import SentenceTransformer
+
+from core.models.onnx_embedder import OnnxSentenceEmbedder
+from core.utils.logging_utils import get_component_logger
+
+
+logger = get_component_logger("SharedEmbedder", component="answering")
+
+DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+# Directory produced by `python -m core.models.onnx_embedder <dir>`; when it
+# exists, queries are encoded with the int8 ONNX model instead of FP32 torch.
+ONNX_EMBEDDER_DIR = os.getenv("INTENT_EMBEDDER_ONNX_DIR", "models/minilm_onnx")
+
+# Torch CPU threading for the FP32 model (intra-op = cores, no inter-op pool)
+EMBED_THREADS = int(os.getenv("EMBED_THREADS", str(os.cpu_count() or 4)))
+
+# Half precision for CUDA-resident models (CPU fp16 kernels are slower)
+EMBED_FP16 = os.getenv("EMBED_FP16", "0") == "1"
+
+
+# ============================================================
+# Lazy Singletons (LOAD ONLY ONCE)
+# ============================================================
+
+_models: Dict[Tuple[str, str], SentenceTransformer] = {}
+_models_lock = threading.Lock()
+_embedder_instance = None
+_embedder_model_id = None
+_torch_configured = False
+
+
+def _configure_torch_threads() -> None:
+    global _torch_configured
+    if _torch_configured:
+        return
+    _torch_configured = True
+
+    torch.set_num_threads(EMBED_THREADS)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Only settable before the first parallel op in the process
+        logger.debug("Torch inter-op threads already initialized; leaving as is")
+
+
+def get_sentence_transformer(model_name: str = DEFAULT_EMBEDDING_MODEL, device: str = "cpu") -> SentenceTransformer:
+    key = (model_name, device)
+    model = _models.get(key)
+    if model is None:
+        with _models_lock:
+            model = _models.get(key)
+            if model is None:
+                logger.info("Loading SentenceTransformer model (%s, %s)...", model_name, device)
+                _configure_torch_threads()
+                model = SentenceTransformer(model_name, device=device).eval()
+                if EMBED_FP16 and device.startswith("cuda"):
+                    model = model.half()
+                _models[key] = model
+                logger.info("Embedding model loaded successfully.")
+    return model
+
+
+def get_embedder():
+    """
+    Query embedder for the intent router and query caches: the int8 ONNX
+    model when ONNX_EMBEDDER_DIR exists, otherwise the shared FP32 model.
+
+    Its vectors are not in the Chroma index space unless
+    get_embedder_model_id() matches the configured embedding model.
+    """
+    global _embedder_instance, _embedder_model_id
+    if _embedder_instance is None:
+        if ONNX_EMBEDDER_DIR and os.path.isdir(ONNX_EMBEDDER_DIR):
+            try:
+                logger.info("Loading int8 ONNX embedder from %s...", ONNX_EMBEDDER_DIR)
+                _embedder_instance = OnnxSentenceEmbedder(ONNX_EMBEDDER_DIR)
+                _embedder_model_id = f"onnx:{ONNX_EMBEDDER_DIR}"
+                logger.info("ONNX embedding model loaded successfully.")
+                return _embedder_instance
+            except Exception:
+                logger.exception("ONNX embedder unavailable — falling back to SentenceTransformer")
+
+        try:
+            _embedder_instance = get_sentence_transformer()
+            _embedder_model_id = DEFAULT_EMBEDDING_MODEL
+        except Exception:
+            logger.exception("Failed to load SentenceTransformer model")
+            raise
+    return _embedder_instance
+
+
+def get_embedder_model_id() -> str:
+    """
+    Identity of the model behind get_embedder(): the FP32 model name, or
+    "onnx:<dir>" for the quantized export.
+    """
+    get_embedder()
+    return _embedder_model_id
@@ -0,0 +1,124 @@
+"""
+SmartChunk-RAG — Query Embedding Micro-Batcher
+
+Concurrent requests each embed a single query; the model is far more
+efficient at batch 16-64 than at 1. Queries arriving within a short
+window are coalesced into one encode() call on a background thread and
+handed back to their callers through futures.
+
+Usage:
+    from core.models.embedding_batcher import get_embedding_batcher
+
+    batcher = get_embedding_batcher()        # None when disabled
+    embedding = batcher.encode_one("dose of metformin")
+"""
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Optional
+
+import numpy as np
+
+from core.models.embedder import get_embedder
+from core.utils.logging_utils import get_component_logger
+
+
+logger = get_component_logger("EmbeddingBatcher", component="answering")
+
+# Largest coalesced batch, and how long the first query waits for company
+# (EMBED_BATCH_WAIT_MS=0 disables batching entirely)
+EMBED_BATCH_MAX = int(os.getenv("EMBED_BATCH_MAX", "32"))
+EMBED_BATCH_WAIT_MS = float(os.getenv("EMBED_BATCH_WAIT_MS", "10"))
+
+
+class EmbeddingBatcher:
+
+    def __init__(self, encoder, max_batch: int = EMBED_BATCH_MAX, max_wait_ms: float = EMBED_BATCH_WAIT_MS):
+        self._encoder = encoder
+        self._max_batch = max(1, max_batch)
+        self._max_wait = max_wait_ms / 1000.0
+        self._queue: "queue.Queue" = queue.Queue()
+
+        self._worker = threading.Thread(
+            target=self._run,
+            name="embedding-batcher",
+            daemon=True
+        )
+        self._worker.start()
+
+    def encode_one(self, text: str) -> np.ndarray:
+        """
+        Normalized float32 embedding of `text`; blocks until its batch is encoded.
+        """
+        future: Future = Future()
+        self._queue.put((text, future))
+        return future.result()
+
+    # ============================================================
+    # WORKER
+    # ============================================================
+
+    def _next_batch(self) -> list:
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self._max_wait
+
+        while len(batch) < self._max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            texts = [text for text, _ in batch]
+
+            try:
+                embeddings = self._encoder.encode(
+                    texts,
+                    batch_size=len(texts),
+                    normalize_embeddings=True,
+                    convert_to_numpy=True,
+                    show_progress_bar=False
+                )
+            except Exception as exc:
+                logger.exception("Batched query embedding failed (batch=%d)", len(texts))
+                for _, future in batch:
+                    future.set_exception(exc)
+                continue
+
+            if len(texts) > 1:
+                logger.debug("Embedded %d coalesced queries", len(texts))
+
+            for (_, future), embedding in zip(batch, embeddings):
+                future.set_result(np.array(embedding, dtype=np.float32))
+
+
+# ============================================================
+# Lazy Singleton
+# ============================================================
+
+_batcher_instance: Optional[EmbeddingBatcher] = None
+_batcher_lock = threading.Lock()
+
+
+def get_embedding_batcher() -> Optional[EmbeddingBatcher]:
+    """
+    Process-wide batcher over get_embedder(), or None when disabled.
+    """
+    global _batcher_instance
+    if EMBED_BATCH_WAIT_MS <= 0:
+        return None
+    if _batcher_instance is None:
+        with _batcher_lock:
+            if _batcher_instance is None:
+                _batcher_instance = EmbeddingBatcher(get_embedder())
+    return _batcher_instance
@@ -0,0 +1,157 @@
+"""
+SmartChunk-RAG — ONNX Sentence Embedder (int8)
+
+Runs all-MiniLM-L6-v2 through ONNX Runtime with dynamic int8 weight
+quantization, exposing the subset of SentenceTransformer.encode used
+by the answering layer (mean pooling + optional L2 normalization).
+
+One-shot export (requires `optimum[exporters]`):
+
+    python -m core.models.onnx_embedder models/minilm_onnx
+
+This writes `model.onnx`, the fused `model_optimized.onnx`, the
+quantized `model_int8.onnx` and the tokenizer files into the output
+directory. The backend is picked up from `models/minilm_onnx` when that
+directory exists, or from INTENT_EMBEDDER_ONNX_DIR.
+"""
+
+import os
+import sys
+from typing import List, Optional, Union
+
+import numpy as np
+
+
+DEFAULT_MODEL_ID = "sentence-transformers/all-MiniLM-L6-v2"
+OPTIMIZED_MODEL_FILE = "model_optimized.onnx"
+QUANTIZED_MODEL_FILE = "model_int8.onnx"
+
+# Intra-op threads for the session; 0 lets onnxruntime pick
+ONNX_INTRA_OP_THREADS = int(os.getenv("ONNX_INTRA_OP_THREADS", str(os.cpu_count() or 0)))
+
+
+class OnnxSentenceEmbedder:
+    """
+    Minimal SentenceTransformer-compatible encoder backed by onnxruntime.
+    """
+
+    def __init__(
+        self,
+        model_dir: str,
+        model_file: str = QUANTIZED_MODEL_FILE,
+        max_length: int = 256,
+        intra_op_num_threads: Optional[int] = None
+    ):
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        model_path = os.path.join(model_dir, model_file)
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(f"ONNX model not found: {model_path}")
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = (
+            ONNX_INTRA_OP_THREADS if intra_op_num_threads is None else intra_op_num_threads
+        )
+
+        self.session = ort.InferenceSession(
+            model_path,
+            sess_options=options,
+            providers=["CPUExecutionProvider"]
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.max_length = max_length
+        self._input_names = [i.name for i in self.session.get_inputs()]
+
+    def encode(
+        self,
+        sentences: Union[str, List[str]],
+        batch_size: int = 32,
+        normalize_embeddings: bool = False,
+        convert_to_numpy: bool = True,
+        show_progress_bar: bool = False,
+        **kwargs
+    ) -> np.ndarray:
+
+        single_input = isinstance(sentences, str)
+        if single_input:
+            sentences = [sentences]
+
+        batches = []
+
+        for start in range(0, len(sentences), batch_size):
+            tokens = self.tokenizer(
+                list(sentences[start:start + batch_size]),
+                padding=True,
+                truncation=True,
+                max_length=self.max_length,
+                return_tensors="np"
+            )
+
+            feeds = {}
+            for name in self._input_names:
+                if name in tokens:
+                    feeds[name] = tokens[name].astype(np.int64)
+                elif name == "token_type_ids":
+                    feeds[name] = np.zeros_like(tokens["input_ids"], dtype=np.int64)
+
+            hidden = self.session.run(None, feeds)[0]
+
+            # Mean pooling over real (non-padding) tokens
+            mask = tokens["attention_mask"][..., None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            batches.append(pooled)
+
+        embeddings = np.concatenate(batches, axis=0).astype(np.float32)
+
+        if normalize_embeddings:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings /= np.clip(norms, 1e-12, None)
+
+        if single_input:
+            return embeddings[0]
+
+        return embeddings
+
+
+# ============================================================
+# ONE-SHOT EXPORT + QUANTIZATION
+# ============================================================
+
+def export_quantized_model(output_dir: str, model_id: str = DEFAULT_MODEL_ID) -> str:
+    from optimum.exporters.onnx import main_export
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from onnxruntime.transformers.optimizer import optimize_model
+
+    main_export(model_id, output=output_dir, task="feature-extraction")
+
+    # Offline BERT fusions (attention, LayerNorm, GELU) before quantizing;
+    # num_heads/hidden_size of 0 are read from the graph.
+    optimized_path = os.path.join(output_dir, OPTIMIZED_MODEL_FILE)
+    optimized = optimize_model(
+        os.path.join(output_dir, "model.onnx"),
+        model_type="bert",
+        num_heads=0,
+        hidden_size=0,
+        opt_level=99
+    )
+    optimized.save_model_to_file(optimized_path)
+
+    quantized_path = os.path.join(output_dir, QUANTIZED_MODEL_FILE)
+    quantize_dynamic(
+        optimized_path,
+        quantized_path,
+        weight_type=QuantType.QInt8
+    )
+
+    return quantized_path
+
+
+if __name__ == "__main__":
+
+    if len(sys.argv) < 2:
+        print("Usage: python -m core.models.onnx_embedder <output_dir>")
+        sys.exit(1)
+
+    print(f"Quantized model written to: {export_quantized_model(sys.argv[1])}")
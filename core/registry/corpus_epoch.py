@@ -0,0 +1,93 @@
+"""
+SmartChunk-RAG — Corpus Epoch
+
+Epoch token that changes whenever the indexed corpus changes (ingestion
+completed, document deleted). Caches holding retrieval results compare
+against it to drop stale entries.
+
+The token is shared across processes through a marker file next to the
+metadata store: bump_corpus_epoch() atomically replaces the file, and
+get_corpus_epoch() re-stats it at most every CORPUS_EPOCH_CHECK_SECONDS.
+Every gunicorn worker and the automation ingest process therefore see
+each other's bumps; bumps made in this process are visible immediately.
+"""
+
+import os
+import threading
+import time
+from typing import Hashable, Optional
+
+from config.system_loader import get_database_config
+from core.utils.logging_utils import get_component_logger
+
+
+logger = get_component_logger("CorpusEpoch", component="ingestion")
+
+CORPUS_EPOCH_CHECK_SECONDS = float(os.getenv("CORPUS_EPOCH_CHECK_SECONDS", "1.0"))
+CORPUS_EPOCH_FILENAME = "corpus_epoch"
+
+
+_local_epoch = 0
+_shared_token: Optional[Hashable] = None
+_checked_at: Optional[float] = None
+_epoch_path: Optional[str] = None
+_epoch_lock = threading.Lock()
+
+
+def _get_epoch_path() -> str:
+    global _epoch_path
+    if _epoch_path is None:
+        try:
+            metadata_path = get_database_config().get("metadata_store", {}).get("path")
+            folder = os.path.dirname(os.path.abspath(metadata_path))
+        except Exception:
+            logger.exception("Metadata store path unavailable; corpus epoch file goes to ./data")
+            folder = os.path.abspath("data")
+        _epoch_path = os.path.join(folder, CORPUS_EPOCH_FILENAME)
+    return _epoch_path
+
+
+def _read_shared_token() -> Optional[Hashable]:
+    try:
+        st = os.stat(_get_epoch_path())
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def get_corpus_epoch() -> Hashable:
+    """
+    Opaque token; two equal tokens mean the corpus has not changed.
+    """
+    global _shared_token, _checked_at
+
+    now = time.monotonic()
+    if _checked_at is None or now - _checked_at >= CORPUS_EPOCH_CHECK_SECONDS:
+        with _epoch_lock:
+            if _checked_at is None or now - _checked_at >= CORPUS_EPOCH_CHECK_SECONDS:
+                _shared_token = _read_shared_token()
+                _checked_at = now
+
+    return (_local_epoch, _shared_token)
+
+
+def bump_corpus_epoch() -> Hashable:
+    global _local_epoch, _shared_token, _checked_at
+
+    with _epoch_lock:
+        _local_epoch += 1
+
+        path = _get_epoch_path()
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(f"{time.time_ns()} {os.getpid()}\n")
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.exception("Could not publish corpus epoch to %s; other processes keep stale caches", path)
+
+        _shared_token = _read_shared_token()
+        _checked_at = time.monotonic()
+
+        return (_local_epoch, _shared_token)
@@ -0,0 +1,32 @@
+"""
+SmartChunk-RAG — File Hashing
+
+SHA-256 of a file without reading it into memory: the file is mmapped so
+the kernel pages it in on demand and hashlib works on a zero-copy view.
+
+Usage:
+    from core.utils.file_hash import sha256_file
+
+    doc_id = sha256_file(pdf_path)[:16]
+"""
+
+import hashlib
+import mmap
+
+
+def sha256_file(path: str) -> str:
+    """
+    Hex SHA-256 digest of the file at `path`.
+    """
+
+    with open(path, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.sha256(mm).hexdigest()
+        except (ValueError, OSError):
+            # Empty or non-mappable file: stream it in 1 MiB blocks
+            f.seek(0)
+            digest = hashlib.sha256()
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+            return digest.hexdigest()
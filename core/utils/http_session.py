@@ -0,0 +1,101 @@
+"""
+SmartChunk-RAG — Shared HTTP Session
+
+Provides a process-wide requests.Session with a pooled adapter so
+Ollama calls reuse keep-alive connections instead of reconnecting
+on every request, plus an httpx.AsyncClient for coroutine callers.
+
+Usage:
+    from core.utils.http_session import get_http_session
+
+    response = get_http_session().post(url, json=payload, timeout=120)
+
+    client = get_async_http_client()
+    response = await client.post(url, json=payload)
+"""
+
+import asyncio
+import os
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# =====================================================
+# POOL CONFIGURATION
+# =====================================================
+
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "10"))
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "20"))
+HTTP_CONNECT_RETRIES = int(os.getenv("HTTP_CONNECT_RETRIES", "2"))
+
+
+# =====================================================
+# LAZY SINGLETON SESSION (ONE PER PROCESS)
+# =====================================================
+
+_session_instance: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    # Only connection failures are retried: a POST that reached Ollama
+    # must not be replayed.
+    retry = Retry(
+        total=HTTP_CONNECT_RETRIES,
+        connect=HTTP_CONNECT_RETRIES,
+        read=0,
+        status=0,
+        backoff_factor=0.2,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_http_session() -> requests.Session:
+    global _session_instance
+    if _session_instance is None:
+        with _session_lock:
+            if _session_instance is None:
+                _session_instance = _build_session()
+    return _session_instance
+
+
+# =====================================================
+# ASYNC CLIENT (ONE PER EVENT LOOP)
+# =====================================================
+
+# httpx pools are bound to the loop that opened them, so the client is
+# rebuilt when called from a different running loop.
+_async_client_instance = None
+_async_client_loop = None
+
+
+def get_async_http_client():
+    global _async_client_instance, _async_client_loop
+
+    import httpx
+
+    loop = asyncio.get_running_loop()
+    if _async_client_instance is None or _async_client_loop is not loop:
+        _async_client_instance = httpx.AsyncClient(
+            timeout=120,
+            limits=httpx.Limits(
+                max_connections=HTTP_POOL_MAXSIZE,
+                max_keepalive_connections=HTTP_POOL_MAXSIZE,
+            ),
+            transport=httpx.AsyncHTTPTransport(retries=HTTP_CONNECT_RETRIES),
+        )
+        _async_client_loop = loop
+    return _async_client_instance
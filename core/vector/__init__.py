@@ -32,7 +32,7 @@ Author: SmartChunk-RAG System
 # -------------------------------------------------
 
 from .embedder import VectorEmbedder
-from .store import ChromaStore
+from .store import ChromaStore, get_chroma_store
 from .validator import VectorChunkValidator
 from .orchestrator import VectorOrchestrator
 
@@ -44,6 +44,7 @@ from .orchestrator import VectorOrchestrator
 __all__ = [
     "VectorEmbedder",
     "ChromaStore",
+    "get_chroma_store",
     "VectorChunkValidator",
     "VectorOrchestrator",
 ]
@@ -17,7 +17,7 @@ Author: SmartChunk-RAG System
 """
 
 from typing import List
-from sentence_transformers import SentenceTransformer
+from core.models.embedder import get_sentence_transformer
 from config.system_loader import get_model_config
 
 
@@ -40,6 +40,10 @@ class VectorEmbedder:
         self.device = embedding_cfg.get("device", "cpu")
         self.normalize = embedding_cfg.get("normalize", True)
 
+        # (model, normalized): vectors from another encoder are only
+        # interchangeable with ours when this matches
+        self.signature = (self.model_name, bool(self.normalize))
+
         print(f"[CONFIG] Enabled    : {self.enabled}")
         print(f"[CONFIG] Model      : {self.model_name}")
         print(f"[CONFIG] Device     : {self.device}")
@@ -48,10 +52,12 @@ class VectorEmbedder:
         if not self.enabled:
             print("[VECTOR EMBEDDER] Embedding disabled in config")
             self.model = None
+            self.dimension = None
             return
 
         try:
-            self.model = SentenceTransformer(
+            # Shared with the intent router: one copy per (model, device)
+            self.model = get_sentence_transformer(
                 self.model_name,
                 device=self.device
             )
@@ -60,6 +66,11 @@ class VectorEmbedder:
             print("[VECTOR EMBEDDER] ERROR loading model:", e)
             self.model = None
 
+        self.dimension = (
+            self.model.get_sentence_embedding_dimension()
+            if self.model is not None else None
+        )
+
         print("=" * 70)
 
     # -------------------------------------------------
@@ -17,15 +17,15 @@ Config Sources:
 Author: SmartChunk-RAG System
 """
 
-import hashlib
 from typing import List, Dict
 import os
 from PyPDF2 import PdfReader
 
 from core.vector.embedder import VectorEmbedder
-from core.vector.store import ChromaStore
+from core.vector.store import get_chroma_store
 from core.vector.validator import VectorChunkValidator
 from core.registry.document_registry import DocumentRegistry
+from core.utils.file_hash import sha256_file
 
 from config.system_loader import (
     get_database_config,
@@ -52,7 +52,7 @@ class VectorOrchestrator:
 
         # Initialize components
         self.embedder = VectorEmbedder()
-        self.store = ChromaStore()
+        self.store = get_chroma_store()
         self.validator = VectorChunkValidator()
 
         # Deterministic document ID
@@ -80,10 +80,7 @@ class VectorOrchestrator:
 
     def generate_document_id(self, path: str) -> str:
 
-        with open(path, "rb") as f:
-            file_hash = hashlib.sha256(f.read()).hexdigest()
-
-        return file_hash[:16]
+        return sha256_file(path)[:16]
 
     # -------------------------------------------------
     # Ingest Chunks
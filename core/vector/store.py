@@ -23,17 +23,25 @@ from config.system_loader import (
     get_database_config,
     get_system_config
 )
+from core.utils.logging_utils import get_component_logger
 
 import os
+import threading
 
 
+# =====================================================
+# LOGGER SETUP
+# =====================================================
+
+logger = get_component_logger("ChromaStore", component="retrieval")
+
 
 class ChromaStore:
 
     def __init__(self):
 
-        print("=" * 70)
-        print("[VECTOR STORE] Initializing...")
+        logger.info("=" * 70)
+        logger.info("Initializing...")
 
         db_config = get_database_config()
         system_config = get_system_config()
@@ -52,14 +60,14 @@ class ChromaStore:
         # Normalize path safely for Windows
         self.persist_path = os.path.abspath(self.persist_path)
 
-        print(f"[CONFIG] Enabled         : {self.enabled}")
-        print(f"[CONFIG] Persist         : {self.persist}")
-        print(f"[CONFIG] Persist Path    : {self.persist_path}")
-        print(f"[CONFIG] Collection Name : {self.collection_name}")
-        print(f"[CONFIG] Distance Metric : {self.distance_metric}")
+        logger.info(f"Enabled         : {self.enabled}")
+        logger.info(f"Persist         : {self.persist}")
+        logger.info(f"Persist Path    : {self.persist_path}")
+        logger.info(f"Collection Name : {self.collection_name}")
+        logger.info(f"Distance Metric : {self.distance_metric}")
 
         if not self.enabled:
-            print("[VECTOR STORE] Disabled via config")
+            logger.warning("Disabled via config")
             self.client = None
             self.collection = None
             return
@@ -74,19 +82,19 @@ class ChromaStore:
                 metadata={"hnsw:space": self.distance_metric}
             )
 
-            print("[VECTOR STORE] Collection ready")
+            logger.info("Collection ready")
 
         except Exception as e:
-            print("[VECTOR STORE] Initialization error:", e)
+            logger.error("Initialization error: %s", e)
 
             if not self.fail_soft:
                 raise e
 
-            print("[VECTOR STORE] Fail-soft enabled — store unavailable")
+            logger.warning("Fail-soft enabled — store unavailable")
             self.client = None
             self.collection = None
 
-        print("=" * 70)
+        logger.info("=" * 70)
 
     # -------------------------------------------------
     # Upsert Vectors
@@ -95,11 +103,11 @@ class ChromaStore:
     def upsert(self, ids, embeddings, documents, metadatas):
 
         if not self.enabled or self.collection is None:
-            print("[VECTOR STORE] Skipped upsert — store disabled")
+            logger.warning("Skipped upsert — store disabled")
             return
 
         try:
-            print(f"[VECTOR STORE] Upserting {len(ids)} vectors")
+            logger.info(f"Upserting {len(ids)} vectors")
 
             self.collection.upsert(
                 ids=ids,
@@ -108,15 +116,15 @@ class ChromaStore:
                 metadatas=metadatas
             )
 
-            print("[VECTOR STORE] Upsert completed")
+            logger.info("Upsert completed")
 
         except Exception as e:
-            print("[VECTOR STORE] Upsert failed:", e)
+            logger.error("Upsert failed: %s", e)
 
             if not self.fail_soft:
                 raise e
 
-            print("[VECTOR STORE] Fail-soft enabled — continuing")
+            logger.warning("Fail-soft enabled — continuing")
 
     # -------------------------------------------------
     # Delete by Document ID
@@ -125,25 +133,25 @@ class ChromaStore:
     def delete_document(self, doc_id: str):
 
         if not self.enabled or self.collection is None:
-            print("[VECTOR STORE] Skipped delete — store disabled")
+            logger.warning("Skipped delete — store disabled")
             return
 
         try:
-            print(f"[VECTOR STORE] Deleting vectors for doc_id={doc_id}")
+            logger.info(f"Deleting vectors for doc_id={doc_id}")
 
             self.collection.delete(
                 where={"doc_id": doc_id}
             )
 
-            print("[VECTOR STORE] Deletion completed")
+            logger.info("Deletion completed")
 
         except Exception as e:
-            print("[VECTOR STORE] Delete failed:", e)
+            logger.error("Delete failed: %s", e)
 
             if not self.fail_soft:
                 raise e
 
-            print("[VECTOR STORE] Fail-soft enabled — continuing")
+            logger.warning("Fail-soft enabled — continuing")
 
     # -------------------------------------------------
     # Query
@@ -152,11 +160,11 @@ class ChromaStore:
     def query(self, query_embedding, top_k=5):
 
         if not self.enabled or self.collection is None:
-            print("[VECTOR STORE] Query skipped — store disabled")
+            logger.warning("Query skipped — store disabled")
             return None
 
         try:
-            print(f"[VECTOR STORE] Running similarity search (top_k={top_k})")
+            logger.debug("Running similarity search (top_k=%d)", top_k)
 
             results = self.collection.query(
                 query_embeddings=[query_embedding],
@@ -166,10 +174,27 @@ class ChromaStore:
             return results
 
         except Exception as e:
-            print("[VECTOR STORE] Query failed:", e)
+            logger.error("Query failed: %s", e)
 
             if not self.fail_soft:
                 raise e
 
-            print("[VECTOR STORE] Fail-soft enabled — returning None")
-            return None
\ No newline at end of file
+            logger.warning("Fail-soft enabled — returning None")
+            return None
+
+
+# =====================================================
+# SHARED INSTANCE
+# =====================================================
+
+_chroma_store_instance = None
+_chroma_store_lock = threading.Lock()
+
+
+def get_chroma_store() -> ChromaStore:
+    global _chroma_store_instance
+    if _chroma_store_instance is None:
+        with _chroma_store_lock:
+            if _chroma_store_instance is None:
+                _chroma_store_instance = ChromaStore()
+    return _chroma_store_instance
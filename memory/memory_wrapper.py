@@ -3,11 +3,11 @@ SmartChunk-RAG — Memory Wrapper
 """
 
 import uuid
-from typing import Dict, Optional
-import requests
+from typing import Dict, Iterator, Optional
 
 from memory.memory_service import MemoryService
 from answering.answering_agent import AnsweringAgent
+from core.utils.http_session import get_http_session
 from core.utils.logging_utils import get_component_logger
 
 
@@ -52,39 +52,112 @@ class MemoryWrappedAnsweringAgent:
             return {"response": "", "citations": []}
 
         try:
-            # --------------------------------------------
-            # Resolve Thread
-            # --------------------------------------------
+            thread_id, enriched_query, early_result = self._prepare_query(user_id, query, thread_id)
 
-            thread_id = self._resolve_thread(user_id, thread_id)
+            if early_result is not None:
+                return early_result
 
             # --------------------------------------------
-            # Classify Query Type (LLM)
+            # Call Pure RAG Agent
             # --------------------------------------------
 
-            query_type = self._classify_query_type(query)
-            logger.info(f"Query classified as: {query_type}")
+            result = self.agent.answer(
+                query=enriched_query,       # used for prompt
+                retrieval_query=query       # ONLY clean user question
+            )
 
-            # --------------------------------------------
-            # Routing Logic
-            # --------------------------------------------
+            self._persist_turn(user_id, thread_id, query, result)
+
+            result["thread_id"] = thread_id
+            result["user_id"] = user_id
+
+            return result
+
+        except Exception:
+            logger.exception("Error inside memory wrapper")
+            return {"response": "", "citations": []}
+
+    def answer_stream(
+        self,
+        user_id: str,
+        query: str,
+        thread_id: Optional[str] = None
+    ) -> Iterator[Dict]:
+        """
+        Streaming variant of answer(): relays the base agent's token and
+        citations events, then a final event carrying thread_id/user_id.
+        """
+
+        if not user_id:
+            raise ValueError("user_id is required")
+
+        if not query or not query.strip():
+            yield {"type": "final", "response": "", "citations": []}
+            return
+
+        try:
+            thread_id, enriched_query, early_result = self._prepare_query(user_id, query, thread_id)
+
+            if early_result is not None:
+                yield {"type": "final", **early_result}
+                return
 
-            if query_type == "transformation":
+            for event in self.agent.answer_stream(query=enriched_query, retrieval_query=query):
 
-                last_answer = self.memory.get_last_assistant_response(
-                    user_id=user_id,
-                    thread_id=thread_id
-                )
+                if event.get("type") == "final":
+                    self._persist_turn(user_id, thread_id, query, event)
+                    event["thread_id"] = thread_id
+                    event["user_id"] = user_id
 
-                if not last_answer:
-                    return {
-                        "response": "No previous response available to transform.",
-                        "citations": [],
-                        "thread_id": thread_id,
-                        "user_id": user_id
-                    }
+                yield event
 
-                enriched_query = f"""
+        except Exception:
+            logger.exception("Error inside memory wrapper stream")
+            yield {"type": "final", "response": "", "citations": []}
+
+    # ============================================================
+    # QUERY PREPARATION / STM PERSISTENCE
+    # ============================================================
+
+    def _prepare_query(self, user_id: str, query: str, thread_id: Optional[str]):
+        """
+        Returns (thread_id, enriched_query, early_result); early_result is
+        set when the turn can be answered without the RAG agent.
+        """
+
+        # --------------------------------------------
+        # Resolve Thread
+        # --------------------------------------------
+
+        thread_id = self._resolve_thread(user_id, thread_id)
+
+        # --------------------------------------------
+        # Classify Query Type (LLM)
+        # --------------------------------------------
+
+        query_type = self._classify_query_type(query)
+        logger.info(f"Query classified as: {query_type}")
+
+        # --------------------------------------------
+        # Routing Logic
+        # --------------------------------------------
+
+        if query_type == "transformation":
+
+            last_answer = self.memory.get_last_assistant_response(
+                user_id=user_id,
+                thread_id=thread_id
+            )
+
+            if not last_answer:
+                return thread_id, None, {
+                    "response": "No previous response available to transform.",
+                    "citations": [],
+                    "thread_id": thread_id,
+                    "user_id": user_id
+                }
+
+            enriched_query = f"""
 Previous Answer:
 {last_answer}
 
@@ -92,49 +165,33 @@ Instruction:
 {query}
 """
 
-            else:
-                enriched_query = self._inject_memory(
-                    query=query,
-                    user_id=user_id,
-                    thread_id=thread_id
-                )
-
-            # --------------------------------------------
-            # Call Pure RAG Agent
-            # --------------------------------------------
-
-            result = self.agent.answer(
-                query=enriched_query,       # used for prompt
-                retrieval_query=query       # ONLY clean user question
+        else:
+            enriched_query = self._inject_memory(
+                query=query,
+                user_id=user_id,
+                thread_id=thread_id
             )
 
-            # --------------------------------------------
-            # Persist STM
-            # --------------------------------------------
+        return thread_id, enriched_query, None
 
-            if result.get("response"):
-                self.memory.append_stm(
-                    user_id=user_id,
-                    thread_id=thread_id,
-                    role="user",
-                    content=query
-                )
-
-                self.memory.append_stm(
-                    user_id=user_id,
-                    thread_id=thread_id,
-                    role="assistant",
-                    content=result["response"]
-                )
+    def _persist_turn(self, user_id: str, thread_id: str, query: str, result: Dict) -> None:
 
-            result["thread_id"] = thread_id
-            result["user_id"] = user_id
+        if not result.get("response"):
+            return
 
-            return result
+        self.memory.append_stm(
+            user_id=user_id,
+            thread_id=thread_id,
+            role="user",
+            content=query
+        )
 
-        except Exception:
-            logger.exception("Error inside memory wrapper")
-            return {"response": "", "citations": []}
+        self.memory.append_stm(
+            user_id=user_id,
+            thread_id=thread_id,
+            role="assistant",
+            content=result["response"]
+        )
 
     # ============================================================
     # THREAD MANAGEMENT
@@ -239,7 +296,7 @@ transformation:
         }
 
         try:
-            response = requests.post(OLLAMA_URL, json=payload, timeout=30)
+            response = get_http_session().post(OLLAMA_URL, json=payload, timeout=30)
 
             if response.status_code != 200:
                 return "knowledge"
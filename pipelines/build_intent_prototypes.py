@@ -0,0 +1,42 @@
+"""
+Precompute IntentRouter prototype embeddings.
+
+Writes proto_matrix.npy (float32, L2-normalized) and proto_intents.json
+(row → intent plus an md5 of the prototype strings) so the router can
+mmap them at startup instead of encoding on every boot. Re-run after
+editing INTENT_PROTOTYPES; a stale file is ignored automatically.
+
+Usage:
+    python -m pipelines.build_intent_prototypes [output_dir]
+"""
+
+import sys
+
+from answering.intent_router import (
+    INTENT_PROTOTYPES,
+    PROTOTYPE_CACHE_DIR,
+    encode_prototypes,
+    prototype_fingerprint,
+    save_prototype_cache,
+)
+from core.models.embedder import get_embedder
+from core.utils.logging_utils import get_component_logger
+
+
+# =====================================================
+# LOGGER SETUP
+# =====================================================
+
+logger = get_component_logger("PrototypeBuilder", component="answering")
+
+
+def main(output_dir: str = PROTOTYPE_CACHE_DIR):
+
+    matrix, intents = encode_prototypes(get_embedder(), INTENT_PROTOTYPES)
+    save_prototype_cache(output_dir, matrix, intents, prototype_fingerprint(INTENT_PROTOTYPES))
+
+    logger.info("Wrote %d prototype embeddings (dim=%d) to %s", matrix.shape[0], matrix.shape[1], output_dir)
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
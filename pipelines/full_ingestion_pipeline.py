@@ -2,6 +2,8 @@
 SMART MEDIRAG — FULL INGESTION PIPELINE
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 # -------------------------------
 # CORE MODULES
 # -------------------------------
@@ -14,6 +16,7 @@ from core.vector.orchestrator import VectorOrchestrator
 from core.graph.orchestrator import GraphOrchestrator
 
 from config.system_loader import get_system_config
+from core.registry.corpus_epoch import bump_corpus_epoch
 from core.utils.logging_utils import get_component_logger
 
 
@@ -185,9 +188,15 @@ class FullIngestionPipeline:
 
             chunks = self.clean_chunks(chunks)
 
-            self.store_vector(chunks)
+            # Chroma and Neo4j are independent backends: write both at once
+            with ThreadPoolExecutor(max_workers=2, thread_name_prefix="ingest-store") as executor:
+                vector_future = executor.submit(self.store_vector, chunks)
+                graph_future = executor.submit(self.store_graph, chunks)
+                vector_future.result()
+                graph_future.result()
 
-            self.store_graph(chunks)
+            # Corpus changed: drop cached retrieval results in this process.
+            bump_corpus_epoch()
 
             logger.info("\n" + "=" * 100)
             logger.info("FULL INGESTION COMPLETED SUCCESSFULLY")
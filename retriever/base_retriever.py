@@ -59,7 +59,8 @@ class BaseRetriever(ABC):
         self,
         query: str,
         top_k: int = 15,
-        filters: Optional[Dict] = None
+        filters: Optional[Dict] = None,
+        query_embedding=None
     ) -> List[Dict]:
 
         if not query:
@@ -68,7 +69,7 @@ class BaseRetriever(ABC):
         try:
 
             # Raw retrieval
-            results = self._retrieve_internal(query, top_k, filters)
+            results = self._retrieve_internal(query, top_k, filters, query_embedding)
 
             if not results:
                 return []
@@ -106,12 +107,15 @@ class BaseRetriever(ABC):
     # INTERNAL RETRIEVE (Child must implement)
     # =====================================================
 
+    # query_embedding: optional precomputed (normalized) embedding of
+    # `query`; retrievers that do not embed may ignore it.
     @abstractmethod
     def _retrieve_internal(
         self,
         query: str,
         top_k: int,
-        filters: Optional[Dict]
+        filters: Optional[Dict],
+        query_embedding=None
     ) -> List[Dict]:
         pass
 
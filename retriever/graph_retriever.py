@@ -8,7 +8,7 @@ import re
 import spacy
 
 from retriever.base_retriever import BaseRetriever
-from core.graph.store import GraphStore
+from core.graph.store import get_graph_store
 from core.graph.emotion_extractor import EmotionExtractor
 from config.system_loader import get_system_config
 from core.utils.logging_utils import get_component_logger
@@ -30,7 +30,7 @@ class GraphRetriever(BaseRetriever):
     def __init__(self):
         super().__init__()
 
-        self.store = GraphStore()
+        self.store = get_graph_store()
         self.emotion_extractor = EmotionExtractor()
         self.nlp = spacy.load(
             "en_core_web_sm",
@@ -58,7 +58,8 @@ class GraphRetriever(BaseRetriever):
     self,
     query: str,
     top_k: int,
-    filters: Optional[Dict]
+    filters: Optional[Dict],
+    query_embedding=None
 ) -> List[Dict]:
 
         try:
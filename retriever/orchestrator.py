@@ -45,6 +45,14 @@ class RetrieverOrchestrator:
             logger.exception("Failed to initialize RetrieverOrchestrator")
             raise
 
+    def accepts_query_embedding(self, signature) -> bool:
+        """
+        True when vectors described by `signature` (model, normalized)
+        live in the same space as the Chroma index.
+        """
+        embedder = getattr(self.vector_retriever, "embedder", None)
+        return embedder is not None and tuple(signature) == embedder.signature
+
     # =====================================================
     # MAIN RETRIEVE ENTRY (SINGLE VERSION)
     # =====================================================
@@ -55,7 +63,8 @@ class RetrieverOrchestrator:
         mode: str = "hybrid",
         top_k: int = 8,
         initial_k: int = 15,
-        filters: Optional[Dict] = None
+        filters: Optional[Dict] = None,
+        query_embedding=None
     ) -> List[Dict]:
 
         try:
@@ -74,7 +83,8 @@ class RetrieverOrchestrator:
 
             if mode == "vector":
                 candidates = self.vector_retriever.retrieve(
-                    query, top_k=initial_k, filters=filters
+                    query, top_k=initial_k, filters=filters,
+                    query_embedding=query_embedding
                 )
                 logger.info(
                     "Vector candidates: %d | preview=%s",
@@ -94,7 +104,7 @@ class RetrieverOrchestrator:
 
             else:
                 candidates = self._hybrid_retrieve(
-                    query, initial_k, filters
+                    query, initial_k, filters, query_embedding
                 )
                 logger.info(
                     "Hybrid candidates: %d | preview=%s",
@@ -157,7 +167,8 @@ class RetrieverOrchestrator:
         self,
         query: str,
         initial_k: int,
-        filters: Optional[Dict]
+        filters: Optional[Dict],
+        query_embedding=None
     ) -> List[Dict]:
 
         try:
@@ -165,7 +176,8 @@ class RetrieverOrchestrator:
             vector_results = self.vector_retriever.retrieve(
                 query,
                 top_k=initial_k,
-                filters=filters
+                filters=filters,
+                query_embedding=query_embedding
             )
 
             graph_keyword = self.graph_retriever.retrieve(
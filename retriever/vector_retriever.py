@@ -7,7 +7,7 @@ import hashlib
 
 from retriever.base_retriever import BaseRetriever
 from core.vector.embedder import VectorEmbedder
-from core.vector.store import ChromaStore
+from core.vector.store import get_chroma_store
 from config.system_loader import get_database_config
 from core.utils.logging_utils import get_component_logger
 
@@ -35,7 +35,7 @@ class VectorRetriever(BaseRetriever):
 
         try:
             self.embedder = VectorEmbedder()
-            self.store = ChromaStore()
+            self.store = get_chroma_store()
 
             db_config = get_database_config()
             vector_cfg = db_config.get("vector_db", {})
@@ -64,12 +64,24 @@ class VectorRetriever(BaseRetriever):
         self,
         query: str,
         top_k: int,
-        filters: Optional[Dict]
+        filters: Optional[Dict],
+        query_embedding=None
     ) -> List[Dict]:
 
         try:
-            # Embed query
-            query_embedding = self.embedder.embed_one(query)
+            # Reuse the caller's vector only if it fits the index model;
+            # callers check the model via accepts_query_embedding()
+            if query_embedding is not None and len(query_embedding) != self.embedder.dimension:
+                logger.warning(
+                    "Supplied query embedding has dim %d, index model %s expects %s; re-encoding",
+                    len(query_embedding),
+                    self.embedder.model_name,
+                    self.embedder.dimension
+                )
+                query_embedding = None
+
+            if query_embedding is None:
+                query_embedding = self.embedder.embed_one(query)
 
             # Query vector store
             raw_results = self.store.query(
@@ -202,7 +214,8 @@ class VectorRetriever(BaseRetriever):
         self,
         query: str,
         top_k: int = 15,
-        filters: Optional[Dict] = None
+        filters: Optional[Dict] = None,
+        query_embedding=None
     ) -> List[Dict]:
 
         if not query:
@@ -221,7 +234,7 @@ class VectorRetriever(BaseRetriever):
                 if cache_key in self._local_cache:
                     return self._local_cache[cache_key]
 
-                results = super().retrieve(query, top_k, filters)
+                results = super().retrieve(query, top_k, filters, query_embedding)
 
                 if len(self._local_cache) >= self.cache_size:
                     self._local_cache.pop(next(iter(self._local_cache)))
@@ -229,7 +242,7 @@ class VectorRetriever(BaseRetriever):
                 self._local_cache[cache_key] = results
                 return results
 
-            return super().retrieve(query, top_k, filters)
+            return super().retrieve(query, top_k, filters, query_embedding)
 
         except Exception:
             logger.exception("VectorRetriever retrieve() failed")